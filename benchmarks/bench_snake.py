@@ -0,0 +1,73 @@
+"""
+Snake adım maliyetinin yılan uzunluğuyla değişimini ölçer
+
+Kullanım:
+    python -m benchmarks.bench_snake
+"""
+import time
+from array import array
+from src.ai.scripted import cycle_tables
+from src.game.game_state import GameState, GameSnapshot, pack_cell, unpack_cell
+from src.game.snake import Direction, DIRECTION_INDEX
+from src.game.zobrist import ZOBRIST
+from src.game.constants import GRID_WIDTH, GRID_HEIGHT
+
+
+def make_state(length, cycle):
+    """
+    Döngü üzerinde uzanan, verilen uzunlukta bir yılanla oyun oluşturur
+    Durum anlık görüntüden kurulur; Zobrist anahtarı ve boş hücre indeksi tutarlıdır
+    """
+    body = [unpack_cell(cell) for cell in reversed(cycle[:length])]
+    direction = Direction((body[0][0] - body[1][0], body[0][1] - body[1][1]))
+    snapshot = GameSnapshot(
+        body=array('H', [pack_cell(cell) for cell in body]).tobytes(),
+        direction=DIRECTION_INDEX[direction],
+        food=cycle[length],  # Yılanın önündeki ilk boş hücre
+        score=length - 3,
+        game_over=False,
+        won=False,
+        collision_type=0,
+        collision_point=pack_cell(None)
+    )
+    return GameState.from_snapshot(snapshot)
+
+
+def bench_length(length, steps=20000):
+    """
+    Verilen uzunluktaki yılan için adım başına süreyi (mikrosaniye) ölçer
+    Her adımda Trainer'daki gibi üç tehlike kontrolü ve bir hareket yapılır
+    """
+    cycle, order = cycle_tables(GRID_WIDTH, GRID_HEIGHT)
+    game_state = make_state(length, cycle)
+    snake = game_state.snake
+    assert game_state.key() == ZOBRIST.hash(game_state)
+    assert len(game_state.free_cells) == GRID_WIDTH * GRID_HEIGHT - length
+    directions = {d.value: d for d in Direction}
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        head = snake.get_head()
+        nxt = unpack_cell(cycle[(order[pack_cell(head)] + 1) % len(cycle)])
+        for d in (Direction.UP, Direction.LEFT, Direction.RIGHT):
+            snake.is_collision((head[0] + d.value[0], head[1] + d.value[1]))
+        snake.change_direction(directions[(nxt[0] - head[0], nxt[1] - head[1])])
+        if not snake.move():
+            raise RuntimeError("Benchmark yılanı çarpıştı")
+    elapsed = time.perf_counter() - start
+
+    # Hareketler anahtarı ve boş hücre indeksini tutarlı bıraktı
+    assert game_state.key() == ZOBRIST.hash(game_state)
+    assert len(game_state.free_cells) == GRID_WIDTH * GRID_HEIGHT - length
+    return elapsed / steps * 1e6
+
+
+def main():
+    max_length = GRID_WIDTH * GRID_HEIGHT - 1
+    print(f"{'length':>8} {'us/step':>10}")
+    for length in (3, 25, 50, 100, 200, max_length):
+        print(f"{length:>8} {bench_length(length):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Oyun motoru, deneyim belleği ve öğrenme adımı için benchmark paketi
+
+Her ölçüm çağrı başına mikrosaniye (us) olarak raporlanır; daha küçük değer daha hızlıdır.
+Sonuçlar JSON olarak yazılabilir ve daha önce kaydedilmiş bir temel ile karşılaştırılabilir.
+
+Kullanım:
+    python -m benchmarks.run                               # Tüm ölçümler
+    python -m benchmarks.run --output bench.json           # Sonuçları JSON olarak kaydet
+    python -m benchmarks.run --baseline bench.json         # Kayıtlı temele göre gerileme kontrolü
+    python -m benchmarks.run --filter memory --no-tf       # Sadece adı 'memory' içerenler, TF'siz
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from array import array
+import numpy as np
+
+from src.ai.features import encode_state
+from src.ai.grid_observer import GridObserver
+from src.ai.memory import ReplayMemory
+from src.ai.scripted import cycle_tables
+from src.game.constants import GRID_WIDTH, GRID_HEIGHT
+from src.game.game_state import GameState, GameSnapshot, COLLISION_TYPES
+from src.game.snake import DIRECTIONS, DIRECTION_INDEX
+from src.ui.renderer import NumpyRenderer
+from src.ui.video import GifWriter
+
+CELLS = GRID_WIDTH * GRID_HEIGHT
+DELTA_TO_DIRECTION = {direction.value: direction for direction in DIRECTIONS}
+
+
+def measure(fn, number, repeat=5):
+    """
+    fn'i number kez çalıştırır, repeat tekrarın en iyisini çağrı başına us olarak döndürür
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def cycle_game(length, seed=0):
+    """
+    Hamilton döngüsü üzerinde uzanan, verilen uzunlukta yılanlı bir oyun oluşturur
+    Returns:
+        (game_state, snapshot, hücre -> döngüde sonraki yön tablosu)
+    """
+    cycle, _ = cycle_tables(GRID_WIDTH, GRID_HEIGHT)
+    body = [cycle[i] for i in range(length - 1, -1, -1)]  # Kafadan kuyruğa
+    head, neck = body[0], body[1]
+    delta = (head % GRID_WIDTH - neck % GRID_WIDTH, head // GRID_WIDTH - neck // GRID_WIDTH)
+
+    game_state = GameState(seed=seed)
+    food = cycle[(length + CELLS) // 2 % CELLS] if length < CELLS else body[-1]
+    snapshot = GameSnapshot(
+        body=array('H', body).tobytes(), direction=DIRECTION_INDEX[DELTA_TO_DIRECTION[delta]],
+        food=food, score=0, game_over=False, won=False,
+        collision_type=COLLISION_TYPES.index(None), collision_point=0xFFFF)
+    game_state.restore(snapshot)
+
+    next_direction = {}
+    for i, cell in enumerate(cycle):
+        nxt = cycle[(i + 1) % CELLS]
+        delta = (nxt % GRID_WIDTH - cell % GRID_WIDTH, nxt // GRID_WIDTH - cell // GRID_WIDTH)
+        next_direction[(cell % GRID_WIDTH, cell // GRID_WIDTH)] = DELTA_TO_DIRECTION[delta]
+    return game_state, snapshot, next_direction
+
+
+def bench_game_update(quick):
+    """
+    GameState.update: döngüyü izleyen yılanla adım başına süre
+    """
+    results = {}
+    steps = 200 if quick else 1000
+    for length in (3, 50, 150, CELLS - 10):
+        game_state, snapshot, next_direction = cycle_game(length)
+
+        def run():
+            # Yem yendikçe yılan uzar; her turda ve tahta dolunca başlangıç uzunluğuna dönülür
+            game_state.restore(snapshot)
+            for _ in range(steps):
+                game_state.change_direction(next_direction[game_state.snake.body[0]])
+                if not game_state.update():
+                    if not game_state.won:
+                        raise RuntimeError("Benchmark yılanı çarpıştı")
+                    game_state.restore(snapshot)
+
+        results[f'game.update[length={length}]'] = measure(run, 1) / steps
+    return results
+
+
+def bench_food_spawn(quick):
+    """
+    Food.spawn: kalabalık tahtada yeni yem konumu seçimi
+    """
+    results = {}
+    number = 2000 if quick else 20000
+    for free in (150, 30, 3):
+        game_state, _, _ = cycle_game(CELLS - free)
+        food, snake = game_state.food, game_state.snake
+        results[f'food.spawn[free={free}]'] = measure(
+            lambda: food.spawn(snake.body, game_state.free_cells), number)
+    return results
+
+
+def bench_get_state(quick):
+    """
+    Trainer.get_state: durum vektörü (encode_state) ve grid gözlemi (GridObserver) üretimi
+    """
+    results = {}
+    number = 2000 if quick else 20000
+    game_state, _, _ = cycle_game(50)
+    for rays in (False, True):
+        results[f'trainer.get_state[rays={rays}]'] = measure(
+            lambda: encode_state(game_state, rays), number)
+    observer = GridObserver()
+    results['trainer.get_state[grid]'] = measure(lambda: observer.observe(game_state), number)
+    return results
+
+
+def bench_memory(quick):
+    """
+    ReplayMemory.add ve sample(64): farklı kapasitelerde
+    """
+    results = {}
+    rng = np.random.default_rng(0)
+    state = rng.random(11, dtype=np.float32)
+    next_state = rng.random(11, dtype=np.float32)
+    capacities = (10000, 100000) if quick else (10000, 100000, 1000000)
+    for capacity in capacities:
+        memory = ReplayMemory(capacity, seed=0)
+        # Belleği doldur: örnekleme tam dolu bir bellekte ölçülür
+        memory.add(state, 0, 0.0, next_state, False)
+        memory.states[:] = rng.random(memory.states.shape, dtype=np.float32)
+        memory.next_states[:] = memory.states
+        memory.size = capacity
+
+        results[f'memory.add[capacity={capacity}]'] = measure(
+            lambda: memory.add(state, 1, 1.0, next_state, False), 2000 if quick else 20000)
+        results[f'memory.sample[capacity={capacity},batch=64]'] = measure(
+            lambda: memory.sample(64), 500 if quick else 5000)
+    return results
+
+
+def bench_render(quick):
+    """
+    NumpyRenderer (RGB ve palet indeksli) ve GIF'e kare yazma
+    """
+    results = {}
+    number = 500 if quick else 5000
+    game_state, snapshot, next_direction = cycle_game(100)
+    snapshot = game_state.snapshot()
+    rgb = NumpyRenderer()
+    indexed = NumpyRenderer(indexed=True)
+    results['render.numpy[rgb]'] = measure(lambda: rgb.render_snapshot(snapshot), number)
+    results['render.numpy[indexed]'] = measure(lambda: indexed.render_snapshot(snapshot), number)
+
+    # Yılan döngüde ilerlerken her adımda bir kare yazılır (sadece değişen dikdörtgen)
+    height, width = indexed.frame.shape
+    with tempfile.TemporaryDirectory() as directory:
+        with GifWriter(os.path.join(directory, 'bench.gif'), width, height, indexed.palette) as gif:
+            def step():
+                game_state.change_direction(next_direction[game_state.snake.body[0]])
+                if not game_state.update():
+                    game_state.restore(snapshot)
+                gif.add_frame(indexed.render_snapshot(game_state.snapshot()))
+
+            results['video.gif_frame'] = measure(step, number // 5)
+    return results
+
+
+def bench_agent(quick):
+    """
+    DQNAgent.act (TensorFlow ve NumPy yolu) ve replay() gecikmesi
+    """
+    from src.ai.agent import DQNAgent
+    results = {}
+    agent = DQNAgent(11, 4, memory_size=10000)
+    agent.epsilon = 0.0  # Keşif yok: her çağrı ağı çalıştırır
+    rng = np.random.default_rng(0)
+    for _ in range(1000):
+        agent.remember(rng.random(11, dtype=np.float32), int(rng.integers(4)), 0.0,
+                       rng.random(11, dtype=np.float32), False)
+    state = rng.random(11, dtype=np.float32)
+
+    agent.act(state)  # Derleme ölçüme dahil edilmez
+    results['agent.act[tensorflow]'] = measure(lambda: agent.act(state), 200 if quick else 2000)
+    agent.use_numpy_inference()
+    results['agent.act[numpy]'] = measure(lambda: agent.act(state), 2000 if quick else 20000)
+
+    agent.replay()
+    results['agent.replay[batch=64]'] = measure(agent.replay, 50 if quick else 500)
+    return results
+
+
+BENCHMARKS = (
+    ('game', bench_game_update),
+    ('food', bench_food_spawn),
+    ('trainer', bench_get_state),
+    ('memory', bench_memory),
+    ('render', bench_render),
+    ('agent', bench_agent),
+)
+
+
+def compare(results, baseline, threshold):
+    """
+    Sonuçları temelle karşılaştırır ve tablo olarak yazar
+    Returns:
+        list: threshold oranından daha fazla yavaşlayan ölçümlerin adları
+    """
+    regressions = []
+    print(f"{'benchmark':<44} {'us':>10} {'baseline':>10} {'ratio':>7}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<44} {value:>10.2f} {'-':>10} {'-':>7}")
+            continue
+        ratio = value / base
+        flag = ' REGRESSION' if ratio > threshold else ''
+        print(f"{name:<44} {value:>10.2f} {base:>10.2f} {ratio:>7.2f}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Snake AI benchmark paketi")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası (sonra --baseline olarak kullanılabilir)")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Bu orandan fazla yavaşlayan ölçümler gerileme sayılır")
+    parser.add_argument("--filter", default="", help="Sadece adı bu metni içeren grupları çalıştır")
+    parser.add_argument("--quick", action="store_true", help="Daha az tekrarla hızlı çalıştır")
+    parser.add_argument("--no-tf", action="store_true", help="TensorFlow gerektiren ölçümleri atla")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = {}
+    for group, bench in BENCHMARKS:
+        if args.no_tf and group == 'agent':
+            continue
+        if args.filter and args.filter not in group:
+            continue
+        results.update(bench(args.quick))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+    else:
+        regressions = compare(results, {}, args.threshold)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'numpy': np.__version__,
+                    'machine': platform.machine(),
+                    'platform': platform.platform(),
+                    'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'quick': args.quick,
+                },
+                'unit': 'us',
+                'results': results,
+            }, f, indent=2)
+
+    if regressions:
+        print(f"{len(regressions)} ölçümde gerileme: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
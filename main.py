@@ -1,12 +1,18 @@
 from src.ui.menu import Menu
+import argparse
 import pygame
 
 def main():
     """
     Oyunu başlatan ana fonksiyon
     """
+    parser = argparse.ArgumentParser(description="Snake oyunu")
+    parser.add_argument("--record", default=None,
+                        help="İnsan oyunlarının ekleneceği episode kaydı (çevrimdışı eğitim için)")
+    args = parser.parse_args()
+
     try:
-        menu = Menu()
+        menu = Menu(record_path=args.record)
         menu.run()
     except Exception as e:
         print(f"Bir hata oluştu: {e}")
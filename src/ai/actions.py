@@ -0,0 +1,82 @@
+import numpy as np
+from ..game.snake import DIRECTIONS, DIRECTION_INDEX, OPPOSITE_INDEX, RIGHT_OF_INDEX, LEFT_OF_INDEX
+
+# Mutlak mod: 0 UP, 1 DOWN, 2 LEFT, 3 RIGHT (ters yön Snake tarafından yok sayılır)
+# Bağıl mod: 0 düz, 1 sağa dön, 2 sola dön (features'daki tehlike sırasıyla aynı)
+ABSOLUTE = 'absolute'
+RELATIVE = 'relative'
+ACTION_MODES = (ABSOLUTE, RELATIVE)
+
+# [mevcut yön, bağıl aksiyon] -> mutlak yön indeksi
+RELATIVE_TO_DIRECTION = np.array(
+    [[d, RIGHT_OF_INDEX[d], LEFT_OF_INDEX[d]] for d in range(len(DIRECTIONS))], dtype=np.int64)
+
+# [mevcut yön, hedef yön] -> bağıl aksiyon (ters yön için -1)
+DIRECTION_TO_RELATIVE = np.full((len(DIRECTIONS), len(DIRECTIONS)), -1, dtype=np.int64)
+for _d in range(len(DIRECTIONS)):
+    for _action, _target in enumerate(RELATIVE_TO_DIRECTION[_d]):
+        DIRECTION_TO_RELATIVE[_d, _target] = _action
+del _d, _action, _target
+
+
+def action_size(mode):
+    """
+    Aksiyon modundaki hareket sayısını döndürür
+    """
+    if mode == ABSOLUTE:
+        return len(DIRECTIONS)
+    if mode == RELATIVE:
+        return RELATIVE_TO_DIRECTION.shape[1]
+    raise ValueError(f"Geçersiz aksiyon modu: {mode}")
+
+
+def to_direction(action, direction, mode):
+    """
+    Tek bir aksiyonu yılanın yeni yönüne çevirir
+
+    Args:
+        action: Aksiyon indeksi
+        direction (Direction): Yılanın mevcut yönü
+        mode: ABSOLUTE veya RELATIVE
+    Returns:
+        Direction: Yeni yön
+    """
+    if mode == RELATIVE:
+        return DIRECTIONS[RELATIVE_TO_DIRECTION[DIRECTION_INDEX[direction], action]]
+    return DIRECTIONS[action]
+
+
+def to_action(direction_index, direction, mode):
+    """
+    Mutlak bir yön indeksini aksiyon moduna göre aksiyona çevirir (to_direction'ın tersi)
+
+    Args:
+        direction_index: Hedef yön indeksi (0: UP, 1: DOWN, 2: LEFT, 3: RIGHT)
+        direction (Direction): Yılanın mevcut yönü
+        mode: ABSOLUTE veya RELATIVE
+    Returns:
+        int: Aksiyon indeksi (bağıl modda ters yön düz gitmeye çevrilir)
+    """
+    if mode == RELATIVE:
+        current = DIRECTION_INDEX[direction]
+        if direction_index == OPPOSITE_INDEX[current]:
+            return 0
+        return int(DIRECTION_TO_RELATIVE[current, direction_index])
+    return int(direction_index)
+
+
+def to_direction_index(actions, directions, mode):
+    """
+    Bir grup aksiyonu vektörize olarak mutlak yön indekslerine çevirir
+
+    Args:
+        actions: (B,) aksiyon indeksleri
+        directions: (B,) mevcut yön indeksleri
+        mode: ABSOLUTE veya RELATIVE
+    Returns:
+        np.ndarray: (B,) yön indeksleri
+    """
+    actions = np.asarray(actions, dtype=np.int64)
+    if mode == RELATIVE:
+        return RELATIVE_TO_DIRECTION[np.asarray(directions, dtype=np.int64), actions]
+    return actions
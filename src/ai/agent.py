@@ -1,17 +1,31 @@
 import numpy as np
 import random
 from .model import DQNModel
-from .memory import ReplayMemory
+from .memory import ReplayMemory, PrioritizedReplayMemory, MemmapReplayMemory
 
 
 class DQNAgent:
-    def __init__(self, state_size, action_size):
+    def __init__(self, state_size, action_size, compiled_train_step=True, memory_size=10000,
+                 target_update='hard', target_update_every=1000, tau=0.005, prioritized_replay=False,
+                 memory_dir=None, architecture='mlp', state_dtype=np.float32, numpy_refresh_every=100):
         """
         DQN ajanını başlatır
 
         Args:
-            state_size: Durum vektörünün boyutu
+            state_size: Durum vektörünün boyutu ('cnn' için grid gözleminin şekli)
             action_size: Olası hareket sayısı
+            compiled_train_step: True ise replay derlenmiş tf.function adımını kullanır,
+                False ise hedefler NumPy ile hesaplanıp model.fit ile eğitilir
+            memory_size: Deneyim belleğinin kapasitesi
+            target_update: Hedef ağ senkronizasyonu ('hard', 'soft' veya None)
+            target_update_every: 'hard' modunda kaç eğitim adımında bir kopyalanacağı
+            tau: 'soft' modunda Polyak güncelleme oranı
+            prioritized_replay: True ise TD hatasına göre örnekleyen öncelikli bellek kullanılır
+            memory_dir: Verilirse deneyimler bu dizinde disk üzerinde tutulur (MemmapReplayMemory)
+            architecture: Ağ mimarisi ('mlp' veya 'cnn', bkz. DQNModel)
+            state_dtype: Durumların bellekte saklanacağı tip (grid gözlemleri için np.uint8)
+            numpy_refresh_every: NumPy çıkarımı açıkken ağırlıkların kaç replay() adımında bir
+                yeniden aktarılacağı (aradaki seçimler en fazla bu kadar adım eski ağırlıkla yapılır)
         """
         self.state_size = state_size
         self.action_size = action_size
@@ -23,10 +37,25 @@ class DQNAgent:
         self.epsilon_decay = 0.99  # Keşif oranı azalma katsayısı
         self.batch_size = 64  # Eğitim için örnek sayısı
         self.episode_count = 0
+        self.compiled_train_step = compiled_train_step
 
         # Model ve bellek
-        self.model = DQNModel(state_size, action_size)
-        self.memory = ReplayMemory(10000)
+        self.model = DQNModel(state_size, action_size, target_update=target_update,
+                              target_update_every=target_update_every, tau=tau,
+                              architecture=architecture)
+        if memory_dir is not None:
+            if prioritized_replay:
+                raise ValueError("Disk üzerindeki bellek öncelikli örneklemeyi desteklemiyor")
+            self.memory = MemmapReplayMemory(memory_dir, memory_size, state_dtype=state_dtype)
+        elif prioritized_replay:
+            self.memory = PrioritizedReplayMemory(memory_size, state_dtype=state_dtype)
+        else:
+            self.memory = ReplayMemory(memory_size, state_dtype=state_dtype)
+
+        # Ayarlanırsa açgözlü seçimler TensorFlow yerine NumPy ile yapılır
+        self.numpy_policy = None
+        self.numpy_refresh_every = numpy_refresh_every
+        self._replays_since_export = 0
 
     def act(self, state):
         """
@@ -42,9 +71,34 @@ class DQNAgent:
             return random.randrange(self.action_size)
 
         # Sömürü: En iyi hareketi seç
-        state = np.array([state])
-        act_values = self.model.predict(state)
-        return np.argmax(act_values[0])
+        if self.numpy_policy is not None:
+            return self.numpy_policy.act(state)
+        return int(np.argmax(self.model.predict_one(state)))
+
+    def use_numpy_inference(self):
+        """
+        Açgözlü seçimler için ağırlıkları NumPy ağına aktarır
+        Eğitim sürerse replay() ağırlıkları her numpy_refresh_every adımda bir yeniden aktarır
+        """
+        self.numpy_policy = self.model.export_numpy()
+        self._replays_since_export = 0
+
+    def act_batch(self, states):
+        """
+        Bir grup durum için tek ileri geçişle hareket seçer
+
+        Args:
+            states: (B, state_size) durum dizisi
+        Returns:
+            (B,) seçilen hareketler
+        """
+        states = np.asarray(states)
+        actions = np.argmax(self.model.q_values(states), axis=1)
+
+        # Her satır için bağımsız keşif
+        explore = np.random.random(len(states)) <= self.epsilon
+        actions[explore] = np.random.randint(self.action_size, size=int(explore.sum()))
+        return actions
 
     def remember(self, state, action, reward, next_state, done):
         """
@@ -52,27 +106,65 @@ class DQNAgent:
         """
         self.memory.add(state, action, reward, next_state, done)
 
+    def remember_batch(self, states, actions, rewards, next_states, dones):
+        """
+        Bir grup deneyimi tek seferde belleğe kaydeder
+        """
+        self.memory.add_batch(states, actions, rewards, next_states, dones)
+
     def replay(self):
         """Sadece eğitim yapar, epsilon güncellemez"""
         if len(self.memory) < self.batch_size:
             return
 
-        states, actions, rewards, next_states, dones = self.memory.sample(self.batch_size)
-        targets = self.model.predict(states)
-        next_q_values = self.model.predict(next_states)
+        batch = self.memory.sample(self.batch_size)
+        states, actions, rewards, next_states, dones = batch[:5]
+
+        # Öncelikli bellek ayrıca indeksleri ve önem örneklemesi ağırlıklarını döndürür
+        prioritized = isinstance(self.memory, PrioritizedReplayMemory)
+        indices, weights = batch[5:] if prioritized else (None, None)
+
+        if self.compiled_train_step:
+            _, td_errors = self.model.train_step(states, actions, rewards, next_states, dones,
+                                                 self.gamma, weights)
+            if prioritized:
+                self.memory.update_priorities(indices, td_errors.numpy())
+            self._refresh_numpy_policy()
+            return
 
-        for i in range(self.batch_size):
-            if dones[i]:
-                target = rewards[i]
-            else:
-                target = rewards[i] + self.gamma * np.amax(next_q_values[i])
-            targets[i][actions[i]] = target
+        batch_size = len(states)
+        if self.model.target_model is None:
+            # states ve next_states tek bir ileri geçişte değerlendirilir
+            q_values = self.model.predict(np.concatenate([states, next_states]))
+            targets, next_q_values = q_values[:batch_size], q_values[batch_size:]
+        else:
+            targets = self.model.predict(states)
+            next_q_values = self.model.target_q_values(next_states)
 
-        self.model.train(states, targets)
+        # Oyun bittiyse hedef sadece ödüldür
+        rows = np.arange(batch_size)
+        action_targets = rewards + self.gamma * np.max(next_q_values, axis=1) * (1 - dones)
+        if prioritized:
+            self.memory.update_priorities(indices, action_targets - targets[rows, actions])
+        targets[rows, actions] = action_targets
+
+        self.model.train(states, targets, sample_weight=weights)
+        self._refresh_numpy_policy()
+
+    def _refresh_numpy_policy(self):
+        """
+        NumPy çıkarımı açıksa ağırlıkları sabit aralıklarla yeniden aktarır
+        """
+        if self.numpy_policy is None:
+            return
+        self._replays_since_export += 1
+        if self._replays_since_export >= self.numpy_refresh_every:
+            self.use_numpy_inference()
 
-    def end_episode(self):
+    def end_episode(self, verbose=True):
         """Episode sonunda çağrılır"""
         self.episode_count += 1
         old_epsilon = self.epsilon
         self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
-        print(f"Episode {self.episode_count}: Epsilon {old_epsilon:.4f} -> {self.epsilon:.4f}")
+        if verbose:
+            print(f"Episode {self.episode_count}: Epsilon {old_epsilon:.4f} -> {self.epsilon:.4f}")
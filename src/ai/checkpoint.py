@@ -0,0 +1,341 @@
+import os
+import random
+import shutil
+import threading
+import numpy as np
+from .memory import memory_fields, memory_meta, read_json, write_json
+
+# Kontrol noktası dizini:
+#   <dizin>/latest              -> en son tamamlanan kontrol noktasının adı
+#   <dizin>/ckpt-<episode>/
+#       trainer.json            -> hiperparametreler, epsilon, skor geçmişi
+#       rng.json                -> random, np.random ve bellek RNG durumları
+#       model/                  -> tf.train.Checkpoint (ağ, optimizer, hedef ağ, adım sayacı)
+#       memory/                 -> ReplayMemory (meta.json + alan başına .npy);
+#                                  MemmapReplayMemory kendi dizininde kalır, kopyalanmaz
+# Her kontrol noktası önce geçici bir dizine yazılır, 'latest' os.replace ile güncellenir;
+# yarıda kalan bir yazma önceki kontrol noktasını bozmaz. Aynı episode sayısında tekrar
+# kaydedilirse (ör. periyodik kayıttan hemen sonra hata) yeni ad ckpt-<episode>-<n> olur;
+# 'latest'in gösterdiği dizin hiçbir zaman silinmez ya da üzerine yazılmaz
+CHECKPOINT_VERSION = 1
+LATEST_FILE = 'latest'
+# trainer.json'da bulunması gereken alanlar (load_checkpoint'in okudukları)
+REQUIRED_KEYS = ('version', 'rays', 'action_mode', 'observation', 'state_size', 'action_size',
+                 'gamma', 'epsilon', 'epsilon_min', 'epsilon_decay', 'batch_size', 'episode_count',
+                 'scores', 'mean_scores', 'memory')
+WRITE_CHUNK = 65536  # Bellek dosyalarına tek seferde yazılan satır sayısı
+
+def latest_checkpoint(directory):
+    """
+    Dizindeki en son tamamlanmış kontrol noktasının yolunu döndürür (yoksa None)
+    """
+    path = os.path.join(directory, LATEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        name = f.read().strip()
+    return os.path.join(directory, name) if name else None
+
+
+def _model_checkpoint(model):
+    """
+    DQNModel'in kaydedilecek TensorFlow nesnelerini tek bir tf.train.Checkpoint'te toplar
+    """
+    import tensorflow as tf
+    optimizer = model.model.optimizer
+    if not optimizer.built:
+        # Optimizer durumları ilk adımda oluşur; geri yüklemeden önce hazır olmalı
+        optimizer.build(model.model.trainable_variables)
+
+    objects = dict(model=model.model, optimizer=optimizer, train_steps=model.train_steps)
+    if model.target_model is not None:
+        objects['target'] = model.target_model
+    return tf.train.Checkpoint(**objects)
+
+
+def _rng_state(memory):
+    """
+    Eğitimde kullanılan rastgele sayı üreteçlerinin durumlarını JSON'a uygun döndürür
+    """
+    version, internal, gauss = random.getstate()
+    name, keys, pos, has_gauss, cached = np.random.get_state()
+    return {
+        'random': [version, list(internal), gauss],
+        'numpy': [name, keys.tolist(), pos, has_gauss, cached],
+        'memory': memory.rng.bit_generator.state,
+    }
+
+
+def _set_rng_state(state, memory):
+    """
+    _rng_state ile kaydedilen durumları geri yükler
+    """
+    version, internal, gauss = state['random']
+    random.setstate((version, tuple(internal), gauss))
+    name, keys, pos, has_gauss, cached = state['numpy']
+    np.random.set_state((name, np.array(keys, dtype=np.uint32), pos, has_gauss, cached))
+    memory.rng.bit_generator.state = state['memory']
+
+
+def _used_rows(memory, field):
+    """
+    Alanın şimdiye kadar yazılmış satır sayısını döndürür (sonrası hep sıfırdır)
+    """
+    if field == 'states' and memory.dedupe_next_states:
+        # i. deneyimin state'i i. satırda, next_state'i bir sonrakinde
+        return min(memory.count + 1, len(memory.states))
+    return memory.size
+
+
+def snapshot_memory(memory):
+    """
+    Belleğin yazılacak içeriğinin kopyasını alır; eğitim kopya alındıktan sonra devam edebilir
+    Sadece dolu satırlar kopyalanır
+    Returns:
+        (meta, {dosya adı: (tam kapasiteli şekil, dolu satırların kopyası)})
+    """
+    meta = memory_meta(memory)
+    arrays = {}
+    if memory.states is not None:
+        for field in memory_fields(memory):
+            array = getattr(memory, field)
+            arrays[field] = (array.shape, array[:_used_rows(memory, field)].copy())
+        if memory.dedupe_next_states:
+            keys = np.array(sorted(memory.overflow), dtype=np.int64)
+            states = np.stack([memory.overflow[k] for k in keys]) if len(keys) else \
+                np.zeros((0,) + memory.states.shape[1:], dtype=memory.state_dtype)
+            arrays['overflow_keys'] = (keys.shape, keys)
+            arrays['overflow_states'] = (states.shape, states)
+        if meta['prioritized']:
+            arrays['priorities'] = (memory.tree.tree.shape, memory.tree.tree.copy())
+    return meta, arrays
+
+
+def write_memory(snapshot, directory):
+    """
+    snapshot_memory ile alınan kopyayı alan başına bir .npy dosyası ve meta.json olarak yazar
+    Dosyalar open_memmap ile tam kapasitede oluşturulur ve parça parça doldurulur;
+    boş satırlar hiç yazılmaz. np.load(mmap_mode=...) ile kopyalanmadan açılabilir
+    """
+    meta, arrays = snapshot
+    os.makedirs(directory, exist_ok=True)
+    for name, (shape, data) in arrays.items():
+        out = np.lib.format.open_memmap(os.path.join(directory, name + '.npy'), mode='w+',
+                                        dtype=data.dtype, shape=shape)
+        for start in range(0, len(data), WRITE_CHUNK):
+            stop = min(start + WRITE_CHUNK, len(data))
+            out[start:stop] = data[start:stop]
+        out.flush()
+        del out
+    write_json(os.path.join(directory, 'meta.json'), meta)
+
+
+def save_memory(memory, directory):
+    """
+    ReplayMemory'yi alan başına bir .npy dosyası ve meta.json olarak yazar
+    """
+    write_memory(snapshot_memory(memory), directory)
+
+
+def load_memory(memory, directory):
+    """
+    save_memory ile yazılmış içeriği var olan bir belleğe geri yükler
+    Bellek aynı kapasite ve ayarlarla oluşturulmuş olmalıdır
+    """
+    meta = read_json(os.path.join(directory, 'meta.json'))
+    if meta['max_size'] != memory.max_size:
+        raise ValueError(f"Bellek kapasitesi uyuşmuyor: {meta['max_size']} != {memory.max_size}")
+    if meta['dedupe_next_states'] != memory.dedupe_next_states:
+        raise ValueError("dedupe_next_states ayarı uyuşmuyor")
+    if meta['prioritized'] != memory_meta(memory)['prioritized']:
+        raise ValueError("Öncelikli bellek ayarı uyuşmuyor")
+    if meta['state_shape'] is None:
+        return
+
+    memory.state_dtype = np.dtype(meta['state_dtype'])
+    memory._allocate(meta['state_shape'])
+    for field in memory_fields(memory):
+        getattr(memory, field)[:] = np.load(os.path.join(directory, field + '.npy'), mmap_mode='r')
+    if memory.dedupe_next_states:
+        keys = np.load(os.path.join(directory, 'overflow_keys.npy'))
+        states = np.load(os.path.join(directory, 'overflow_states.npy'))
+        memory.overflow = {int(k): s for k, s in zip(keys, states)}
+
+    memory.size, memory.ptr, memory.count = meta['size'], meta['ptr'], meta['count']
+    if meta['prioritized']:
+        memory.tree.tree[:] = np.load(os.path.join(directory, 'priorities.npy'))
+        memory.beta = meta['beta']
+        memory.max_priority = meta['max_priority']
+
+
+class _BackgroundWrite(threading.Thread):
+    """
+    Kontrol noktasının disk yazımını eğitim iş parçacığının dışında tamamlar
+    Daemon değildir: yorumlayıcı kapanırken yarım kalan yazma beklenir
+    """
+
+    def __init__(self, finish):
+        super().__init__(name='checkpoint-writer')
+        self.finish = finish
+        self.error = None
+
+    def run(self):
+        try:
+            self.finish()
+        except BaseException as e:
+            self.error = e
+
+
+def wait_checkpoint(trainer):
+    """
+    Arka planda yazılan kontrol noktası varsa bitmesini bekler; yazma hata verdiyse yükseltir
+    """
+    thread = trainer.checkpoint_thread
+    if thread is None:
+        return
+    thread.join()
+    trainer.checkpoint_thread = None
+    if thread.error is not None:
+        raise thread.error
+
+
+def _checkpoint_order(entry):
+    """
+    ckpt-<episode>[-<n>] adlarını (episode, n) sırasına göre sıralar
+    """
+    return tuple(int(part) for part in entry[len('ckpt-'):].split('-'))
+
+
+def _new_checkpoint_name(directory, episodes):
+    """
+    Var olan hiçbir kontrol noktasıyla çakışmayan bir ad seçer
+    """
+    base = name = f'ckpt-{episodes:08d}'
+    suffix = 0
+    while os.path.exists(os.path.join(directory, name)) or os.path.exists(os.path.join(directory, name + '.tmp')):
+        suffix += 1
+        name = f'{base}-{suffix}'
+    return name
+
+
+def save_checkpoint(trainer, directory, include_memory=True, keep=2, background=False):
+    """
+    Eğitimin tüm durumunu yeni bir kontrol noktasına yazar
+
+    Args:
+        trainer (Trainer): Kaydedilecek eğitici
+        directory: Kontrol noktalarının tutulduğu dizin
+        include_memory: ReplayMemory içeriği de yazılsın mı
+        keep: Saklanacak en son kontrol noktası sayısı
+        background: True ise bellek dosyaları ve 'latest' güncellemesi arka planda yazılır;
+            eğitim iş parçacığı sadece model ve belleğin dolu satırlarının kopyasını bekler
+            (bitişi wait_checkpoint ile beklenir)
+    Returns:
+        str: Yazılan (background ise yazılmakta olan) kontrol noktasının yolu
+    """
+    wait_checkpoint(trainer)
+    agent = trainer.agent
+    # Disk üzerindeki bellek zaten kalıcıdır; kopyalamak yerine dosyaları güncellenir
+    if hasattr(agent.memory, 'flush'):
+        agent.memory.flush()
+        include_memory = False
+    os.makedirs(directory, exist_ok=True)
+    name = _new_checkpoint_name(directory, len(trainer.scores))
+    path = os.path.join(directory, name)
+    tmp_path = path + '.tmp'
+    os.makedirs(tmp_path)
+
+    write_json(os.path.join(tmp_path, 'trainer.json'), {
+        'version': CHECKPOINT_VERSION,
+        'rays': trainer.rays,
+        'action_mode': trainer.action_mode,
+        'observation': trainer.observation,
+        'state_size': agent.state_size,
+        'action_size': agent.action_size,
+        'gamma': agent.gamma,
+        'epsilon': agent.epsilon,
+        'epsilon_min': agent.epsilon_min,
+        'epsilon_decay': agent.epsilon_decay,
+        'batch_size': agent.batch_size,
+        'episode_count': agent.episode_count,
+        'target_update': agent.model.target_update,
+        'target_update_every': agent.model.target_update_every,
+        'tau': agent.model.tau,
+        'scores': [int(score) for score in trainer.scores],
+        'mean_scores': [float(score) for score in trainer.mean_scores],
+        'memory': include_memory,
+    })
+    write_json(os.path.join(tmp_path, 'rng.json'), _rng_state(agent.memory))
+    _model_checkpoint(agent.model).write(os.path.join(tmp_path, 'model', 'model'))
+    memory = snapshot_memory(agent.memory) if include_memory else None
+
+    def finish():
+        if memory is not None:
+            write_memory(memory, os.path.join(tmp_path, 'memory'))
+
+        # Tamamlanan kontrol noktasını yerine koy ve 'latest'i ona çevir
+        os.replace(tmp_path, path)
+        with open(os.path.join(directory, LATEST_FILE + '.tmp'), 'w') as f:
+            f.write(name)
+        os.replace(os.path.join(directory, LATEST_FILE + '.tmp'), os.path.join(directory, LATEST_FILE))
+
+        # Eskiler sadece 'latest' yeni kontrol noktasını gösterdikten sonra silinir
+        old = sorted((entry for entry in os.listdir(directory)
+                      if entry.startswith('ckpt-') and not entry.endswith('.tmp')), key=_checkpoint_order)
+        for entry in old[:-keep] if keep else []:
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
+
+    if background:
+        trainer.checkpoint_thread = _BackgroundWrite(finish)
+        trainer.checkpoint_thread.start()
+    else:
+        finish()
+    return path
+
+
+def load_checkpoint(trainer, path):
+    """
+    Kontrol noktasını eğiticiye geri yükler
+    Eğitici aynı rays/action_mode/observation ayarlarıyla oluşturulmuş olmalıdır
+
+    Args:
+        trainer (Trainer): Durumu geri yüklenecek eğitici
+        path: Kontrol noktası dizini veya kontrol noktalarını içeren dizin ('latest' okunur)
+    Returns:
+        str: Yüklenen kontrol noktasının yolu
+    """
+    if os.path.exists(os.path.join(path, LATEST_FILE)):
+        path = latest_checkpoint(path)
+    if path is None or not os.path.exists(os.path.join(path, 'trainer.json')):
+        raise FileNotFoundError(f"Kontrol noktası bulunamadı: {path}")
+
+    wait_checkpoint(trainer)
+    state = read_json(os.path.join(path, 'trainer.json'))
+    agent = trainer.agent
+    missing = [key for key in REQUIRED_KEYS if key not in state]
+    if missing:
+        raise ValueError(f"Bozuk kontrol noktası {path}: trainer.json'da eksik alanlar: {', '.join(missing)}")
+    if state['version'] != CHECKPOINT_VERSION:
+        raise ValueError(f"Desteklenmeyen kontrol noktası sürümü {state['version']!r} "
+                         f"(beklenen {CHECKPOINT_VERSION}): {path}")
+    for key, value in (('rays', trainer.rays), ('action_mode', trainer.action_mode),
+                       ('observation', trainer.observation),
+                       ('state_size', agent.state_size), ('action_size', agent.action_size)):
+        # JSON'da demetler liste olarak saklanır (grid gözleminin şekli)
+        if isinstance(value, tuple):
+            value = list(value)
+        if state[key] != value:
+            raise ValueError(f"Kontrol noktası ayarı uyuşmuyor: {key}={state[key]!r}, beklenen {value!r}")
+
+    for key in ('gamma', 'epsilon', 'epsilon_min', 'epsilon_decay', 'batch_size', 'episode_count'):
+        setattr(agent, key, state[key])
+    trainer.scores = state['scores']
+    trainer.mean_scores = state['mean_scores']
+
+    _model_checkpoint(agent.model).read(os.path.join(path, 'model', 'model')).assert_existing_objects_matched()
+    if agent.numpy_policy is not None:
+        agent.use_numpy_inference()  # Yüklenen ağırlıklar aktarılır
+    if state['memory']:
+        load_memory(agent.memory, os.path.join(path, 'memory'))
+    _set_rng_state(read_json(os.path.join(path, 'rng.json')), agent.memory)
+    return path
@@ -0,0 +1,145 @@
+import json
+import os
+import numpy as np
+from .features import encode_state, feature_size
+from ..game.snake import DIRECTION_INDEX
+
+# Dosya yapısı: MAGIC, 4 baytlık başlık uzunluğu (little endian), JSON başlık,
+# ardından sabit genişlikli kayıtlar. Kayıtlar dosyaya eklenerek yazılır;
+# okuma np.memmap ile yapılır, dosyanın tamamı belleğe alınmaz.
+MAGIC = b'SNAKELOG'
+LOG_VERSION = 1
+
+
+def record_dtype(state_size):
+    """
+    Tek bir geçişin kayıt tipini döndürür
+    Aksiyon yerine hareketten önceki ve sonraki mutlak yönler saklanır;
+    böylece aynı kayıt hem mutlak hem bağıl aksiyon moduna çevrilebilir
+    """
+    return np.dtype([
+        ('state', np.float32, (state_size,)),
+        ('next_state', np.float32, (state_size,)),
+        ('prev_direction', np.uint8),  # Adımdan önceki yön indeksi
+        ('direction', np.uint8),  # Adımda gidilen yön indeksi
+        ('reward', np.float32),
+        ('done', np.bool_),
+    ])
+
+
+def _read_header(f):
+    """
+    Açık dosyanın başlığını okur
+    Returns:
+        (başlık sözlüğü, kayıtların başladığı bayt)
+    """
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{f.name} bir episode kaydı değil")
+    length = int.from_bytes(f.read(4), 'little')
+    header = json.loads(f.read(length).decode())
+    return header, len(MAGIC) + 4 + length
+
+
+class EpisodeLogWriter:
+    """
+    Geçişleri sabit genişlikli ikili kayıtlar olarak bir dosyaya ekler
+    Kayıtlar önceden ayrılmış bir tamponda biriktirilip toplu olarak yazılır
+    """
+
+    def __init__(self, path, rays=False, source='agent', buffer_size=4096):
+        """
+        Args:
+            path: Kayıt dosyası (varsa sonuna eklenir)
+            rays: Durum vektörlerinde ışın özellikleri var mı
+            source: Kaydı üretenin adı (ör. 'human', 'agent'); başlıkta saklanır
+            buffer_size: Diske yazmadan önce biriktirilecek kayıt sayısı
+        """
+        self.path = path
+        self.rays = rays
+        self.dtype = record_dtype(feature_size(rays))
+        self.buffer = np.zeros(buffer_size, dtype=self.dtype)
+        self.pending = 0
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb') as f:
+                header, _ = _read_header(f)
+            if header['rays'] != rays:
+                raise ValueError(f"{path} farklı bir durum vektörüyle kaydedilmiş (rays={header['rays']})")
+            self.file = open(path, 'ab')
+        else:
+            header = json.dumps({'version': LOG_VERSION, 'rays': rays,
+                                 'state_size': feature_size(rays), 'source': source}).encode()
+            self.file = open(path, 'wb')
+            self.file.write(MAGIC + len(header).to_bytes(4, 'little') + header)
+
+    def record(self, state, prev_direction, direction, reward, next_state, done):
+        """
+        Bir geçişi kaydeder
+
+        Args:
+            state: Adımdan önceki durum vektörü
+            prev_direction: Adımdan önceki yön indeksi
+            direction: Adımda gidilen yön indeksi
+            reward: Alınan ödül
+            next_state: Adımdan sonraki durum vektörü
+            done: Oyun bitti mi
+        """
+        row = self.buffer[self.pending]
+        row['state'] = state
+        row['next_state'] = next_state
+        row['prev_direction'] = prev_direction
+        row['direction'] = direction
+        row['reward'] = reward
+        row['done'] = done
+        self.pending += 1
+        if self.pending == len(self.buffer):
+            self.flush()
+
+    def record_step(self, game_state, state, prev_direction, reward, done):
+        """
+        Oyun adımından sonra çağrılır; next_state ve yön oyun durumundan okunur
+        Returns:
+            next_state (bir sonraki adımda state olarak kullanılabilir)
+        """
+        next_state = encode_state(game_state, self.rays)
+        self.record(state, prev_direction, DIRECTION_INDEX[game_state.snake.direction],
+                    reward, next_state, done)
+        return next_state
+
+    def flush(self):
+        """
+        Tampondaki kayıtları dosyaya yazar
+        """
+        if self.pending:
+            self.buffer[:self.pending].tofile(self.file)
+            self.pending = 0
+        self.file.flush()
+
+    def close(self):
+        """
+        Kalan kayıtları yazar ve dosyayı kapatır
+        """
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_log(path):
+    """
+    Kayıt dosyasını kopyalamadan okunabilir yapılandırılmış bir dizi olarak açar
+    Returns:
+        (başlık sözlüğü, np.memmap kayıt dizisi)
+    """
+    with open(path, 'rb') as f:
+        header, offset = _read_header(f)
+    dtype = record_dtype(header['state_size'])
+    count = (os.path.getsize(path) - offset) // dtype.itemsize
+    if count == 0:
+        return header, np.zeros(0, dtype=dtype)
+    return header, np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
@@ -0,0 +1,146 @@
+import numpy as np
+from ..game.snake import DIRECTIONS, DIRECTION_INDEX, RIGHT_OF_INDEX, LEFT_OF_INDEX
+from ..game.constants import GRID_WIDTH, GRID_HEIGHT
+from ..game.vec_env import DIRECTION_DELTAS
+
+# Tüm kodlayıcıların paylaştığı dönüş tabloları (indeksler snake.DIRECTIONS sırasında)
+RIGHT_OF = np.array(RIGHT_OF_INDEX, dtype=np.int64)
+LEFT_OF = np.array(LEFT_OF_INDEX, dtype=np.int64)
+
+# Tehlike ve ışın özelliklerinin hesaplandığı bağıl yönler: düz, sağ, sol
+RELATIVE_TURNS = (np.arange(4), RIGHT_OF, LEFT_OF)
+
+BASE_FEATURE_SIZE = 11
+RAY_FEATURE_SIZE = 6
+
+
+def feature_size(rays=False):
+    """
+    Özellik vektörünün uzunluğunu döndürür
+    """
+    return BASE_FEATURE_SIZE + (RAY_FEATURE_SIZE if rays else 0)
+
+
+def encode_batch(heads, directions, foods, grids, rays=False):
+    """
+    Bir grup oyun için özellikleri vektörize olarak hesaplar
+    Grid boyutları grids dizisinin şeklinden okunur
+
+    Özellikler (sırasıyla):
+        0-2: düz/sağ/sol yönde bir sonraki hücre tehlikeli mi
+        3-6: yön one-hot (UP, DOWN, LEFT, RIGHT)
+        7-10: yem solda/sağda/yukarıda/aşağıda mı
+        11-13 (rays): düz/sağ/sol yönde duvara uzaklık (grid boyutuna oranla)
+        14-16 (rays): düz/sağ/sol yönde ilk engele kadar boş hücre sayısı (oranla)
+
+    Args:
+        heads: (B, 2) kafa konumları (x, y)
+        directions: (B,) yön indeksleri
+        foods: (B, 2) yem konumları (x, y)
+        grids: (B, H, W) doluluk gridleri (0 olmayan hücrelerde gövde var)
+        rays: True ise ışın özellikleri de eklenir
+    Returns:
+        np.ndarray: (B, feature_size(rays)) float32
+    """
+    heads = np.asarray(heads)
+    directions = np.asarray(directions)
+    foods = np.asarray(foods)
+    batch, height, width = grids.shape
+    flat_grids = grids.reshape(batch, height * width)
+    rows = np.arange(batch)
+
+    def blocked(positions):
+        x, y = positions[:, 0], positions[:, 1]
+        outside = (x < 0) | (x >= width) | (y < 0) | (y >= height)
+        cells = np.where(outside, 0, y * width + x)
+        return outside | (flat_grids[rows, cells] != 0)
+
+    features = np.zeros((batch, feature_size(rays)), dtype=np.float32)
+    turned = [turn[directions] for turn in RELATIVE_TURNS]
+
+    for i, dirs in enumerate(turned):
+        features[:, i] = blocked(heads + DIRECTION_DELTAS[dirs])
+
+    features[:, 3:7] = directions[:, None] == np.arange(4)
+
+    features[:, 7] = foods[:, 0] < heads[:, 0]
+    features[:, 8] = foods[:, 0] > heads[:, 0]
+    features[:, 9] = foods[:, 1] < heads[:, 1]
+    features[:, 10] = foods[:, 1] > heads[:, 1]
+
+    if rays:
+        longest = max(width, height)
+        for i, dirs in enumerate(turned):
+            deltas = DIRECTION_DELTAS[dirs]
+            features[:, 11 + i] = _wall_distance(heads, deltas, width, height) / longest
+
+            # İlk engele kadar ilerle; tüm oyunlar aynı anda adım atar
+            free = np.zeros(batch, dtype=np.float32)
+            open_ray = np.ones(batch, dtype=bool)
+            for step in range(1, longest + 1):
+                open_ray &= ~blocked(heads + deltas * step)
+                if not open_ray.any():
+                    break
+                free += open_ray
+            features[:, 14 + i] = free / longest
+
+    return features
+
+
+def _wall_distance(heads, deltas, width, height):
+    """
+    Verilen yönde duvara kadar kaç hücre olduğunu hesaplar
+    """
+    x, y = heads[:, 0], heads[:, 1]
+    return np.select(
+        [deltas[:, 0] > 0, deltas[:, 0] < 0, deltas[:, 1] > 0],
+        [width - 1 - x, x, height - 1 - y],
+        default=y
+    ).astype(np.float32)
+
+
+def encode_state(game_state, rays=False):
+    """
+    Tek bir GameState için özellikleri hesaplar (encode_batch ile aynı sıra)
+    Gövde kontrolleri Snake'in doluluk haritasıyla O(1) yapılır
+
+    Returns:
+        np.ndarray: (feature_size(rays),) float32
+    """
+    snake = game_state.snake
+    head = snake.get_head()
+    food = game_state.food.position
+    direction = DIRECTION_INDEX[snake.direction]
+
+    features = np.zeros(feature_size(rays), dtype=np.float32)
+    turned = [direction, RIGHT_OF_INDEX[direction], LEFT_OF_INDEX[direction]]
+
+    for i, d in enumerate(turned):
+        dx, dy = DIRECTIONS[d].value
+        features[i] = snake.is_collision((head[0] + dx, head[1] + dy))
+
+    features[3 + direction] = 1.0
+
+    features[7] = food[0] < head[0]
+    features[8] = food[0] > head[0]
+    features[9] = food[1] < head[1]
+    features[10] = food[1] > head[1]
+
+    if rays:
+        longest = max(GRID_WIDTH, GRID_HEIGHT)
+        x, y = head
+        for i, d in enumerate(turned):
+            dx, dy = DIRECTIONS[d].value
+            # _wall_distance'ın tek oyunluk karşılığı; tek elemanlı dizilerden kaçınılır
+            if dx:
+                wall = GRID_WIDTH - 1 - x if dx > 0 else x
+            else:
+                wall = GRID_HEIGHT - 1 - y if dy > 0 else y
+            features[11 + i] = wall / longest
+
+            free = 0
+            while not snake.is_collision((head[0] + dx * (free + 1), head[1] + dy * (free + 1))):
+                free += 1
+            features[14 + i] = free / longest
+
+    return features
@@ -0,0 +1,94 @@
+import numpy as np
+from ..game.constants import GRID_WIDTH, GRID_HEIGHT
+
+# Kanallar (son eksen): kafa, gövde (giriş sırasına göre: kafaya yakın parlak, kuyruk sönük), yem
+HEAD_CHANNEL = 0
+BODY_CHANNEL = 1
+FOOD_CHANNEL = 2
+GRID_CHANNELS = 3
+
+MAX_STAMP = 255  # Gövde kanalının alabileceği en büyük damga
+MIN_HEAD_STAMP = 192  # Yeniden kurulumda kafanın aldığı en küçük damga
+
+
+def grid_shape(width=GRID_WIDTH, height=GRID_HEIGHT):
+    """
+    Grid gözleminin şeklini döndürür (Conv2D için kanal son)
+    """
+    return (height, width, GRID_CHANNELS)
+
+
+class GridObserver:
+    """
+    Oyun durumunu (H, W, 3) uint8 grid tensörüne çevirir
+    Gövde kanalı her hücreye kafanın o hücreye girdiği adımın damgasını yazar: gövdenin
+    i. parçası kafadan i damga sönüktür, yani bir parçanın yaşı kafayla farkından okunur.
+    Damga hücre dolu kaldıkça değişmediği için her adımda sadece kafa, boşalan kuyruk ve
+    yem hücreleri güncellenir. Damgalar MAX_STAMP'a ulaşınca gözlem gövdeden yeniden kurulur;
+    MAX_STAMP'tan uzun yılanlarda en eski parçalar 1 damgasında birleşir.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.shape = grid_shape(width, height)
+        self.observation = np.zeros((width * height, GRID_CHANNELS), dtype=np.uint8)
+        self.stamp = 0  # Kafanın damgası
+        self.snake = None  # İzlenen yılan; farklı bir oyun gelirse gözlem yeniden kurulur
+        self.head = None
+        self.tail = None
+        self.food = None
+
+    def reset(self, game_state):
+        """
+        Gözlemi oyun durumundaki gövdeden yeniden kurar: O(tahta)
+        restore() ile oyunun ortasına atlandığında da çağrılmalıdır
+        """
+        snake = game_state.snake
+        observation = self.observation
+        observation.fill(0)
+        self.stamp = min(max(len(snake.body), MIN_HEAD_STAMP), MAX_STAMP)
+        # Kuyruktan kafaya yazılır: grow() ile tekrarlanan kuyrukta parlak damga kalır
+        for i in range(len(snake.body) - 1, -1, -1):
+            x, y = snake.body[i]
+            observation[y * self.width + x, BODY_CHANNEL] = max(self.stamp - i, 1)
+
+        self.snake = snake
+        self.head = snake.body[0]
+        self.tail = snake.body[-1]
+        self.food = game_state.food.position
+        observation[self._index(self.head), HEAD_CHANNEL] = 255
+        observation[self._index(self.food), FOOD_CHANNEL] = 255
+
+    def _index(self, cell):
+        return cell[1] * self.width + cell[0]
+
+    def observe(self, game_state):
+        """
+        Oyun durumunun grid gözlemini döndürür
+        Ardışık adımlar için çağrılmalıdır: sadece kafa, kuyruk ve yem hücreleri güncellenir
+        Returns:
+            np.ndarray: (H, W, 3) uint8; her çağrıda yeni dizi (belleğe doğrudan eklenebilir)
+        """
+        snake = game_state.snake
+        observation = self.observation
+        if snake is not self.snake or (snake.body[0] != self.head and self.stamp == MAX_STAMP):
+            self.reset(game_state)
+        elif snake.body[0] != self.head:
+            # Kafa bir hücre ilerledi; tek adımda en fazla bir kuyruk hücresi boşalır
+            self.stamp += 1
+            observation[self._index(self.head), HEAD_CHANNEL] = 0
+            self.head = snake.body[0]
+            head = self._index(self.head)
+            observation[head, HEAD_CHANNEL] = 255
+            observation[head, BODY_CHANNEL] = self.stamp
+            if self.tail not in snake.occupied:
+                observation[self._index(self.tail), BODY_CHANNEL] = 0
+            self.tail = snake.body[-1]
+
+        food = game_state.food.position
+        if food != self.food:
+            observation[self._index(self.food), FOOD_CHANNEL] = 0
+            observation[self._index(food), FOOD_CHANNEL] = 255
+            self.food = food
+        return observation.reshape(self.shape).copy()
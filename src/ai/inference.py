@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class NumpyQNetwork:
+    """
+    DQNModel ağırlıklarıyla saf NumPy ileri geçiş yapan hafif ağ
+    TensorFlow gerektirmez; tek durumluk açgözlü seçimlerde mikrosaniyeler sürer
+    """
+
+    ACTIVATIONS = {
+        'relu': lambda x: np.maximum(x, 0.0),
+        'linear': lambda x: x
+    }
+
+    def __init__(self, layers):
+        """
+        Args:
+            layers: (kernel, bias, activation) üçlülerinden oluşan liste
+                activation 'relu' veya 'linear' olmalıdır
+        """
+        self.layers = [
+            (np.asarray(kernel, dtype=np.float32), np.asarray(bias, dtype=np.float32), activation)
+            for kernel, bias, activation in layers
+        ]
+
+    def __call__(self, states):
+        """
+        Durumlar için Q-değerlerini hesaplar
+
+        Args:
+            states: (B, state_size) veya (state_size,) durum dizisi
+        Returns:
+            (B, action_size) veya (action_size,) Q-değerleri
+        """
+        x = np.asarray(states, dtype=np.float32)
+        for kernel, bias, activation in self.layers:
+            x = self.ACTIVATIONS[activation](x @ kernel + bias)
+        return x
+
+    def act(self, state):
+        """
+        Tek bir durum için en yüksek Q-değerli hareketi döndürür
+        """
+        return int(np.argmax(self(state)))
+
+    def layout(self):
+        """
+        Ağırlıkların şekillerini ve aktivasyonlarını döndürür (from_flat için)
+        """
+        return [(kernel.shape, bias.shape, activation) for kernel, bias, activation in self.layers]
+
+    def flatten(self):
+        """
+        Tüm ağırlıkları tek bir float32 diziye sırayla yazar
+        """
+        return np.concatenate([
+            array.ravel() for kernel, bias, _ in self.layers for array in (kernel, bias)
+        ])
+
+    @classmethod
+    def from_flat(cls, layout, flat):
+        """
+        layout() ve flatten() çıktısından ağı yeniden oluşturur
+        """
+        layers = []
+        offset = 0
+        for kernel_shape, bias_shape, activation in layout:
+            arrays = []
+            for shape in (kernel_shape, bias_shape):
+                size = int(np.prod(shape))
+                arrays.append(flat[offset:offset + size].reshape(shape))
+                offset += size
+            layers.append((arrays[0], arrays[1], activation))
+        return cls(layers)
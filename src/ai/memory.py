@@ -1,17 +1,59 @@
+import json
+import os
 import numpy as np
-from collections import deque
-import random
+
+# Disk üzerindeki bellek dizini (MemmapReplayMemory ve kontrol noktalarındaki bellek):
+# meta.json + alan başına tam kapasiteli bir .npy dosyası
+MEMORY_VERSION = 1
+MEMORY_FIELDS = ('states', 'actions', 'rewards', 'dones')
+NEXT_STATE_FIELDS = ('next_states',)
+DEDUPE_FIELDS = ('state_slots', 'has_overflow')
 
 
 class ReplayMemory:
-    def __init__(self, max_size=2000):
+    def __init__(self, max_size=2000, state_dtype=np.float32, dedupe_next_states=False, seed=None):
         """
         Deneyim tekrarı için bellek yapısı
+        Deneyimler önceden ayrılmış NumPy dizilerinde halka tampon olarak tutulur
 
         Args:
             max_size: Maksimum deneyim sayısı (varsayılan: 2000)
+            state_dtype: Durumların saklanacağı veri tipi
+            dedupe_next_states: True ise next_state ayrı saklanmaz; ardışık deneyimlerde
+                bir sonraki deneyimin state'i ile aynı satır paylaşılır
+            seed: Örnekleme için rastgele sayı üreteci tohumu
         """
-        self.buffer = deque(maxlen=max_size)
+        self.max_size = max_size
+        self.state_dtype = state_dtype
+        self.dedupe_next_states = dedupe_next_states
+        self.rng = np.random.default_rng(seed)
+
+        self.size = 0  # Bellekteki deneyim sayısı
+        self.ptr = 0  # Bir sonraki deneyimin yazılacağı indeks
+        self.count = 0  # Şimdiye kadar eklenen toplam deneyim sayısı
+
+        # Diziler durum boyutu ilk add() çağrısında öğrenilince ayrılır
+        self.states = None
+
+    def _allocate(self, state_shape):
+        """
+        Deneyim dizilerini verilen durum boyutuna göre ayırır
+        """
+        state_slots = self.max_size + 1 if self.dedupe_next_states else self.max_size
+        self.states = np.zeros((state_slots,) + tuple(state_shape), dtype=self.state_dtype)
+        self.actions = np.zeros(self.max_size, dtype=np.int32)
+        self.rewards = np.zeros(self.max_size, dtype=np.float32)
+        self.dones = np.zeros(self.max_size, dtype=bool)
+
+        if self.dedupe_next_states:
+            # i. deneyimin state'i state_slots[i]'de, next_state'i bir sonraki satırda
+            self.state_slots = np.zeros(self.max_size, dtype=np.int64)
+            # next_state'i bir sonraki deneyimin state'inden farklı olan deneyimler
+            # (ör. episode sonları) için ayrı kopya
+            self.has_overflow = np.zeros(self.max_size, dtype=bool)
+            self.overflow = {}
+        else:
+            self.next_states = np.zeros((self.max_size,) + tuple(state_shape), dtype=self.state_dtype)
 
     def add(self, state, action, reward, next_state, done):
         """
@@ -24,33 +66,395 @@ class ReplayMemory:
             next_state: Sonraki durum
             done: Oyun bitti mi
         """
-        experience = (state, action, reward, next_state, done)
-        self.buffer.append(experience)
+        state = np.asarray(state)
+        if self.states is None:
+            self._allocate(state.shape)
+
+        i = self.ptr
+        if self.dedupe_next_states:
+            self._add_deduped(i, state, next_state)
+        else:
+            self.states[i] = state
+            self.next_states[i] = next_state
+
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.dones[i] = done
+
+        self.ptr = (i + 1) % self.max_size
+        self.size = min(self.size + 1, self.max_size)
+        self.count += 1
+
+    def add_batch(self, states, actions, rewards, next_states, dones):
+        """
+        Bir grup deneyimi halka tampona dilimler halinde ekler (ör. VecSnakeEnv'in bir adımı)
+        Sırayla add() çağırmakla aynı sonucu verir
+
+        Args:
+            states, next_states: (N, ...) durumlar
+            actions, rewards, dones: (N,) diziler
+        Returns:
+            np.ndarray: Deneyimlerin yazıldığı indeksler (N kapasiteyi aşarsa son max_size deneyiminkiler)
+        """
+        states = np.asarray(states)
+        n = len(states)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        if self.states is None:
+            self._allocate(states.shape[1:])
+
+        if self.dedupe_next_states:
+            # Satır paylaşımı ardışık deneyimlere bağlı; deneyimler sırayla yazılır
+            indices = (self.ptr + np.arange(max(0, n - self.max_size), n)) % self.max_size
+            for i in range(n):
+                ReplayMemory.add(self, states[i], actions[i], rewards[i], next_states[i], dones[i])
+            return indices
+
+        # Kapasiteden fazlası gelirse sadece son max_size deneyim kalır
+        skip = max(0, n - self.max_size)
+        start = (self.ptr + skip) % self.max_size
+        fields = ((self.states, states), (self.next_states, next_states), (self.actions, actions),
+                  (self.rewards, rewards), (self.dones, dones))
+        first = min(n - skip, self.max_size - start)  # Tamponun sonuna kadar yazılacak kısım
+        for array, values in fields:
+            values = np.asarray(values)[skip:]
+            array[start:start + first] = values[:first]
+            array[:len(values) - first] = values[first:]
+
+        self.ptr = (self.ptr + n) % self.max_size
+        self.size = min(self.size + n, self.max_size)
+        self.count += n
+        return (start + np.arange(n - skip)) % self.max_size
+
+    def _add_deduped(self, i, state, next_state):
+        """
+        Deneyimi next_state satırını bir sonraki deneyimle paylaşarak yazar
+        """
+        slots = len(self.states)
+        slot = self.count % slots
+
+        # Önceki deneyimin next_state'i bu satırda; state farklıysa üzerine yazmadan önce kopyala
+        if self.count > 0 and not np.array_equal(self.states[slot], state):
+            prev = (i - 1) % self.max_size
+            self.overflow[prev] = self.states[slot].copy()
+            self.has_overflow[prev] = True
+
+        # Üzerine yazılan eski deneyimin kopyası artık geçersiz
+        if self.has_overflow[i]:
+            del self.overflow[i]
+            self.has_overflow[i] = False
+
+        self.state_slots[i] = slot
+        self.states[slot] = state
+        self.states[(slot + 1) % slots] = next_state
 
     def sample(self, batch_size=32):
         """
         Bellekten rastgele deneyimler örnekler
+        Tek bir indeks çekimi ve dizi indekslemesi ile toplu olarak döner
 
         Args:
             batch_size: Örneklenecek deneyim sayısı
         Returns:
             states, actions, rewards, next_states, dones
         """
-        if batch_size > len(self.buffer):
-            batch_size = len(self.buffer)
+        if batch_size > self.size:
+            batch_size = self.size
 
-        batch = random.sample(self.buffer, batch_size)
+        indices = self.rng.integers(0, self.size, size=batch_size)
+        return self._gather(indices)
 
-        states = np.array([experience[0] for experience in batch])
-        actions = np.array([experience[1] for experience in batch])
-        rewards = np.array([experience[2] for experience in batch])
-        next_states = np.array([experience[3] for experience in batch])
-        dones = np.array([experience[4] for experience in batch])
+    def _gather(self, indices):
+        """
+        Verilen indekslerdeki deneyimleri diziler olarak döndürür
+        """
+        if self.dedupe_next_states:
+            slots = self.state_slots[indices]
+            states = self.states[slots]
+            next_states = self.states[(slots + 1) % len(self.states)]
+            for j in np.nonzero(self.has_overflow[indices])[0]:
+                next_states[j] = self.overflow[indices[j]]
+        else:
+            states = self.states[indices]
+            next_states = self.next_states[indices]
 
-        return states, actions, rewards, next_states, dones
+        return states, self.actions[indices], self.rewards[indices], next_states, self.dones[indices]
 
     def __len__(self):
         """
         Bellekteki deneyim sayısını döndürür
         """
-        return len(self.buffer)
\ No newline at end of file
+        return self.size
+
+
+class MemmapReplayMemory(ReplayMemory):
+    def __init__(self, directory, max_size=1000000, state_dtype=np.float32, seed=None, flush_every=10000):
+        """
+        Deneyimleri disk üzerindeki sabit genişlikli, bellek eşlemeli .npy dosyalarında tutar
+        Kapasite RAM ile değil disk ile sınırlıdır; işletim sistemi sadece erişilen sayfaları yükler.
+        Dizin yapısı kontrol noktalarındaki bellekle aynıdır (meta.json + alan başına .npy).
+        Dizin önceden varsa açılır ve eklemeler kaldığı yerden devam eder.
+
+        Args:
+            directory: Dosyaların tutulacağı dizin
+            max_size: Maksimum deneyim sayısı (dosyalar bu boyutta oluşturulur)
+            state_dtype: Durumların saklanacağı veri tipi
+            seed: Örnekleme için rastgele sayı üreteci tohumu
+            flush_every: Kaç eklemede bir meta.json'un güncelleneceği
+        """
+        super().__init__(max_size, state_dtype=state_dtype, seed=seed)
+        self.directory = directory
+        self.flush_every = flush_every
+        os.makedirs(directory, exist_ok=True)
+
+        meta_path = os.path.join(directory, 'meta.json')
+        if os.path.exists(meta_path):
+            meta = read_json(meta_path)
+            if meta['max_size'] != max_size:
+                raise ValueError(f"Bellek kapasitesi uyuşmuyor: {meta['max_size']} != {max_size}")
+            if meta['dedupe_next_states'] or meta['prioritized']:
+                raise ValueError(f"{directory} bir MemmapReplayMemory dizini değil")
+            self.state_dtype = np.dtype(meta['state_dtype'])
+            if meta['state_shape'] is not None:
+                self._open(meta['state_shape'], 'r+')
+                self.size, self.ptr, self.count = meta['size'], meta['ptr'], meta['count']
+
+    def _allocate(self, state_shape):
+        """
+        Dosyaları tam kapasiteyle oluşturur
+        """
+        self._open(state_shape, 'w+')
+        self.flush()
+
+    def _open(self, state_shape, mode):
+        """
+        Alan dosyalarını bellek eşlemeli diziler olarak açar veya oluşturur
+        """
+        state_shape = (self.max_size,) + tuple(state_shape)
+        layout = {
+            'states': (state_shape, self.state_dtype),
+            'next_states': (state_shape, self.state_dtype),
+            'actions': ((self.max_size,), np.int32),
+            'rewards': ((self.max_size,), np.float32),
+            'dones': ((self.max_size,), bool),
+        }
+        for field in memory_fields(self):
+            shape, dtype = layout[field]
+            path = os.path.join(self.directory, field + '.npy')
+            if mode == 'w+':
+                array = np.lib.format.open_memmap(path, mode=mode, dtype=dtype, shape=shape)
+            else:
+                array = np.load(path, mmap_mode=mode)
+            setattr(self, field, array)
+
+    def add(self, state, action, reward, next_state, done):
+        """
+        Yeni deneyimi dosyalara yazar
+        """
+        super().add(state, action, reward, next_state, done)
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+    def add_batch(self, states, actions, rewards, next_states, dones):
+        """
+        Deneyim grubunu dosyalara dilimler halinde yazar
+        """
+        count = self.count
+        indices = super().add_batch(states, actions, rewards, next_states, dones)
+        if self.count // self.flush_every > count // self.flush_every:
+            self.flush()
+        return indices
+
+    def flush(self):
+        """
+        Değişiklikleri diske yazar ve meta.json'u atomik olarak günceller
+        """
+        if self.states is not None:
+            for field in memory_fields(self):
+                getattr(self, field).flush()
+        write_json(os.path.join(self.directory, 'meta.json'), memory_meta(self))
+
+
+class SumTree:
+    def __init__(self, capacity):
+        """
+        Öncelik toplamlarını tutan ikili ağaç (dizi olarak)
+        Yapraklar önceliklerdir, her iç düğüm iki çocuğunun toplamıdır
+
+        Args:
+            capacity: Yaprak sayısı
+        """
+        self.capacity = capacity
+
+        # Tüm yapraklar aynı derinlikte olsun diye 2'nin kuvvetine yuvarlanır
+        self.leaf_offset = 1
+        while self.leaf_offset < capacity:
+            self.leaf_offset *= 2
+        self.tree = np.zeros(2 * self.leaf_offset, dtype=np.float64)
+
+    def total(self):
+        """
+        Tüm önceliklerin toplamını döndürür
+        """
+        return self.tree[1]
+
+    def get(self, indices):
+        """
+        Verilen yaprakların önceliklerini döndürür
+        """
+        return self.tree[np.asarray(indices) + self.leaf_offset]
+
+    def update(self, indices, priorities):
+        """
+        Yaprakları günceller ve toplamları köke kadar yeniden hesaplar
+        Her seviye tek bir vektörize işlemle güncellenir: O(B log n)
+        """
+        nodes = np.asarray(indices) + self.leaf_offset
+        self.tree[nodes] = priorities
+
+        while nodes[0] > 1:
+            nodes = np.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values):
+        """
+        Her değer için kümülatif toplamı o değeri geçen ilk yaprağı bulur
+        Tüm değerler için ağaçta birlikte inilir: O(B log n)
+
+        Args:
+            values: [0, total) aralığında değerler
+        Returns:
+            Yaprak indeksleri
+        """
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+
+        while nodes[0] < self.leaf_offset:
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = values > left_sum
+            values = np.where(go_right, values - left_sum, values)
+            nodes = np.where(go_right, left + 1, left)
+
+        return nodes - self.leaf_offset
+
+
+class PrioritizedReplayMemory(ReplayMemory):
+    def __init__(self, max_size=2000, alpha=0.6, beta=0.4, beta_increment=1e-4, epsilon=1e-6,
+                 state_dtype=np.float32, dedupe_next_states=False, seed=None):
+        """
+        TD hatasıyla orantılı örnekleyen öncelikli deneyim belleği
+        Öncelikler bir SumTree'de tutulur; örnekleme ve güncelleme O(log n) sürer
+
+        Args:
+            max_size: Maksimum deneyim sayısı
+            alpha: Önceliklendirme derecesi (0: düzgün örnekleme)
+            beta: Önem örneklemesi düzeltmesinin başlangıç değeri
+            beta_increment: Her örneklemede beta'ya eklenen miktar (1'e kadar)
+            epsilon: Sıfır TD hatalı deneyimlerin de seçilebilmesi için eklenen değer
+            state_dtype, dedupe_next_states, seed: ReplayMemory ile aynı
+        """
+        super().__init__(max_size, state_dtype=state_dtype,
+                         dedupe_next_states=dedupe_next_states, seed=seed)
+        self.alpha = alpha
+        self.beta = beta
+        self.beta_increment = beta_increment
+        self.epsilon = epsilon
+        self.max_priority = 1.0  # Yeni deneyimler en az bir kez örneklensin diye
+        self.tree = SumTree(max_size)
+
+    def add(self, state, action, reward, next_state, done):
+        """
+        Yeni deneyimi şimdiye kadarki en yüksek öncelikle ekler
+        """
+        i = self.ptr
+        super().add(state, action, reward, next_state, done)
+        self.tree.update([i], self.max_priority ** self.alpha)
+
+    def add_batch(self, states, actions, rewards, next_states, dones):
+        """
+        Deneyim grubunu en yüksek öncelikle ekler; ağaç tek bir toplu güncellemeyle yenilenir
+        """
+        indices = super().add_batch(states, actions, rewards, next_states, dones)
+        if len(indices):
+            self.tree.update(indices, np.full(len(indices), self.max_priority ** self.alpha))
+        return indices
+
+    def sample(self, batch_size=32):
+        """
+        Deneyimleri öncelikleriyle orantılı olarak örnekler
+        [0, toplam) aralığı batch_size eşit parçaya bölünür ve her parçadan bir değer çekilir
+
+        Returns:
+            states, actions, rewards, next_states, dones, indices, weights
+        """
+        if batch_size > self.size:
+            batch_size = self.size
+
+        total = self.tree.total()
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * (total / batch_size)
+        indices = np.minimum(self.tree.find(values), self.size - 1)
+
+        # Önem örneklemesi ağırlıkları (en büyüğü 1 olacak şekilde)
+        probabilities = self.tree.get(indices) / total
+        weights = (self.size * probabilities) ** (-self.beta)
+        weights = (weights / weights.max()).astype(np.float32)
+        self.beta = min(1.0, self.beta + self.beta_increment)
+
+        return self._gather(indices) + (indices, weights)
+
+    def update_priorities(self, indices, td_errors):
+        """
+        Örneklenen deneyimlerin önceliklerini yeni TD hatalarına göre günceller
+        """
+        priorities = np.abs(np.asarray(td_errors, dtype=np.float64)) + self.epsilon
+        self.max_priority = max(self.max_priority, priorities.max())
+        self.tree.update(indices, priorities ** self.alpha)
+
+
+def write_json(path, data):
+    """
+    JSON dosyasını geçici dosya üzerinden atomik olarak yazar
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def read_json(path):
+    """
+    JSON dosyasını okur
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def memory_meta(memory):
+    """
+    Bellek dizininin meta.json içeriğini döndürür
+    """
+    meta = {
+        'version': MEMORY_VERSION,
+        'max_size': memory.max_size,
+        'state_dtype': np.dtype(memory.state_dtype).str,
+        'state_shape': None if memory.states is None else list(memory.states.shape[1:]),
+        'dedupe_next_states': memory.dedupe_next_states,
+        'size': memory.size,
+        'ptr': memory.ptr,
+        'count': memory.count,
+        'prioritized': isinstance(memory, PrioritizedReplayMemory),
+    }
+    if meta['prioritized']:
+        meta.update(alpha=memory.alpha, beta=memory.beta, beta_increment=memory.beta_increment,
+                    epsilon=memory.epsilon, max_priority=memory.max_priority)
+    return meta
+
+
+def memory_fields(memory):
+    """
+    Belleğin dizi alanlarının adlarını döndürür
+    """
+    if memory.dedupe_next_states:
+        return MEMORY_FIELDS + DEDUPE_FIELDS
+    return MEMORY_FIELDS + NEXT_STATE_FIELDS
@@ -1,25 +1,80 @@
 import tensorflow as tf
 import numpy as np
+from .inference import NumpyQNetwork
+
+
+ARCHITECTURES = ('mlp', 'cnn')
 
 
 class DQNModel:
-    def __init__(self, state_size, action_size):
+    def __init__(self, state_size, action_size, target_update='hard', target_update_every=1000, tau=0.005,
+                 architecture='mlp'):
         """
         Deep Q-Network (DQN) modelini oluşturur
 
         Args:
-            state_size (int): Giriş katmanının boyutu (durum vektörünün uzunluğu)
+            state_size: Giriş boyutu; 'mlp' için durum vektörünün uzunluğu (int),
+                'cnn' için grid gözleminin şekli (H, W, kanal)
             action_size (int): Çıkış katmanının boyutu (olası hareket sayısı)
+            target_update (str): Hedef ağ senkronizasyonu: 'hard' (her target_update_every
+                adımda tam kopya), 'soft' (her adımda Polyak ortalaması) veya None (hedef ağ yok)
+            target_update_every (int): 'hard' modunda kaç eğitim adımında bir kopyalanacağı
+            tau (float): 'soft' modunda güncelleme oranı
+            architecture (str): 'mlp' (özellik vektörü) veya 'cnn' (0-255 uint8 grid gözlemi)
         """
+        if target_update not in ('hard', 'soft', None):
+            raise ValueError(f"Geçersiz target_update: {target_update}")
+        if architecture not in ARCHITECTURES:
+            raise ValueError(f"Geçersiz mimari: {architecture}")
+
         self.state_size = state_size  # Durumun boyutu (giriş)
         self.action_size = action_size  # Aksiyonların sayısı (çıkış)
+        self.target_update = target_update
+        self.target_update_every = target_update_every
+        self.tau = tau
+        self.architecture = architecture
         self.model = self._build_model()
 
-    def _build_model(self):
+        # Bootstrap hedefleri için dondurulmuş kopya (eğitilmez, sadece senkronize edilir)
+        self.target_model = None
+        if target_update is not None:
+            self.target_model = self._build_network()
+            self.target_model.set_weights(self.model.get_weights())
+        self.train_steps = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self._compiled_sync = tf.function(self._sync_target)
+        self._compiled_after_train_step = tf.function(self._after_train_step)
+
+        # Derlenmiş eğitim adımı (model.fit'in her çağrıdaki Keras yükü olmadan)
+        self._compiled_train_step = tf.function(self._train_step)
+
+        # Derlenmiş ileri geçiş (model.predict'in veri adaptörü ve callback yükü olmadan)
+        # uint8 grid gözlemleri grafa uint8 olarak aktarılır ve orada float32'ye çevrilir
+        self._compiled_forward = tf.function(
+            lambda states: self.model(tf.cast(states, tf.float32), training=False), reduce_retracing=True)
+
+    def _build_network(self):
         """
-        Sinir ağı modelini oluşturur
+        Sinir ağı katmanlarını oluşturur (derlemeden)
         """
-        model = tf.keras.Sequential([
+        if self.architecture == 'cnn':
+            return tf.keras.Sequential([
+                # Grid gözlemi 0-255 aralığında gelir
+                tf.keras.layers.Input(shape=tuple(self.state_size)),
+                tf.keras.layers.Rescaling(1.0 / 255),
+
+                # Yerel desenler (kafa çevresi, gövde kıvrımları)
+                tf.keras.layers.Conv2D(16, 3, padding='same', activation='relu'),
+                # Yarım çözünürlükte daha geniş bağlam
+                tf.keras.layers.Conv2D(32, 3, strides=2, padding='same', activation='relu'),
+
+                tf.keras.layers.Flatten(),
+                tf.keras.layers.Dense(128, activation='relu'),
+
+                # Çıkış katmanı
+                tf.keras.layers.Dense(self.action_size, activation='linear')
+            ])
+
+        return tf.keras.Sequential([
             # Giriş katmanı
             tf.keras.layers.Dense(64, input_dim=self.state_size, activation='relu'),
 
@@ -30,6 +85,12 @@ class DQNModel:
             tf.keras.layers.Dense(self.action_size, activation='linear')
         ])
 
+    def _build_model(self):
+        """
+        Sinir ağı modelini oluşturur
+        """
+        model = self._build_network()
+
         # Modeli derle
         model.compile(
             loss='mse',  # Mean Squared Error kayıp fonksiyonu
@@ -44,8 +105,144 @@ class DQNModel:
         """
         return self.model.predict(state, verbose=0)
 
-    def train(self, states, targets):
+    def q_values(self, states):
+        """
+        Durum grubu için Q-değerlerini düşük gecikmeli yoldan hesaplar
+        Args:
+            states: (B, state_size) durumlar
+        Returns:
+            np.ndarray: (B, action_size) Q-değerleri
+        """
+        return self._compiled_forward(_to_tensor(states)).numpy()
+
+    def predict_one(self, state):
+        """
+        Tek bir durum için Q-değerlerini hesaplar
+        Returns:
+            np.ndarray: (action_size,) Q-değerleri
+        """
+        return self.q_values(np.asarray(state)[None])[0]
+
+    def export_numpy(self):
+        """
+        Mevcut ağırlıkları TensorFlow'suz bir NumpyQNetwork'e aktarır
+        Sonraki eğitim adımları dışa aktarılan ağı güncellemez
+        """
+        if self.architecture != 'mlp':
+            raise ValueError("NumPy çıkarımı sadece 'mlp' mimarisini destekler")
+        layers = []
+        for layer in self.model.layers:
+            kernel, bias = layer.get_weights()
+            layers.append((kernel, bias, layer.activation.__name__))
+        return NumpyQNetwork(layers)
+
+    def train(self, states, targets, sample_weight=None):
         """
         Modeli verilen veri ile eğitir
         """
-        return self.model.fit(states, targets, epochs=1, verbose=0)
\ No newline at end of file
+        history = self.model.fit(states, targets, sample_weight=sample_weight, epochs=1, verbose=0)
+        # Hedef ağ olmasa da adım sayılır (ör. kontrol noktası ve derlenmiş yolla tutarlılık için)
+        self._compiled_after_train_step()
+        return history
+
+    def _train_step(self, states, actions, rewards, next_states, dones, gamma, weights):
+        """
+        Bellman hedefini hesaplar ve tek bir gradyan adımı uygular
+        states ve next_states tek bir ileri geçişte birlikte değerlendirilir
+        """
+        states = tf.cast(states, tf.float32)
+        next_states = tf.cast(next_states, tf.float32)
+        batch_size = tf.shape(states)[0]
+        with tf.GradientTape() as tape:
+            if self.target_model is None:
+                q_all = self.model(tf.concat([states, next_states], axis=0), training=True)
+                q_values = q_all[:batch_size]
+                next_q_values = tf.stop_gradient(q_all[batch_size:])
+            else:
+                q_values = self.model(states, training=True)
+                next_q_values = self.target_model(next_states, training=False)
+
+            # Oyun bittiyse hedef sadece ödüldür
+            targets = rewards + gamma * tf.reduce_max(next_q_values, axis=1) * (1.0 - dones)
+            chosen_q = tf.gather(q_values, actions, batch_dims=1)
+            td_errors = targets - chosen_q
+            # Öncelikli bellekte önem örneklemesi ağırlıkları, aksi halde 1
+            loss = tf.reduce_mean(weights * tf.square(td_errors))
+
+        variables = self.model.trainable_variables
+        gradients = tape.gradient(loss, variables)
+        self.model.optimizer.apply_gradients(zip(gradients, variables))
+        self._after_train_step()
+        return loss, td_errors
+
+    def _sync_target(self, tau):
+        """
+        Hedef ağı graf içinde günceller: hedef = tau * çevrimiçi + (1 - tau) * hedef
+        tau = 1 tam kopyadır
+        """
+        for target_var, online_var in zip(self.target_model.variables, self.model.variables):
+            target_var.assign(tau * online_var + (1.0 - tau) * target_var)
+
+    def _after_train_step(self):
+        """
+        Eğitim adımı sayacını artırır ve gerekirse hedef ağı senkronize eder
+        """
+        self.train_steps.assign_add(1)
+        if self.target_update == 'soft':
+            self._sync_target(self.tau)
+        elif self.target_update == 'hard':
+            if self.train_steps % self.target_update_every == 0:
+                self._sync_target(1.0)
+
+    def target_q_values(self, states):
+        """
+        Hedef ağın Q-değerlerini döndürür (hedef ağ yoksa çevrimiçi ağınkini)
+        """
+        if self.target_model is None:
+            return self.q_values(states)
+        return self.target_model(tf.cast(_to_tensor(states), tf.float32), training=False).numpy()
+
+    def update_target(self):
+        """
+        Hedef ağı hemen tam olarak kopyalar
+        """
+        if self.target_model is not None:
+            self._compiled_sync(tf.constant(1.0))
+
+    def train_step(self, states, actions, rewards, next_states, dones, gamma, weights=None):
+        """
+        Bir deneyim grubuyla derlenmiş (tf.function) eğitim adımını çalıştırır
+
+        Args:
+            states: (B, state_size) durumlar
+            actions: (B,) yapılan hareketler
+            rewards: (B,) alınan ödüller
+            next_states: (B, state_size) sonraki durumlar
+            dones: (B,) oyun bitti mi
+            gamma: Gelecek ödüllerin indirim katsayısı
+            weights: (B,) örnek başına kayıp ağırlıkları (varsayılan: hepsi 1)
+        Returns:
+            (loss, td_errors)
+        """
+        if weights is None:
+            weights = np.ones(len(actions), dtype=np.float32)
+
+        return self._compiled_train_step(
+            _to_tensor(states),
+            tf.convert_to_tensor(actions, dtype=tf.int32),
+            tf.convert_to_tensor(rewards, dtype=tf.float32),
+            _to_tensor(next_states),
+            tf.convert_to_tensor(dones, dtype=tf.float32),
+            tf.constant(gamma, dtype=tf.float32),
+            tf.convert_to_tensor(weights, dtype=tf.float32)
+        )
+
+
+def _to_tensor(states):
+    """
+    Durumları tensöre çevirir; uint8 grid gözlemleri uint8 kalır, diğerleri float32 olur
+    """
+    states = np.asarray(states)
+    if states.dtype != np.uint8:
+        states = states.astype(np.float32, copy=False)
+    return tf.convert_to_tensor(states)
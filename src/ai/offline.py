@@ -0,0 +1,124 @@
+import numpy as np
+from .episode_log import open_log
+from .actions import ABSOLUTE, RELATIVE, DIRECTION_TO_RELATIVE
+from ..game.snake import OPPOSITE_INDEX
+
+
+def read_chunks(paths, chunk_size, rng):
+    """
+    Kayıt dosyalarını chunk_size kayıtlık parçalara böler ve parçaları karışık sırayla okur
+    Her parça memmap'ten tek bir ardışık okumayla kopyalanır
+    Yields:
+        Yapılandırılmış kayıt dizileri
+    """
+    logs = [open_log(path)[1] for path in paths]
+    chunks = [(i, start) for i, log in enumerate(logs) for start in range(0, len(log), chunk_size)]
+    for j in rng.permutation(len(chunks)):
+        i, start = chunks[j]
+        yield np.array(logs[i][start:start + chunk_size])
+
+
+def shuffle_batches(chunks, batch_size, rng):
+    """
+    Her parçayı kendi içinde karıştırır ve batch_size'lık gruplara böler
+    Parça sonunda kalan kayıtlar bir sonraki parçaya aktarılır
+    """
+    leftover = None
+    for chunk in chunks:
+        if leftover is not None:
+            chunk = np.concatenate([leftover, chunk])
+        chunk = chunk[rng.permutation(len(chunk))]
+        end = len(chunk) - len(chunk) % batch_size
+        for start in range(0, end, batch_size):
+            yield chunk[start:start + batch_size]
+        leftover = chunk[end:] if end < len(chunk) else None
+    if leftover is not None:
+        yield leftover
+
+
+def to_training_batch(records, action_mode):
+    """
+    Kayıtları DQNModel.train_step'in beklediği dizilere çevirir
+    Returns:
+        states, actions, rewards, next_states, dones
+    """
+    prev = records['prev_direction'].astype(np.int64)
+    direction = records['direction'].astype(np.int64)
+    if action_mode == RELATIVE:
+        # Ters yöne basılmışsa yılan düz gitmiştir
+        direction = np.where(direction == np.array(OPPOSITE_INDEX)[prev], prev, direction)
+        actions = DIRECTION_TO_RELATIVE[prev, direction]
+    elif action_mode == ABSOLUTE:
+        actions = direction
+    else:
+        raise ValueError(f"Geçersiz aksiyon modu: {action_mode}")
+    return (records['state'], actions, records['reward'],
+            records['next_state'], records['done'].astype(np.float32))
+
+
+class OfflineTrainer:
+    """
+    Kaydedilmiş oyunlardan (insan veya ajan) ortam çalıştırmadan eğitim yapar
+    Kayıtlar bir üreteç zinciriyle akar: karışık parçalar -> karışık gruplar -> eğitim dizileri
+    """
+
+    def __init__(self, model, paths, action_mode=ABSOLUTE, batch_size=64, chunk_size=65536,
+                 gamma=0.99, seed=None):
+        """
+        Args:
+            model (DQNModel): Eğitilecek model
+            paths: Episode kayıt dosyalarının listesi
+            action_mode: Modelin aksiyon modu ('absolute' veya 'relative')
+            batch_size: Eğitim adımı başına geçiş sayısı
+            chunk_size: Diskten tek seferde okunup karıştırılan kayıt sayısı
+            gamma: Gelecek ödüllerin indirim katsayısı
+            seed: Karıştırma tohumu
+        """
+        self.model = model
+        self.paths = list(paths)
+        self.action_mode = action_mode
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.gamma = gamma
+        self.rng = np.random.default_rng(seed)
+
+        for path in self.paths:
+            header, _ = open_log(path)
+            if header['state_size'] != model.state_size:
+                raise ValueError(f"{path} durum boyutu {header['state_size']}, model {model.state_size} bekliyor")
+
+    def __len__(self):
+        """
+        Kayıtlardaki toplam geçiş sayısını döndürür
+        """
+        return sum(len(open_log(path)[1]) for path in self.paths)
+
+    def batches(self):
+        """
+        Tüm kayıtlardan bir epoch boyunca eğitim grupları üretir
+        """
+        chunks = read_chunks(self.paths, self.chunk_size, self.rng)
+        for records in shuffle_batches(chunks, self.batch_size, self.rng):
+            yield to_training_batch(records, self.action_mode)
+
+    def train(self, epochs=1, log_every=1000):
+        """
+        Modeli kayıtlar üzerinde verilen epoch sayısı kadar eğitir
+
+        Args:
+            epochs: Kayıtların üzerinden kaç kez geçileceği
+            log_every: Kaç eğitim adımında bir ortalama kaybın yazılacağı
+        Returns:
+            list: Epoch başına ortalama kayıp
+        """
+        epoch_losses = []
+        for epoch in range(epochs):
+            losses = []
+            for states, actions, rewards, next_states, dones in self.batches():
+                loss, _ = self.model.train_step(states, actions, rewards, next_states, dones, self.gamma)
+                losses.append(float(loss))
+                if log_every and len(losses) % log_every == 0:
+                    print(f'Epoch: {epoch}, Step: {len(losses)}, Loss: {np.mean(losses[-log_every:]):.4f}')
+            epoch_losses.append(float(np.mean(losses)) if losses else 0.0)
+            print(f'Epoch: {epoch}, Mean Loss: {epoch_losses[-1]:.4f}')
+        return epoch_losses
@@ -0,0 +1,238 @@
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+import numpy as np
+
+# Aktör süreçleri TensorFlow yüklemez: politika NumpyQNetwork ile çalıştırılır
+from .inference import NumpyQNetwork
+from .features import encode_state
+from .actions import ABSOLUTE, action_size, to_direction
+from ..game.game_state import GameState
+
+POLL_TIMEOUT = 1.0  # Kuyruk boşken aktörlerin hâlâ çalışıp çalışmadığı bu aralıkla kontrol edilir
+SHUTDOWN_TIMEOUT = 5.0  # Aktörlerin kendiliğinden kapanması için beklenen en uzun süre
+
+class SharedWeights:
+    """
+    Öğrenicinin yayınladığı ağırlıkları paylaşılan bellekte tutar
+    Aktörler sürüm numarası değiştiğinde ağırlıkları kilit altında kopyalar
+    """
+
+    def __init__(self, network, ctx):
+        """
+        Args:
+            network (NumpyQNetwork): Başlangıç ağırlıkları
+            ctx: multiprocessing bağlamı
+        """
+        flat = network.flatten()
+        self.layout = network.layout()
+        self.size = flat.size
+        self.shm = shared_memory.SharedMemory(create=True, size=flat.nbytes)
+        self.lock = ctx.Lock()
+        self.version = ctx.Value('L', 0, lock=False)
+        self.epsilon = ctx.Value('d', 1.0, lock=False)
+        self.publish(network)
+
+    def publish(self, network, epsilon=None):
+        """
+        Yeni ağırlıkları (ve istenirse epsilon'u) aktörlere yayınlar
+        """
+        flat = np.ndarray((self.size,), dtype=np.float32, buffer=self.shm.buf)
+        with self.lock:
+            flat[:] = network.flatten()
+            self.version.value += 1
+            if epsilon is not None:
+                self.epsilon.value = epsilon
+
+    def close(self):
+        """
+        Paylaşılan belleği serbest bırakır
+        """
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _actor_worker(layout, size, shm_name, lock, version, epsilon, transition_queue,
+                  stop_event, seed, chunk_size, refresh_every, rays, action_mode):
+    """
+    Aktör süreci: GameState episode'ları oynar ve geçişleri parça parça kuyruğa yollar
+    Her parça (states, actions, rewards, next_states, dones, bitmiş episode skorları) içerir;
+    diziler kuyrukta NumPy tamponları olarak serileştirilir (bkz. ParallelTrainer)
+    """
+    rng = np.random.default_rng(seed)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shared_flat = np.ndarray((size,), dtype=np.float32, buffer=shm.buf)
+
+    num_actions = action_size(action_mode)
+    network = None
+    local_version = -1
+    buffer = []
+    scores = []
+    steps = 0
+
+    game_state = GameState(seed=int(rng.integers(2 ** 32)))
+    state = encode_state(game_state, rays)
+
+    try:
+        while not stop_event.is_set():
+            # Ağırlıkları belirli aralıklarla tazele
+            if steps % refresh_every == 0 and version.value != local_version:
+                with lock:
+                    flat = shared_flat.copy()
+                    local_version = version.value
+                network = NumpyQNetwork.from_flat(layout, flat)
+
+            if rng.random() <= epsilon.value:
+                action = int(rng.integers(num_actions))
+            else:
+                action = network.act(state)
+
+            game_state.change_direction(to_direction(action, game_state.snake.direction, action_mode))
+            prev_score = game_state.score
+            if not game_state.update():
+                reward = 10 if game_state.won else -10
+                done = True
+            else:
+                reward = 10 if game_state.score > prev_score else 0
+                done = False
+
+            next_state = encode_state(game_state, rays)
+            buffer.append((state, action, reward, next_state, done))
+            steps += 1
+
+            if done:
+                scores.append(game_state.score)
+                game_state = GameState(seed=int(rng.integers(2 ** 32)))
+                state = encode_state(game_state, rays)
+            else:
+                state = next_state
+
+            if len(buffer) >= chunk_size:
+                states, actions, rewards, next_states, dones = map(np.array, zip(*buffer))
+                chunk = (states, actions, rewards, next_states, dones, scores)
+                buffer, scores = [], []
+                # Öğrenici yavaşsa bekle, ama durdurma isteğini kaçırma
+                while not stop_event.is_set():
+                    try:
+                        transition_queue.put(chunk, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+    finally:
+        shm.close()
+
+
+class ParallelTrainer:
+    """
+    Aktör/öğrenici eğitimi
+    Aktör süreçleri kendi GameState'lerini oynatır; öğrenici (bu süreç) ReplayMemory'ye
+    ve replay() adımına sahiptir ve ağırlıkları periyodik olarak paylaşılan belleğe yazar
+
+    Ağırlıklar her aktörün sık okuduğu tek bir tampon olduğu için paylaşılan bellektedir.
+    Geçişler ise bilerek mp.Queue ile taşınır: 256 geçişlik bir parçanın serileştirilmesi
+    ~65 µs sürer (geçiş başına ~0.25 µs); öğrenici aynı parça için varsayılan oranla
+    16 replay() yaptığından taşıma maliyeti ölçülemeyecek kadar küçüktür ve paylaşılan
+    bellek halka yuvalarının senkronizasyonuna gerek kalmaz.
+    """
+
+    def __init__(self, trainer, num_actors=None, chunk_size=256, refresh_every=200,
+                 publish_every=100, transitions_per_replay=16, rays=False, action_mode=ABSOLUTE):
+        """
+        Args:
+            trainer (Trainer): Ajanı ve skor geçmişini tutan eğitici
+            num_actors: Aktör süreci sayısı (varsayılan: CPU sayısı - 1)
+            chunk_size: Aktörlerin kuyruğa tek seferde yolladığı geçiş sayısı
+            refresh_every: Aktörlerin kaç adımda bir yeni ağırlık kontrolü yaptığı
+            publish_every: Öğrenicinin kaç replay() adımında bir ağırlık yayınladığı
+            transitions_per_replay: Kaç yeni geçiş başına bir replay() yapılacağı; 1 olursa
+                öğrenici her geçişi beklediği için aktörler hiç öne geçemez
+            rays: Aktörlerin durumlara ışın özelliklerini ekleyip eklemeyeceği
+            action_mode: Aktörlerin aksiyon modu ('absolute' veya 'relative')
+        """
+        self.trainer = trainer
+        self.num_actors = num_actors or max(1, mp.cpu_count() - 1)
+        self.chunk_size = chunk_size
+        self.refresh_every = refresh_every
+        self.publish_every = publish_every
+        self.transitions_per_replay = transitions_per_replay
+        self.rays = rays
+        self.action_mode = action_mode
+
+    def train(self, episodes=None, log_every=100, seed=0):
+        """
+        Aktörleri başlatır ve istenen episode sayısına ulaşılana kadar öğrenir
+        """
+        trainer = self.trainer
+        agent = trainer.agent
+        if episodes is None:
+            episodes = trainer.episodes
+
+        # TensorFlow yüklü süreçte fork güvenli değil
+        ctx = mp.get_context('spawn')
+        weights = SharedWeights(agent.model.export_numpy(), ctx)
+        weights.epsilon.value = agent.epsilon
+        transition_queue = ctx.Queue(maxsize=4 * self.num_actors)
+        stop_event = ctx.Event()
+
+        actors = [
+            ctx.Process(
+                target=_actor_worker,
+                args=(weights.layout, weights.size, weights.shm.name, weights.lock, weights.version,
+                      weights.epsilon, transition_queue, stop_event, seed + i,
+                      self.chunk_size, self.refresh_every, self.rays, self.action_mode),
+                daemon=True
+            )
+            for i in range(self.num_actors)
+        ]
+        for actor in actors:
+            actor.start()
+
+        episode = len(trainer.scores)  # Geri yüklenen eğitim kaldığı yerden devam eder
+        pending = 0  # Henüz replay'e dönüşmemiş geçiş sayısı
+        replays = 0
+        try:
+            while episode < episodes:
+                try:
+                    chunk = transition_queue.get(timeout=POLL_TIMEOUT)
+                except queue.Empty:
+                    # Tüm aktörler çöktüyse kuyruğa bir daha veri gelmez
+                    if not any(actor.is_alive() for actor in actors):
+                        codes = ', '.join(str(actor.exitcode) for actor in actors)
+                        raise RuntimeError(f"Tüm aktör süreçleri sonlandı (çıkış kodları: {codes})")
+                    continue
+                states, actions, rewards, next_states, dones, scores = chunk
+
+                agent.remember_batch(states, actions, rewards, next_states, dones)
+
+                pending += len(actions)
+                while pending >= self.transitions_per_replay:
+                    agent.replay()
+                    pending -= self.transitions_per_replay
+                    replays += 1
+                    if replays % self.publish_every == 0:
+                        weights.publish(agent.model.export_numpy(), agent.epsilon)
+
+                for score in scores:
+                    if episode < episodes:
+                        trainer._finish_episode(episode, score, log_every, verbose=False)
+                        episode += 1
+                weights.epsilon.value = agent.epsilon
+        finally:
+            stop_event.set()
+            # Kuyrukta bekleyen parçaları boşalt ki put() bekleyen aktörler kapanabilsin;
+            # süre dolduğunda hâlâ çalışan (ör. takılmış) aktörler sonlandırılır
+            deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+            while any(actor.is_alive() for actor in actors) and time.monotonic() < deadline:
+                try:
+                    transition_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            for actor in actors:
+                if actor.is_alive():
+                    actor.terminate()
+                    actor.join(timeout=POLL_TIMEOUT)
+                if actor.is_alive():
+                    actor.kill()  # SIGTERM'e yanıt vermeyen (ör. durdurulmuş) süreç
+                actor.join()
+            weights.close()
@@ -0,0 +1,183 @@
+import time
+from collections import OrderedDict
+import numpy as np
+from .features import encode_state
+from .actions import ABSOLUTE, action_size, to_direction
+from ..game.snake import DIRECTION_INDEX, OPPOSITE_INDEX
+
+
+class _Node:
+    """
+    Arama ağacı düğümü
+    """
+    __slots__ = ('game_state', 'reward', 'done', 'leaf_value', 'children')
+
+    def __init__(self, game_state, reward, done):
+        self.game_state = game_state
+        self.reward = reward
+        self.done = done
+        self.leaf_value = 0.0  # Ağın bu durum için tahmini değeri (max Q)
+        self.children = []  # (aksiyon, _Node) çiftleri
+
+
+class LookaheadPlanner:
+    """
+    GameState ardılları üzerinde derinlik sınırlı arama yapan planlayıcı
+    Her genişletme turunun yaprakları DQN ile tek bir ileri geçişte değerlendirilir,
+    değerlendirmeler GameState.key() (Zobrist) anahtarlı LRU transpozisyon tablosunda saklanır
+    """
+
+    def __init__(self, evaluator, action_mode=ABSOLUTE, rays=False, depth=3, gamma=0.99,
+                 node_budget=2000, time_budget=None, table_size=100000, observer=None):
+        """
+        Args:
+            evaluator: (N, state_size) durumlar için (N, action_size) Q-değerleri döndüren çağrılabilir
+                (ör. DQNModel.q_values veya NumpyQNetwork)
+            action_mode: Aksiyon modu ('absolute' veya 'relative')
+            rays: Durum vektörüne ışın özellikleri eklensin mi (modelle aynı olmalı)
+            depth: Maksimum arama derinliği
+            gamma: Gelecek ödüllerin indirim katsayısı
+            node_budget: Hamle başına genişletilecek maksimum düğüm sayısı
+            time_budget: Hamle başına maksimum süre (saniye, None: sınırsız)
+            table_size: Transpozisyon tablosunun maksimum kayıt sayısı
+            observer: Verilirse durumlar bu gözlemciyle üretilir (ör. grid modeli için GridObserver)
+        """
+        model = getattr(evaluator, '__self__', None)  # DQNModel.q_values gibi bağlı metotlar
+        if observer is None and getattr(model, 'architecture', None) == 'cnn':
+            raise ValueError("Grid (cnn) modeliyle planlama için observer=GridObserver() verilmelidir")
+        self.evaluator = evaluator
+        self.action_mode = action_mode
+        self.rays = rays
+        self.depth = depth
+        self.gamma = gamma
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.table_size = table_size
+        self.observer = observer
+        self.table = OrderedDict()  # Zobrist anahtarı -> yaprak değeri
+        self.nodes = 0  # Son act() çağrısında oluşturulan düğüm sayısı
+
+    def act(self, game_state):
+        """
+        Verilen oyun durumu için en iyi aksiyonu arar
+        Args:
+            game_state (GameState): Mevcut oyun (değiştirilmez)
+        Returns:
+            int: Aksiyon indeksi
+        """
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        root = _Node(game_state, 0.0, False)
+        self.nodes = 0
+        # İlk tur süreden bağımsız tamamlanır: aksiyon seçmek için kökün çocukları gerekir
+        frontier = self._expand([root])
+        self._evaluate(frontier)
+
+        for _ in range(1, self.depth):
+            expandable = [node for node in frontier if not node.done]
+            if not expandable:
+                break
+            if self.nodes + len(expandable) * action_size(self.action_mode) > self.node_budget:
+                break
+            frontier = self._expand(expandable, deadline)
+            if self._expired(deadline):
+                # Değerlendirilemeyen tur geri alınır; düğümler ağın tahminine döner
+                for node in expandable:
+                    node.children = []
+                break
+            self._evaluate(frontier)
+
+        values = [(self._backup(child), action) for action, child in root.children]
+        return max(values)[1]
+
+    @staticmethod
+    def _expired(deadline):
+        """
+        Hamle süresi dolduysa True döndürür
+        """
+        return deadline is not None and time.perf_counter() > deadline
+
+    def _expand(self, nodes, deadline=None):
+        """
+        Düğümlerin tüm ardıllarını oluşturur
+        Aynı yöne çıkan aksiyonlar (ör. mutlak modda ters yön) tek kez simüle edilir
+        Süre dolarsa kalan düğümler genişletilmeden bırakılır
+        Returns:
+            Yeni oluşturulan düğümler
+        """
+        created = []
+        for node in nodes:
+            if self._expired(deadline):
+                break
+            by_direction = {}
+            current = DIRECTION_INDEX[node.game_state.snake.direction]
+            for action in range(action_size(self.action_mode)):
+                direction = to_direction(action, node.game_state.snake.direction, self.action_mode)
+                effective = DIRECTION_INDEX[direction]
+                if effective == OPPOSITE_INDEX[current]:
+                    effective = current  # Ters yön yok sayılır
+
+                child = by_direction.get(effective)
+                if child is None:
+                    child_state = node.game_state.clone()
+                    child_state.change_direction(direction)
+                    prev_score = child_state.score
+                    if not child_state.update():
+                        reward, done = (10.0 if child_state.won else -10.0), True
+                    else:
+                        reward, done = (10.0 if child_state.score > prev_score else 0.0), False
+                    child = _Node(child_state, reward, done)
+                    by_direction[effective] = child
+                    created.append(child)
+                node.children.append((action, child))
+
+        self.nodes += len(created)
+        return created
+
+    def _evaluate(self, nodes):
+        """
+        Terminal olmayan düğümlerin değerini hesaplar
+        Tabloda olmayanlar tek bir toplu ileri geçişte değerlendirilir
+        """
+        misses = []
+        for node in nodes:
+            if node.done:
+                continue
+            key = node.game_state.key()
+            value = self.table.get(key)
+            if value is None:
+                misses.append((key, node))
+            else:
+                self.table.move_to_end(key)
+                node.leaf_value = value
+
+        if not misses:
+            return
+
+        states = np.stack([self._encode(node.game_state) for _, node in misses])
+        values = np.max(self.evaluator(states), axis=1)
+        for (key, node), value in zip(misses, values):
+            node.leaf_value = float(value)
+            self.table[key] = node.leaf_value
+            if len(self.table) > self.table_size:
+                self.table.popitem(last=False)
+
+    def _encode(self, game_state):
+        """
+        Düğümün durumunu modelin girdisine çevirir
+        """
+        if self.observer is None:
+            return encode_state(game_state, self.rays)
+        # Düğümler ardışık adımlar değildir: damgalar her düğümde gövdeden yeniden kurulur
+        self.observer.reset(game_state)
+        return self.observer.observe(game_state)
+
+    def _backup(self, node):
+        """
+        Düğüm değerini alt ağaçtan geri yayar: ödül + gamma * en iyi çocuk değeri
+        Genişletilmemiş düğümlerde ağın tahmini kullanılır
+        """
+        if node.done:
+            return node.reward
+        if not node.children:
+            return node.reward + self.gamma * node.leaf_value
+        return node.reward + self.gamma * max(self._backup(child) for _, child in node.children)
@@ -0,0 +1,329 @@
+from collections import deque
+from functools import lru_cache, partial
+import numpy as np
+from .features import encode_state
+from .actions import ABSOLUTE, to_action, to_direction
+from ..game.game_state import GameState
+from ..game.snake import DIRECTIONS, DIRECTION_INDEX
+from ..game.constants import GRID_WIDTH, GRID_HEIGHT
+
+# Hücreler düz indekslerle tutulur: y * width + x
+# Tablolar tahta boyutu başına bir kez hesaplanır ve önbelleğe alınır
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(width, height):
+    """
+    Her hücrenin DIRECTIONS sırasındaki komşularını döndürür (tahta dışı: -1)
+    Returns:
+        tuple: hücre -> (UP, DOWN, LEFT, RIGHT) komşu hücreleri
+    """
+    table = []
+    for y in range(height):
+        for x in range(width):
+            row = []
+            for direction in DIRECTIONS:
+                nx, ny = x + direction.value[0], y + direction.value[1]
+                row.append(ny * width + nx if 0 <= nx < width and 0 <= ny < height else -1)
+            table.append(tuple(row))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def cycle_tables(width, height):
+    """
+    Tüm hücrelerden bir kez geçen kapalı bir yol (Hamilton döngüsü) oluşturur
+    Sütunlar 1..height-1 satırlarında zikzak yapar, 0. satır dönüş yoludur
+    Returns:
+        (cycle, order): sıra -> hücre ve hücre -> sıra tabloları
+    """
+    if width % 2:
+        if height % 2:
+            raise ValueError("Hamilton döngüsü için genişlik veya yükseklik çift olmalı")
+        # Yüksekliği çift olan tahtada döngü devrik tahtadan alınır
+        cycle = [(c % height) * width + c // height for c in cycle_tables(height, width)[0]]
+    else:
+        cycle = []
+        for x in range(width):
+            rows = range(1, height) if x % 2 == 0 else range(height - 1, 0, -1)
+            cycle.extend(y * width + x for y in rows)
+        cycle.extend(x for x in range(width - 1, -1, -1))
+
+    order = [0] * len(cycle)
+    for i, cell in enumerate(cycle):
+        order[cell] = i
+    return tuple(cycle), tuple(order)
+
+
+class BFSAgent:
+    """
+    Yeme en kısa yoldan giden açgözlü ajan
+    Her aday hamle, hamleden sonra kafanın ulaşabildiği alan yılanın boyundan
+    küçük kalıyorsa (flood fill) güvensiz sayılır
+    Arama tamponları hamleler arasında yeniden kullanılır: ziyaret işaretleri her aramada
+    artan bir nesil numarasıyla karşılaştırılır, böylece her adımda sıfırlanmaları gerekmez
+    """
+
+    def __init__(self, action_mode=ABSOLUTE, width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Args:
+            action_mode: Döndürülecek aksiyonların modu ('absolute' veya 'relative')
+            width, height: Tahta boyutu
+        """
+        self.action_mode = action_mode
+        self.width = width
+        self.height = height
+        self.neighbors = neighbor_table(width, height)
+
+        cells = width * height
+        self.blocked = bytearray(cells)  # Hamleler arasında tamamen sıfırdır
+        self.distance = [0] * cells
+        self.reached = [0] * cells  # BFS'in hücreye ulaştığı nesil
+        self.seen = [0] * cells  # Alan sayımının hücreyi gördüğü nesil
+        self.target = [0] * cells  # Mesafesi gereken (kafaya komşu) hücrelerin nesli
+        self.queue = [0] * cells  # BFS kuyruğu ve alan sayımı yığını
+        self.generation = 0
+
+    def act(self, game_state):
+        """
+        Verilen oyun durumu için bir aksiyon seçer
+        Args:
+            game_state (GameState): Mevcut oyun (değiştirilmez)
+        Returns:
+            int: Aksiyon indeksi
+        """
+        snake = game_state.snake
+        width = self.width
+        neighbors = self.neighbors
+        blocked = self.blocked
+        occupied = [y * width + x for x, y in snake.occupied]
+        for cell in occupied:
+            blocked[cell] = 1
+
+        hx, hy = snake.body[0]
+        tx, ty = snake.body[-1]
+        fx, fy = game_state.food.position
+        head, tail, food = hy * width + hx, ty * width + tx, fy * width + fx
+        length = len(snake.body)
+
+        candidates = [cell for cell in neighbors[head] if cell >= 0 and not blocked[cell]]
+        generation = self._distances(food, candidates)
+        best, best_key = None, None
+        for direction_index, cell in enumerate(neighbors[head]):
+            if cell < 0 or blocked[cell]:
+                continue
+
+            # Hamleden sonraki gövde: yeni kafa eklenir, yem yenmediyse kuyruk boşalır
+            blocked[cell] = 1
+            if cell != food and snake.occupied[snake.body[-1]] == 1:
+                blocked[tail] = 0
+            area = self._area(cell, length + 1)
+            blocked[cell] = 0
+            blocked[tail] = 1
+
+            safe = area > length
+            steps = self.distance[cell] if self.reached[cell] == generation else len(blocked)
+            key = (safe, -steps if safe else area, area)
+            if best_key is None or key > best_key:
+                best, best_key = direction_index, key
+
+        for cell in occupied:
+            blocked[cell] = 0
+
+        if best is None:
+            best = DIRECTION_INDEX[snake.direction]  # Her yön kapalı
+        return to_action(best, snake.direction, self.action_mode)
+
+    def _distances(self, source, targets):
+        """
+        Kaynaktan boş hücrelere BFS mesafelerini self.distance'a yazar
+        BFS hücrelere artan mesafe sırasıyla ulaştığı için tüm hedeflere ulaşınca durur
+        Returns:
+            int: Aramanın nesli; reached[cell] bu nesle eşit değilse hücreye ulaşılamamıştır
+        """
+        self.generation += 1
+        generation = self.generation
+        blocked, distance, reached, queue = self.blocked, self.distance, self.reached, self.queue
+        neighbors, target = self.neighbors, self.target
+        remaining = 0
+        for cell in targets:
+            target[cell] = generation
+            remaining += 1
+        if target[source] == generation:
+            remaining -= 1
+        distance[source] = 0
+        reached[source] = generation
+        queue[0] = source
+        read, write = 0, 1
+        while read < write and remaining:
+            cell = queue[read]
+            read += 1
+            step = distance[cell] + 1
+            for neighbor in neighbors[cell]:
+                if neighbor >= 0 and not blocked[neighbor] and reached[neighbor] != generation:
+                    distance[neighbor] = step
+                    reached[neighbor] = generation
+                    queue[write] = neighbor
+                    write += 1
+                    if target[neighbor] == generation:
+                        remaining -= 1
+        return generation
+
+    def _area(self, start, limit):
+        """
+        start'ın komşularından ulaşılabilen boş hücre sayısını sayar
+        Sayım limit'e ulaşınca durur (daha fazlası karar için gereksiz)
+        """
+        self.generation += 1
+        generation = self.generation
+        blocked, seen, stack = self.blocked, self.seen, self.queue
+        neighbors = self.neighbors
+        stack[0] = start
+        top = 1
+        count = 0
+        while top and count < limit:
+            top -= 1
+            cell = stack[top]
+            for neighbor in neighbors[cell]:
+                if neighbor >= 0 and not blocked[neighbor] and seen[neighbor] != generation:
+                    seen[neighbor] = generation
+                    count += 1
+                    stack[top] = neighbor
+                    top += 1
+        return count
+
+
+class HamiltonianAgent:
+    """
+    Hamilton döngüsünü izleyen ajan; yılan kısa iken yeme kestirme yapar
+    Kestirme sadece döngüde kafa ile kuyruk arasındaki boş bölgeye atlar,
+    böylece gövde döngü sırasında kalır ve tahta her zaman doldurulabilir
+    """
+
+    def __init__(self, action_mode=ABSOLUTE, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 shortcut_until=0.5, margin=3):
+        """
+        Args:
+            action_mode: Döndürülecek aksiyonların modu ('absolute' veya 'relative')
+            width, height: Tahta boyutu (en az biri çift olmalı)
+            shortcut_until: Yılan tahtanın bu oranını doldurunca kestirmeler kapanır
+            margin: Kestirmede kuyrukla arada bırakılacak en az hücre sayısı
+        """
+        self.action_mode = action_mode
+        self.width = width
+        self.height = height
+        self.neighbors = neighbor_table(width, height)
+        self.cycle, self.order = cycle_tables(width, height)
+        self.max_shortcut_length = int(shortcut_until * width * height)
+        self.margin = margin
+
+    def act(self, game_state):
+        """
+        Verilen oyun durumu için bir aksiyon seçer
+        Args:
+            game_state (GameState): Mevcut oyun (değiştirilmez)
+        Returns:
+            int: Aksiyon indeksi
+        """
+        snake = game_state.snake
+        width = self.width
+        order = self.order
+        cells = len(order)
+
+        hx, hy = snake.body[0]
+        head = order[hy * width + hx]
+        tx, ty = snake.body[-1]
+        fx, fy = game_state.food.position
+        # Döngü üzerinde kafanın kaç adım ilerisinde oldukları
+        to_tail = (order[ty * width + tx] - head) % cells
+        to_food = (order[fy * width + fx] - head) % cells
+
+        best, best_ahead = None, 0
+        shortcuts = len(snake.body) < self.max_shortcut_length
+        for direction_index, cell in enumerate(self.neighbors[hy * width + hx]):
+            if cell < 0 or snake.occupied.get((cell % width, cell // width)):
+                continue
+            ahead = (order[cell] - head) % cells
+            if ahead == 1:
+                if best is None:
+                    best, best_ahead = direction_index, ahead
+                continue
+            if (shortcuts and ahead > best_ahead and ahead <= to_food
+                    and ahead < to_tail - self.margin):
+                best, best_ahead = direction_index, ahead
+
+        if best is None:
+            best = DIRECTION_INDEX[snake.direction]  # Her yön kapalı
+        return to_action(best, snake.direction, self.action_mode)
+
+
+def generate_demonstrations(agent, transitions, rays=False, seed=None, max_episode_steps=None,
+                            observer=None, episodes=None):
+    """
+    Betik ajanın oynadığı oyunlardan geçişler üretir
+    Ödüller Trainer._train_step ile aynıdır: yem/kazanma +10, çarpışma -10
+
+    Args:
+        agent: act(game_state) metodu olan ajan (BFSAgent, HamiltonianAgent, ...)
+        transitions: Üretilecek geçiş sayısı
+        rays: Durum vektörüne ışın özellikleri eklensin mi
+        seed: Oyunların tohumu (None: rastgele)
+        max_episode_steps: Döngüye giren episode'lar için adım sınırı
+            (varsayılan: hücre sayısının 100 katı)
+        observer: Verilirse durumlar observer.observe(game_state) ile üretilir (ör. GridObserver)
+        episodes: Verilirse biten her episode için (skor, kazanıldı mı) bu listeye eklenir
+    Yields:
+        (state, action, reward, next_state, done)
+    """
+    rng = np.random.default_rng(seed)
+    encode = observer.observe if observer is not None else partial(encode_state, rays=rays)
+    if max_episode_steps is None:
+        max_episode_steps = 100 * GRID_WIDTH * GRID_HEIGHT
+
+    produced = 0
+    while produced < transitions:
+        game_state = GameState(seed=int(rng.integers(2 ** 32)))
+        state = encode(game_state)
+        for _ in range(max_episode_steps):
+            action = agent.act(game_state)
+            game_state.change_direction(
+                to_direction(action, game_state.snake.direction, agent.action_mode))
+            prev_score = game_state.score
+            if not game_state.update():
+                reward = 10 if game_state.won else -10
+                done = True
+            else:
+                reward = 10 if game_state.score > prev_score else 0
+                done = False
+
+            next_state = encode(game_state)
+            if done and episodes is not None:
+                episodes.append((game_state.score, game_state.won))
+            yield state, action, reward, next_state, done
+            produced += 1
+            if done or produced >= transitions:
+                break
+            state = next_state
+
+
+def prefill_memory(memory, agent, transitions, rays=False, seed=None, observer=None):
+    """
+    ReplayMemory'yi betik ajanın gösterimleriyle doldurur
+
+    Args:
+        memory: add() metodu olan bellek (ReplayMemory veya DQNAgent.memory)
+        agent: act(game_state) metodu olan ajan
+        transitions: Eklenecek geçiş sayısı
+        rays: Durum vektörüne ışın özellikleri eklensin mi (modelle aynı olmalı)
+        seed: Oyunların tohumu
+        observer: Verilirse durumlar bu gözlemciyle üretilir (modelle aynı olmalı)
+    Returns:
+        (scores, wins): Tamamlanan episode'ların skorları (GameState.score) ve kazanılan episode sayısı
+    """
+    episodes = []
+    for state, action, reward, next_state, done in generate_demonstrations(
+            agent, transitions, rays=rays, seed=seed, observer=observer, episodes=episodes):
+        memory.add(state, action, reward, next_state, done)
+    scores = [score for score, _ in episodes]
+    wins = sum(won for _, won in episodes)
+    return scores, wins
@@ -1,99 +1,403 @@
+import os
+import threading
+import time
+from contextlib import nullcontext
+from functools import partial
 import numpy as np
 from .agent import DQNAgent
 from ..game.game_state import GameState
-from ..game.snake import Direction
+from ..game.vec_env import VecSnakeEnv
+from .features import encode_batch, encode_state, feature_size
+from .grid_observer import GridObserver, grid_shape
+from .actions import ABSOLUTE, action_size, to_direction, to_direction_index
+from ..game.snake import DIRECTION_INDEX, OPPOSITE_INDEX
+
+
+OBSERVATIONS = ('features', 'grid')
 
 
 class Trainer:
-    def __init__(self):
+    def __init__(self, episodes=1000, rays=False, action_mode=ABSOLUTE,
+                 checkpoint_dir=None, checkpoint_every=0, checkpoint_memory=True,
+                 memory_size=10000, memory_dir=None, record_path=None, observation='features',
+                 video_dir=None, video_every=0, video_format='gif'):
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"Geçersiz gözlem tipi: {observation}")
+        if observation == 'grid' and record_path is not None:
+            raise ValueError("Episode kaydı sadece özellik vektörü gözlemini destekler")
+
         self.game_state = GameState()
-        self.width = 40
-        self.height = 30
-        self.state_size = 11
-        self.action_size = 4
-        self.episodes = 1000
-        self.agent = DQNAgent(self.state_size, self.action_size)
+        self.rays = rays  # Durum vektörüne ışın özellikleri eklensin mi
+        self.action_mode = action_mode  # 'absolute' (4 yön) veya 'relative' (düz/sağ/sol)
+        # 'features': 11 (ışınlarla 17) özellik + MLP, 'grid': (H, W, 3) uint8 grid + CNN
+        self.observation = observation
+        self.observer = GridObserver() if observation == 'grid' else None
+        self.state_size = grid_shape() if observation == 'grid' else feature_size(rays)
+        self.action_size = action_size(action_mode)
+        self.episodes = episodes
+        # memory_dir verilirse bellek disk üzerinde tutulur ve oturumlar arasında büyür
+        # Grid gözlemleri bellekte uint8 saklanır (float32'nin dörtte biri)
+        if observation == 'grid':
+            self.agent = DQNAgent(self.state_size, self.action_size, memory_size=memory_size,
+                                  memory_dir=memory_dir, architecture='cnn', state_dtype=np.uint8)
+        else:
+            self.agent = DQNAgent(self.state_size, self.action_size, memory_size=memory_size,
+                                  memory_dir=memory_dir)
         self.scores = []
         self.mean_scores = []
 
-    def _get_right_direction(self, direction):
-        """Verilen yönün sağındaki yönü döndürür"""
-        if direction == Direction.UP:
-            return Direction.RIGHT
-        elif direction == Direction.RIGHT:
-            return Direction.DOWN
-        elif direction == Direction.DOWN:
-            return Direction.LEFT
-        return Direction.UP
-
-    def _get_left_direction(self, direction):
-        """Verilen yönün solundaki yönü döndürür"""
-        if direction == Direction.UP:
-            return Direction.LEFT
-        elif direction == Direction.LEFT:
-            return Direction.DOWN
-        elif direction == Direction.DOWN:
-            return Direction.RIGHT
-        return Direction.UP
-
-    def _is_direction_dangerous(self, game_state, direction):
-        """Belirli bir yönün tehlikeli olup olmadığını kontrol eder"""
-        snake = game_state.snake
-        head = snake.get_head()
-        next_pos = (
-            head[0] + direction.value[0],
-            head[1] + direction.value[1]
-        )
-
-        # Duvar kontrolü
-        if (next_pos[0] < 0 or next_pos[0] >= self.width or
-                next_pos[1] < 0 or next_pos[1] >= self.height):
-            return True
-
-        # Kuyruk kontrolü
-        if next_pos in snake.body[1:]:
-            return True
-
-        return False
+        # Kontrol noktaları: checkpoint_every episode'da bir ve hata olduğunda yazılır
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_memory = checkpoint_memory  # ReplayMemory de kaydedilsin mi
+        self.checkpoint_thread = None  # Arka planda yazılmakta olan kontrol noktası
+
+        # Verilirse her geçiş çevrimdışı eğitim için episode kaydına eklenir
+        self.recorder = None
+        if record_path is not None:
+            from .episode_log import EpisodeLogWriter
+            self.recorder = EpisodeLogWriter(record_path, rays=rays, source='agent')
+
+        # Verilirse her video_every episode'da bir oyun ekran açmadan GIF'e ('gif') veya
+        # PNG dizisine ('png') kaydedilir (train_headless ve pencereli eğitimde)
+        if video_format not in ('gif', 'png'):
+            raise ValueError(f"Geçersiz video formatı: {video_format}")
+        self.video_dir = video_dir
+        self.video_every = video_every
+        self.video_format = video_format
+
+    def save_checkpoint(self, background=False):
+        """
+        Model, optimizer, epsilon, skorlar, RNG durumları ve (istenirse) belleği kaydeder
+        Args:
+            background: True ise bellek dosyaları arka planda yazılır (periyodik kayıtlar)
+        Returns:
+            str: Yazılan kontrol noktasının yolu
+        """
+        from .checkpoint import save_checkpoint
+        return save_checkpoint(self, self.checkpoint_dir, include_memory=self.checkpoint_memory,
+                               background=background)
+
+    def wait_checkpoint(self):
+        """
+        Arka planda yazılmakta olan kontrol noktası varsa bitmesini bekler
+        """
+        from .checkpoint import wait_checkpoint
+        wait_checkpoint(self)
+
+    def load_checkpoint(self, path=None):
+        """
+        Kaydedilmiş eğitimi geri yükler; eğitim döngüleri kalan episode'lardan devam eder
+        Args:
+            path: Kontrol noktası veya kontrol noktası dizini (varsayılan: checkpoint_dir)
+        Returns:
+            str: Yüklenen kontrol noktasının yolu
+        """
+        from .checkpoint import load_checkpoint
+        return load_checkpoint(self, path if path is not None else self.checkpoint_dir)
+
+    def close(self):
+        """
+        Disk üzerindeki belleği, episode kaydını ve bekleyen kontrol noktasını (varsa) diske yazar
+        """
+        self.wait_checkpoint()
+        if hasattr(self.agent.memory, 'flush'):
+            self.agent.memory.flush()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def _episode_video(self, episode, game_state):
+        """
+        Episode kaydedilecekse ilk karesi yakalanmış bir EpisodeRecorder döndürür
+        Returns:
+            with ile kullanılacak kaydedici; kayıt yoksa None veren boş bağlam
+        """
+        if not self.video_every or self.video_dir is None or episode % self.video_every != 0:
+            return nullcontext()
+        from ..ui.video import EpisodeRecorder
+        os.makedirs(self.video_dir, exist_ok=True)
+        name = f'episode-{episode:08d}' + ('.gif' if self.video_format == 'gif' else '')
+        video = EpisodeRecorder(os.path.join(self.video_dir, name))
+        video.capture(game_state)
+        return video
+
+    def _save_on_error(self):
+        """
+        Eğitim bir hatayla kesildiğinde ilerlemeyi kaydeder
+        """
+        if self.checkpoint_dir is None:
+            return
+        try:
+            self.wait_checkpoint()
+        except Exception as e:
+            print(f"Önceki kontrol noktası yazılamadı: {e}")
+        try:
+            print(f"Eğitim kesildi, kontrol noktası yazıldı: {self.save_checkpoint()}")
+        except Exception as e:
+            print(f"Kontrol noktası yazılamadı: {e}")
 
     def get_state(self, game_state):
         """Oyun durumunu AI'ın anlayabileceği formata çevirir"""
-        snake = game_state.snake
-        food = game_state.food
-        head = snake.get_head()
-
-        # Tehlike kontrolü
-        danger_straight = self._is_direction_dangerous(game_state, snake.direction)
-        danger_right = self._is_direction_dangerous(game_state, self._get_right_direction(snake.direction))
-        danger_left = self._is_direction_dangerous(game_state, self._get_left_direction(snake.direction))
-
-        # Yem yönü
-        food_left = food.position[0] < head[0]
-        food_right = food.position[0] > head[0]
-        food_up = food.position[1] < head[1]
-        food_down = food.position[1] > head[1]
-
-        return np.array([
-            danger_straight,
-            danger_right,
-            danger_left,
-            snake.direction == Direction.UP,
-            snake.direction == Direction.DOWN,
-            snake.direction == Direction.LEFT,
-            snake.direction == Direction.RIGHT,
-            food_left,
-            food_right,
-            food_up,
-            food_down
-        ], dtype=int)
+        if self.observer is not None:
+            # Grid gözlemcisi aynı oyunun ardışık adımlarını artımlı olarak izler
+            return self.observer.observe(game_state)
+        return encode_state(game_state, rays=self.rays)
+
+    def _require_features(self, mode):
+        """
+        Sadece özellik vektörünü destekleyen eğitim modlarında grid gözlemini reddeder
+        """
+        if self.observation != 'features':
+            raise ValueError(f"{mode} sadece özellik vektörü gözlemini destekler")
+
+    def _train_step(self, game_state, state):
+        """
+        Tek bir oyun adımı oynar, deneyimi belleğe kaydeder ve ağı eğitir
+
+        Returns:
+            (next_state, reward, done)
+        """
+        action = self.agent.act(state)
+        prev_direction = DIRECTION_INDEX[game_state.snake.direction]
+        game_state.change_direction(to_direction(action, game_state.snake.direction, self.action_mode))
+
+        prev_score = game_state.score
+        if not game_state.update():
+            # Tahtayı doldurmak ödüllendirilir, çarpışma cezalandırılır
+            reward = 10 if game_state.won else -10
+            done = True
+        else:
+            reward = 10 if game_state.score > prev_score else 0
+            done = False
+
+        next_state = self.get_state(game_state)
+        self.agent.remember(state, action, reward, next_state, done)
+        if self.recorder is not None:
+            self.recorder.record(state, prev_direction, DIRECTION_INDEX[game_state.snake.direction],
+                                 reward, next_state, done)
+        self.agent.replay()
+        return next_state, reward, done
+
+    def _finish_episode(self, episode, score, log_every=100, verbose=True):
+        """Episode sonu istatistiklerini günceller ve epsilon'u azaltır"""
+        self.scores.append(score)
+        mean_score = np.mean(self.scores[-100:])
+        self.mean_scores.append(mean_score)
+        self.agent.end_episode(verbose=verbose)  # Episode sonunda epsilon güncelle
+
+        if log_every and episode % log_every == 0:
+            print(
+                f'Episode: {episode}, Score: {score}, Average Score: {mean_score:.2f}, Epsilon: {self.agent.epsilon:.2f}')
+
+        if self.checkpoint_every and self.checkpoint_dir is not None and \
+                len(self.scores) % self.checkpoint_every == 0:
+            self.save_checkpoint(background=True)
+
+    def prefill(self, transitions, agent='bfs', seed=None):
+        """
+        Ajanın belleğini betik bir ajanın oyunlarıyla doldurur
+        Args:
+            transitions: Eklenecek geçiş sayısı
+            agent: 'bfs', 'hamiltonian' veya act(game_state) metodu olan bir ajan
+            seed: Oyunların tohumu
+        Returns:
+            (scores, wins): Gösterim episode'larının skorları ve kazanılan episode sayısı
+        """
+        from .scripted import BFSAgent, HamiltonianAgent, prefill_memory
+        if agent == 'bfs':
+            agent = BFSAgent(self.action_mode)
+        elif agent == 'hamiltonian':
+            agent = HamiltonianAgent(self.action_mode)
+        observer = GridObserver() if self.observation == 'grid' else None
+        return prefill_memory(self.agent.memory, agent, transitions, rays=self.rays, seed=seed,
+                              observer=observer)
+
+    def evaluate(self, episodes=10, planner=None, max_steps=10000):
+        """
+        Eğitmeden, keşif yapmadan oynar ve skorları döndürür
+        Args:
+            episodes: Oynanacak episode sayısı
+            planner: Verilirse hamleler planner.act(game_state) ile seçilir
+                (LookaheadPlanner, BFSAgent, HamiltonianAgent; grid modunda LookaheadPlanner
+                observer=GridObserver() ile kurulmalıdır)
+            max_steps: Sonsuz döngüye giren oyunlar için adım sınırı
+        Returns:
+            list: Episode skorları
+        """
+        epsilon = self.agent.epsilon
+        self.agent.epsilon = 0.0
+        scores = []
+        try:
+            for _ in range(episodes):
+                game_state = GameState()
+                for _ in range(max_steps):
+                    if planner is not None:
+                        action = planner.act(game_state)
+                    else:
+                        action = self.agent.act(self.get_state(game_state))
+                    game_state.change_direction(
+                        to_direction(action, game_state.snake.direction, self.action_mode))
+                    if not game_state.update():
+                        break
+                scores.append(game_state.score)
+        finally:
+            self.agent.epsilon = epsilon
+        return scores
+
+    def train_offline(self, paths, epochs=1, log_every=1000, seed=None):
+        """
+        Ajanın modelini kaydedilmiş episode'lar üzerinde ortam çalıştırmadan eğitir
+        Args:
+            paths: Episode kayıt dosyaları
+            epochs: Kayıtların üzerinden kaç kez geçileceği
+            log_every: Kaç eğitim adımında bir kaybın yazılacağı
+            seed: Karıştırma tohumu
+        Returns:
+            list: Epoch başına ortalama kayıp
+        """
+        from .offline import OfflineTrainer
+        self._require_features("Çevrimdışı eğitim")
+        offline = OfflineTrainer(self.agent.model, paths, action_mode=self.action_mode,
+                                 batch_size=self.agent.batch_size, gamma=self.agent.gamma, seed=seed)
+        return offline.train(epochs, log_every)
+
+    def train_headless(self, episodes=None, log_every=100):
+        """
+        AI'ı pencere açmadan eğitir
+        Pygame hiç kullanılmaz; FPS sınırı ve çizim maliyeti yoktur.
+        Ekrana sadece her log_every episode'da bir özet yazılır.
+
+        Args:
+            episodes: Eğitilecek episode sayısı (varsayılan: self.episodes)
+            log_every: Kaç episode'da bir özet yazılacağı
+        """
+        if episodes is None:
+            episodes = self.episodes
 
+        try:
+            # Geri yüklenen eğitim kaldığı episode'dan devam eder
+            for episode in range(len(self.scores), episodes):
+                game_state = GameState()
+                state = self.get_state(game_state)
+                done = False
+
+                with self._episode_video(episode, game_state) as video:
+                    while not done:
+                        state, _, done = self._train_step(game_state, state)
+                        if video is not None:
+                            video.capture(game_state)
+
+                self._finish_episode(episode, game_state.score, log_every, verbose=False)
+        except BaseException:
+            self._save_on_error()
+            raise
+
+    def train_vectorized(self, num_envs=64, episodes=None, log_every=100):
+        """
+        AI'ı VecSnakeEnv üzerinde, B oyunu aynı anda oynatarak eğitir
+        Her vektör adımında B geçiş belleğe eklenir ve bir kez replay yapılır.
+
+        Args:
+            num_envs: Paralel oyun sayısı
+            episodes: Tamamlanacak toplam episode sayısı (varsayılan: self.episodes)
+            log_every: Kaç episode'da bir özet yazılacağı
+        """
+        self._require_features("Vektörize eğitim")
+        if episodes is None:
+            episodes = self.episodes
+
+        env = VecSnakeEnv(num_envs, partial(encode_batch, rays=self.rays))
+        states = env.observe()
+        episode = len(self.scores)
+
+        try:
+            while episode < episodes:
+                actions = self.agent.act_batch(states)
+                prev_directions = env.directions
+                directions = to_direction_index(actions, prev_directions, self.action_mode)
+                next_states, rewards, dones = env.step(directions)
+
+                # Biten oyunlarda next_states yeni oyunun ilk durumudur;
+                # done=True olduğu için hedef hesabında kullanılmaz
+                self.agent.remember_batch(states, actions, rewards, next_states, dones)
+                if self.recorder is not None:
+                    # Ters yön yok sayıldığı için gidilen yön önceki yöndür
+                    directions = np.where(directions == np.array(OPPOSITE_INDEX)[prev_directions],
+                                          prev_directions, directions)
+                    for i in range(num_envs):
+                        self.recorder.record(states[i], prev_directions[i], directions[i],
+                                             rewards[i], next_states[i], dones[i])
+                self.agent.replay()
+
+                for i in np.nonzero(dones)[0]:
+                    if episode < episodes:
+                        self._finish_episode(episode, int(env.episode_scores[i]), log_every, verbose=False)
+                        episode += 1
+
+                states = next_states
+        except BaseException:
+            self._save_on_error()
+            raise
+
+    def train_parallel(self, num_actors=None, episodes=None, log_every=100):
+        """
+        AI'ı aktör/öğrenici modunda eğitir
+        Aktör süreçleri oyunları oynar, bu süreç belleği ve replay()'i yürütür
+
+        Args:
+            num_actors: Aktör süreci sayısı (varsayılan: CPU sayısı - 1)
+                Bu modda geçişler episode kaydına yazılmaz
+            episodes: Tamamlanacak toplam episode sayısı (varsayılan: self.episodes)
+            log_every: Kaç episode'da bir özet yazılacağı
+        """
+        from .parallel import ParallelTrainer
+        self._require_features("Paralel eğitim")
+        try:
+            ParallelTrainer(self, num_actors=num_actors, rays=self.rays,
+                            action_mode=self.action_mode).train(episodes, log_every)
+        except BaseException:
+            self._save_on_error()
+            raise
+
+    def _learner_loop(self, control):
+        """
+        Eğitim iş parçacığı: episode'ları oynar, replay yapar ve anlık görüntü yayınlar
+        Çizimi beklemez; sadece kullanıcı hız sınırı seçtiyse veya duraklattıysa bekler
+        """
+        try:
+            for episode in range(len(self.scores), self.episodes):
+                game_state = GameState()
+                state = self.get_state(game_state)
+                done = False
+
+                with self._episode_video(episode, game_state) as video:
+                    while not done:
+                        if not control.wait_running():
+                            return
+                        state, _, done = self._train_step(game_state, state)
+                        if video is not None:
+                            video.capture(game_state)
+                        control.publish(game_state, episode, done)
+                        control.pace()
+
+                self._finish_episode(episode, game_state.score)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            print(f"Bir hata oluştu: {e}")
+            self._save_on_error()
+        finally:
+            control.finished.set()
 
     def train(self):
-        """AI'ı eğitir"""
-        from ..ui.game_window import GameWindow
-        from ..game.constants import WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE, BLACK, GREEN, RED, WHITE
+        """
+        AI'ı pencerede izleyerek eğitir
+        Eğitim ayrı bir iş parçacığında çalışır; pencere son yayınlanan anlık görüntüyü
+        sabit FPS ile çizer ve eğitimi hiçbir zaman yavaşlatmaz
+        """
+        from ..game.constants import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE
+        from ..ui.renderer import PygameRenderer, Frame
         import pygame
-        import time
 
         # Pencere boyutunu yan panel için genişlet
         PANEL_WIDTH = 200
@@ -101,36 +405,47 @@ class Trainer:
         screen = pygame.display.set_mode((total_width, WINDOW_HEIGHT))
         pygame.display.set_caption("Snake AI Training")
         clock = pygame.time.Clock()
-        BACKGROUND_COLOR = (10, 10, 10)
+
+        # Tahta GameWindow ile aynı çiziciyle çizilir; skor yan panelde gösterilir
+        renderer = PygameRenderer(screen)
+        screen.blit(renderer.background, (0, 0))
+        panel_rect = pygame.Rect(WINDOW_WIDTH, 0, PANEL_WIDTH, WINDOW_HEIGHT)
 
         # Font ayarları
         font = pygame.font.Font(None, 24)
 
-        # Hız kontrolü için değişkenler
-        speeds = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+        # Hız kontrolü: saniyede base_fps * hız adım, None ise sınırsız
+        speeds = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, None]
         speed_index = 0
-        current_speed = speeds[speed_index]
-        base_fps = 30  # Temel FPS değeri
-        paused = False
+        base_fps = 30  # Çizim FPS'i (eğitim hızından bağımsız)
+        control = _TrainingControl(publish_fps=base_fps)
+        control.set_steps_per_second(speeds[speed_index] * base_fps)
 
+        def speed_label():
+            speed = speeds[speed_index]
+            return "MAX" if speed is None else f"{speed}x"
 
-        def draw_panel():
+        def draw_panel(snapshot, episode):
             """Yan paneli çizer"""
             # Panel arkaplanı
-            panel_rect = pygame.Rect(WINDOW_WIDTH, 0, PANEL_WIDTH, WINDOW_HEIGHT)
             pygame.draw.rect(screen, (30, 30, 30), panel_rect)
             pygame.draw.line(screen, (50, 50, 50), (WINDOW_WIDTH, 0), (WINDOW_WIDTH, WINDOW_HEIGHT), 2)
 
+            # Skor listeleri eğitim iş parçacığında büyür; okurken kopyalanmaz, son değer alınır
+            scores = self.scores
+            mean_scores = self.mean_scores
+
             # Bilgileri yazdır
             y_pos = 20
             line_height = 30
             texts = [
                 f"Episode: {episode}",
-                f"Score: {score}",
-                f"High Score: {max(self.scores) if self.scores else 0}",
-                f"Mean Score: {self.mean_scores[-1]:.1f}" if self.mean_scores else "Mean Score: 0",
+                f"Score: {snapshot.score if snapshot else 0}",
+                f"High Score: {max(scores) if scores else 0}",
+                f"Mean Score: {mean_scores[-1]:.1f}" if mean_scores else "Mean Score: 0",
                 "",
-                f"Speed: {current_speed}x",
+                f"Speed: {speed_label()}",
+                f"Steps/s: {control.steps_per_second_measured:.0f}",
                 f"Epsilon: {self.agent.epsilon:.4f}",
                 f"Batch Size: {self.agent.batch_size}",
                 f"Memory Size: {len(self.agent.memory)}",
@@ -146,111 +461,148 @@ class Trainer:
                 screen.blit(text_surface, (WINDOW_WIDTH + 10, y_pos))
                 y_pos += line_height
 
-        action_to_direction = {
-            0: Direction.UP,
-            1: Direction.DOWN,
-            2: Direction.LEFT,
-            3: Direction.RIGHT
-        }
-
+        was_paused = True  # İlk kare tam çizilir
+        learner = threading.Thread(target=self._learner_loop, args=(control,), daemon=True)
+        learner.start()
         try:
-            for episode in range(self.episodes):
-                game_state = GameState()
-                state = self.get_state(game_state)
-                done = False
-                score = 0
-                prev_length = len(game_state.snake.body)
-
-                while not done:
-                    # Sabit FPS kontrolü
-                    clock.tick(base_fps)
-                    # Pygame eventlerini kontrol et
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            pygame.quit()
-                            return
-                        elif event.type == pygame.KEYDOWN:
-                            if event.key == pygame.K_UP:
-                                speed_index = min(speed_index + 1, len(speeds) - 1)
-                                current_speed = speeds[speed_index]
-                                print(f"Hız artırıldı: {current_speed}x")
-                            elif event.key == pygame.K_DOWN:
-                                speed_index = max(speed_index - 1, 0)
-                                current_speed = speeds[speed_index]
-                                print(f"Hız azaltıldı: {current_speed}x")
-                            elif event.key == pygame.K_SPACE:
-                                paused = not paused
-                            elif event.key == pygame.K_ESCAPE:
-                                pygame.quit()
-                                return "menu"
-
-                    # Episode içindeki döngüde
-                    if not paused:
-                        for _ in range(current_speed):  # Bu döngü her adımda birden fazla güncelleme yapıyor
-                            action = self.agent.act(state)
-                            direction = action_to_direction[action]
-                            game_state.change_direction(direction)
-
-                            if not game_state.update():
-                                reward = -10
-                                done = True
-                                break
-                            else:
-                                current_length = len(game_state.snake.body)
-                                if current_length > prev_length:
-                                    reward = 10
-                                    score += 1
-                                    prev_length = current_length
-                                else:
-                                    reward = 0
-
-                            next_state = self.get_state(game_state)
-                            self.agent.remember(state, action, reward, next_state, done)
-                            self.agent.replay()  # Her adımda epsilon güncelleniyor!
-                            state = next_state# Episode sonunda epsilon güncellenir
-
-                    screen.fill(BACKGROUND_COLOR)
-
-                    # Grid çiz
-                    for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-                        pygame.draw.line(screen, (40, 40, 40), (x, 0), (x, WINDOW_HEIGHT))
-                    for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-                        pygame.draw.line(screen, (40, 40, 40), (0, y), (WINDOW_WIDTH, y))
-
-                    # Yılanı çiz
-                    for segment in game_state.snake.body:
-                        pygame.draw.rect(screen, GREEN,
-                                         (segment[0] * GRID_SIZE, segment[1] * GRID_SIZE,
-                                          GRID_SIZE - 1, GRID_SIZE - 1))
-
-                    # Yemi çiz
-                    food_pos = game_state.food.position
-                    pygame.draw.rect(screen, RED,
-                                     (food_pos[0] * GRID_SIZE, food_pos[1] * GRID_SIZE,
-                                      GRID_SIZE - 1, GRID_SIZE - 1))
-
-                    # Yan paneli çiz
-                    draw_panel()
-
-                    if paused:
-                        pause_text = font.render("PAUSED", True, WHITE)
-                        text_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-                        screen.blit(pause_text, text_rect)
-
-                    pygame.display.flip()
-                 # FPS'i hıza göre ayarla
-
-                self.scores.append(score)
-                mean_score = np.mean(self.scores[-100:])
-                self.mean_scores.append(mean_score)
-                self.agent.end_episode()  # Episode sonunda epsilon güncelle
-
-                if episode % 100 == 0:
-                    print(
-                        f'Episode: {episode}, Score: {score}, Average Score: {mean_score:.2f}, Epsilon: {self.agent.epsilon:.2f}')
+            while not control.finished.is_set():
+                # Pygame eventlerini kontrol et
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_UP:
+                            speed_index = min(speed_index + 1, len(speeds) - 1)
+                            print(f"Hız artırıldı: {speed_label()}")
+                        elif event.key == pygame.K_DOWN:
+                            speed_index = max(speed_index - 1, 0)
+                            print(f"Hız azaltıldı: {speed_label()}")
+                        elif event.key == pygame.K_SPACE:
+                            control.toggle_pause()
+                        elif event.key == pygame.K_ESCAPE:
+                            return "menu"
+                        speed = speeds[speed_index]
+                        control.set_steps_per_second(None if speed is None else speed * base_fps)
+
+                snapshot, episode = control.latest()
+                paused = control.paused
+
+                # Normalde sadece değişen hücreler çizilir; PAUSED yazısı tam kareyle eklenip kaldırılır
+                rects = [panel_rect]
+                if snapshot is not None:
+                    frame = Frame.from_snapshot(snapshot, score=False)
+                    if paused or was_paused:
+                        rects.append(renderer.draw_full(frame))
+                    else:
+                        rects.extend(renderer.draw_dirty(frame))
+                    was_paused = paused
+
+                # Yan paneli çiz
+                draw_panel(snapshot, episode)
+
+                if paused:
+                    pause_text = font.render("PAUSED", True, WHITE)
+                    text_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+                    screen.blit(pause_text, text_rect)
+
+                pygame.display.update(rects)
+                clock.tick(base_fps)  # Sadece çizim döngüsünü sınırlar
 
-        except Exception as e:
-            print(f"Bir hata oluştu: {e}")
         finally:
+            control.stop()
+            learner.join()
             pygame.quit()
-            return "menu"
\ No newline at end of file
+            return "menu"
+
+
+class _TrainingControl:
+    """
+    Eğitim iş parçacığı ile çizim döngüsü arasındaki paylaşılan durum
+    Eğitim değiştirilemez bir GameSnapshot yayınlar; sınırsız hızda bu en fazla publish_fps
+    sıklığındadır. Çizim döngüsü her karede sadece en son yayını okur
+    """
+
+    def __init__(self, publish_fps=30):
+        self.running = threading.Event()  # Temizse eğitim duraklatılmış
+        self.running.set()
+        self.stopped = threading.Event()
+        self.finished = threading.Event()  # Eğitim iş parçacığı bitti
+        self.publish_interval = 1.0 / publish_fps
+        self.steps_per_second = None  # None: sınırsız
+        self.steps_per_second_measured = 0.0
+
+        # (snapshot, episode) çifti tek bir atamayla değiştirilir
+        self._latest = (None, 0)
+        self._last_publish = 0.0
+        self._window_start = time.perf_counter()
+        self._window_steps = 0
+        self._next_step_time = None
+
+    @property
+    def paused(self):
+        return not self.running.is_set()
+
+    def toggle_pause(self):
+        if self.running.is_set():
+            self.running.clear()
+        else:
+            self._next_step_time = None
+            self.running.set()
+
+    def stop(self):
+        """
+        Eğitim iş parçacığına durmasını söyler (duraklatılmışsa da uyanır)
+        """
+        self.stopped.set()
+        self.running.set()
+
+    def set_steps_per_second(self, steps_per_second):
+        self.steps_per_second = steps_per_second
+        self._next_step_time = None
+
+    def wait_running(self):
+        """
+        Duraklatılmışsa devam edilene kadar bekler
+        Returns:
+            bool: Eğitim devam etmeliyse True, durdurulduysa False
+        """
+        self.running.wait()  # stop() da bu olayı kurar
+        return not self.stopped.is_set()
+
+    def publish(self, game_state, episode, done=False):
+        """
+        Oyunun anlık görüntüsünü yayınlar
+        Hız sınırı seçildiyse her adım yayınlanır; sınırsız hızda
+        sadece son yayından beri publish_interval geçtiyse. Episode'un son adımı hep yayınlanır
+        """
+        self._window_steps += 1
+        now = time.perf_counter()
+        if self.steps_per_second is None and not done and now - self._last_publish < self.publish_interval:
+            return
+        self._last_publish = now
+        self._latest = (game_state.snapshot(include_rng=False), episode)
+
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.steps_per_second_measured = self._window_steps / elapsed
+            self._window_start, self._window_steps = now, 0
+
+    def latest(self):
+        """
+        Son yayınlanan (snapshot, episode) çiftini döndürür
+        """
+        return self._latest
+
+    def pace(self):
+        """
+        Kullanıcı bir hız sınırı seçtiyse adımlar arasında bekler
+        """
+        if self.steps_per_second is None:
+            return
+        now = time.perf_counter()
+        if self._next_step_time is None or now - self._next_step_time > 0.25:
+            self._next_step_time = now  # Geride kalındıysa biriken adımlar telafi edilmez
+        self._next_step_time += 1.0 / self.steps_per_second
+        delay = self._next_step_time - now
+        if delay > 0:
+            time.sleep(delay)
@@ -1,17 +1,30 @@
 import random
-from typing import Tuple, List
+from typing import Container, Optional, Tuple
 from .constants import GRID_WIDTH, GRID_HEIGHT
+from .free_cells import FreeCells
+from .zobrist import ZOBRIST
 
 class Food:
     """
     Yem sınıfı: Oyundaki yemlerin konumunu ve davranışını yönetir
     """
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         """
         Yem nesnesini başlatır
         İlk yem rastgele bir konumda oluşturulur
+        Args:
+            rng (Optional[random.Random]): Yem konumları için rastgele sayı üreteci
+                (varsayılan: random modülünün global üreteci)
+        """
+        self.rng = rng if rng is not None else random
+        self.set_position(self._generate_position())
+
+    def set_position(self, position: Tuple[int, int]):
+        """
+        Yemi verilen konuma koyar ve Zobrist anahtarını günceller
         """
-        self.position = self._generate_position()
+        self.position = position
+        self.hash = ZOBRIST.food[ZOBRIST.cell(position)]
 
     def _generate_position(self) -> Tuple[int, int]:
         """
@@ -19,23 +32,35 @@ class Food:
         Returns:
             Tuple[int, int]: Yemin yeni konumu (x, y)
         """
-        x = random.randint(0, GRID_WIDTH - 1)
-        y = random.randint(0, GRID_HEIGHT - 1)
+        x = self.rng.randint(0, GRID_WIDTH - 1)
+        y = self.rng.randint(0, GRID_HEIGHT - 1)
         return (x, y)
 
-    def spawn(self, snake_body: List[Tuple[int, int]]):
+    def spawn(self, snake_body: Container[Tuple[int, int]],
+              free_cells: Optional[FreeCells] = None) -> bool:
         """
         Yeni bir yem oluşturur
         Yemin yılanın vücudunda olmadığından emin olur
         Args:
-            snake_body (List[Tuple[int, int]]): Yılanın vücut koordinatları
-        """
-        while True:
-            new_position = self._generate_position()
-            # Yem yılanın vücudunda değilse kabul et
-            if new_position not in snake_body:
-                self.position = new_position
-                break
+            snake_body (Container[Tuple[int, int]]): Yılanın dolu hücreleri
+                (O(1) kontrol için Snake.occupied verilmesi önerilir)
+            free_cells (Optional[FreeCells]): Verilirse yem tek bir O(log uzunluk) seçimle konur
+        Returns:
+            bool: Yem konduysa True, boş hücre kalmadıysa (tahta dolu) False
+        """
+        if free_cells is not None:
+            new_position = free_cells.choice(self.rng)
+        else:
+            # İndeks yoksa boş hücreleri bir kez listele (dolu tahtada sonsuz döngü olmaz)
+            empty = [(x, y) for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)
+                     if (x, y) not in snake_body]
+            new_position = self.rng.choice(empty) if empty else None
+
+        if new_position is None:
+            return False
+
+        self.set_position(new_position)
+        return True
 
     def get_position(self) -> Tuple[int, int]:
         """
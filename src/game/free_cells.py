@@ -0,0 +1,86 @@
+import random
+from bisect import bisect_left, insort
+from typing import Iterable, List, Optional, Tuple
+from .constants import GRID_WIDTH, GRID_HEIGHT
+
+
+class FreeCells:
+    """
+    Boş hücre indeksi: dolu hücrelerin düz indekslerini sıralı bir listede tutar
+    Boyutu yılan uzunluğuyla orantılıdır; kopyalama ve yeniden kurma O(uzunluk) sürer.
+    Rastgele seçim satır sırasındaki k. boş hücreyi ikili aramayla bulur: O(log uzunluk).
+    Seçim sadece doluluğa ve RNG'ye bağlıdır (ekleme/silme geçmişine değil); bu yüzden
+    kopyalanan veya anlık görüntüden kurulan oyun aynı yemleri üretir.
+    """
+
+    def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT,
+                 occupied: Iterable[Tuple[int, int]] = ()):
+        """
+        Args:
+            width (int): Grid genişliği
+            height (int): Grid yüksekliği
+            occupied (Iterable[Tuple[int, int]]): Başlangıçta dolu hücreler (varsayılan: hiçbiri)
+        """
+        self.width = width
+        self.height = height
+        self.num_cells = width * height
+        # Dolu hücrelerin artan sırada düz indeksleri (y * width + x)
+        self.occupied: List[int] = sorted({y * width + x for x, y in occupied})
+
+    def remove(self, cell: Tuple[int, int]):
+        """
+        Hücreyi boş hücrelerden çıkarır (hücre dolar)
+        """
+        insort(self.occupied, cell[1] * self.width + cell[0])
+
+    def add(self, cell: Tuple[int, int]):
+        """
+        Hücreyi boş hücrelere ekler (hücre boşalır)
+        """
+        index = cell[1] * self.width + cell[0]
+        del self.occupied[bisect_left(self.occupied, index)]
+
+    def choice(self, rng=random) -> Optional[Tuple[int, int]]:
+        """
+        Rastgele bir boş hücre seçer
+        Returns:
+            Optional[Tuple[int, int]]: Boş hücre, tahta doluysa None
+        """
+        free = self.num_cells - len(self.occupied)
+        if free == 0:
+            return None
+        k = rng.randrange(free)
+
+        # occupied[i] - i, occupied[i]'den önceki boş hücre sayısıdır ve azalmaz:
+        # k. boş hücreden önce gelen dolu hücre sayısı ikili aramayla bulunur
+        occupied = self.occupied
+        lo, hi = 0, len(occupied)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if occupied[mid] - mid <= k:
+                lo = mid + 1
+            else:
+                hi = mid
+        index = k + lo
+        return (index % self.width, index // self.width)
+
+    def copy(self) -> 'FreeCells':
+        """
+        İndeksin bağımsız bir kopyasını O(uzunluk) sürede döndürür
+        """
+        clone = FreeCells.__new__(FreeCells)
+        clone.width = self.width
+        clone.height = self.height
+        clone.num_cells = self.num_cells
+        clone.occupied = self.occupied.copy()
+        return clone
+
+    def __contains__(self, cell) -> bool:
+        if not (0 <= cell[0] < self.width and 0 <= cell[1] < self.height):
+            return False
+        index = cell[1] * self.width + cell[0]
+        i = bisect_left(self.occupied, index)
+        return i == len(self.occupied) or self.occupied[i] != index
+
+    def __len__(self) -> int:
+        return self.num_cells - len(self.occupied)
@@ -1,8 +1,84 @@
-from typing import Tuple, Optional
-from .snake import Snake, Direction
+import random
+import struct
+from array import array
+from collections import deque
+from typing import NamedTuple, Tuple, Optional
+from .snake import Snake, Direction, DIRECTIONS, DIRECTION_INDEX
 from .food import Food
+from .free_cells import FreeCells
 from .constants import GRID_WIDTH, GRID_HEIGHT
 
+COLLISION_TYPES = (None, "wall", "tail", "win")
+NO_CELL = 0xFFFF  # Paketlenmiş hücre indeksi yokken kullanılan değer
+
+
+def pack_cell(cell: Optional[Tuple[int, int]]) -> int:
+    """
+    (x, y) hücresini tek bir indekse (y * GRID_WIDTH + x) çevirir
+    """
+    return NO_CELL if cell is None else cell[1] * GRID_WIDTH + cell[0]
+
+
+def unpack_cell(index: int) -> Optional[Tuple[int, int]]:
+    """
+    pack_cell'in tersi
+    """
+    return None if index == NO_CELL else (index % GRID_WIDTH, index // GRID_WIDTH)
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Oyunun kompakt ve değiştirilemez anlık görüntüsü
+    Gövde, kafadan kuyruğa paketlenmiş uint16 hücre indeksleri olarak tutulur
+    """
+    body: bytes
+    direction: int
+    food: int
+    score: int
+    game_over: bool
+    won: bool
+    collision_type: int
+    collision_point: int
+    rng_state: Optional[tuple] = None
+
+    # Başlık: gövde uzunluğu, yön, yem, skor, bayraklar, çarpışma tipi, çarpışma noktası
+    HEADER = struct.Struct('<HBHIBBH')
+
+    def to_bytes(self) -> bytes:
+        """
+        Anlık görüntüyü ikili formata çevirir
+        RNG durumu varsa 625 uint32 kelime ve gauss_next olarak eklenir
+        """
+        flags = self.game_over | (self.won << 1) | ((self.rng_state is not None) << 2)
+        data = self.HEADER.pack(len(self.body) // 2, self.direction, self.food, self.score,
+                                flags, self.collision_type, self.collision_point) + self.body
+        if self.rng_state is not None:
+            version, internal, gauss_next = self.rng_state
+            data += array('I', internal).tobytes()
+            data += struct.pack('<?d', gauss_next is not None, gauss_next or 0.0)
+        return data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GameSnapshot':
+        """
+        to_bytes çıktısından anlık görüntüyü geri oluşturur
+        """
+        length, direction, food, score, flags, collision_type, collision_point = \
+            cls.HEADER.unpack_from(data)
+        offset = cls.HEADER.size
+        body = bytes(data[offset:offset + 2 * length])
+        offset += 2 * length
+
+        rng_state = None
+        if flags & 4:
+            internal = array('I')
+            internal.frombytes(data[offset:offset + 625 * 4])
+            has_gauss, gauss = struct.unpack_from('<?d', data, offset + 625 * 4)
+            rng_state = (3, tuple(internal), gauss if has_gauss else None)
+
+        return cls(body, direction, food, score, bool(flags & 1), bool(flags & 2),
+                   collision_type, collision_point, rng_state)
+
 
 class GameState:
     """
@@ -10,25 +86,35 @@ class GameState:
     Snake ve Food sınıflarını koordine eder ve oyun mantığını yönetir
     """
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         """
         Oyun durumunu başlatır
         - Yılanı oluşturur
         - Yemi oluşturur
         - Skor ve oyun durumu değişkenlerini ayarlar
+        Args:
+            seed (Optional[int]): Yem konumları için rastgele sayı üreteci tohumu
         """
+        # Oyuna özel rastgele sayı üreteci (anlık görüntüye dahil edilebilir)
+        self._rng = random.Random(seed)
+        # RNG durumunun önbelleği: RNG bir sonraki kullanımına kadar geçerlidir (bkz. clone)
+        self._rng_state = None
+
         # Yılanı grid'in ortasında başlat
         initial_position = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
-        self.snake = Snake(initial_position)
+        # Boş hücre indeksi yılan hareket ettikçe güncellenir
+        self.free_cells = FreeCells()
+        self.snake = Snake(initial_position, free_cells=self.free_cells)
 
         # Yemi oluştur
-        self.food = Food()
+        self.food = Food(self.rng)
         # Yılanın olmadığı bir konumda yem oluştur
-        self.food.spawn(self.snake.body)
+        self.food.spawn(self.snake.occupied, self.free_cells)
 
         # Oyun değişkenleri
         self.score = 0
         self.game_over = False
+        self.won = False  # Tahta tamamen dolduysa True
         self.collision_point = None
         self.collision_type = None
 
@@ -39,7 +125,7 @@ class GameState:
         - Yem yeme kontrolü yapar
         - Skor günceller
         Returns:
-            bool: Oyun devam ediyorsa True, bittiyse False
+            bool: Oyun devam ediyorsa True, bittiyse (veya kazanıldıysa) False
         """
         if self.game_over:
             return False
@@ -59,7 +145,7 @@ class GameState:
             return False
 
         # Kuyruk çarpışması kontrolü
-        if new_head in self.snake.body[1:]:
+        if self.snake.occupies(new_head):
             self.collision_point = new_head
             self.collision_type = "tail"
             self.game_over = True
@@ -76,11 +162,36 @@ class GameState:
             self.snake.grow()
             # Skoru artır
             self.score += 1
-            # Yeni yem oluştur
-            self.food.spawn(self.snake.body)
+            # Yem RNG'yi ilerletir; önbelleğe alınmış durum eskir
+            self.food.rng = self.rng
+            self._rng_state = None
+            # Yeni yem oluştur; boş hücre kalmadıysa oyun kazanılmıştır
+            if not self.food.spawn(self.snake.occupied, self.free_cells):
+                self.won = True
+                self.collision_type = "win"
+                self.game_over = True
+                return False
 
         return True
 
+    @property
+    def rng(self) -> random.Random:
+        """
+        Oyunun RNG'si; kopyalarda ilk yem üretiminde önbelleğe alınmış durumdan kurulur
+        """
+        if self._rng is None:
+            self._rng = random.Random.__new__(random.Random)
+            self._rng.setstate(self._rng_state)
+        return self._rng
+
+    def _get_rng_state(self) -> tuple:
+        """
+        RNG durumunu döndürür; RNG kullanılana kadar aynı demet yeniden kullanılır
+        """
+        if self._rng_state is None:
+            self._rng_state = self._rng.getstate()
+        return self._rng_state
+
     def change_direction(self, direction: Direction):
         """
         Yılanın yönünü değiştirir
@@ -96,10 +207,11 @@ class GameState:
             dict: Oyun durumu bilgileri
         """
         return {
-            'snake_body': self.snake.body,
+            'snake_body': list(self.snake.body),
             'food_position': self.food.get_position(),
             'score': self.score,
-            'game_over': self.game_over
+            'game_over': self.game_over,
+            'won': self.won
         }
 
     def is_game_over(self) -> bool:
@@ -126,6 +238,106 @@ class GameState:
 
     def get_collision_type(self):
         """
-        Çarpışma tipini döndürür (wall/tail)
+        Çarpışma tipini döndürür (wall/tail/win)
+        """
+        return self.collision_type
+
+    def key(self) -> int:
+        """
+        Konumun 64 bitlik Zobrist anahtarını O(1) sürede döndürür
+        Yılan gövdesi, kafa, yön, uzunluk ve yemi kapsar; skor ve RNG dahil değildir
+        Planlayıcılar, önbellekler ve replay tekilleştirmesi için kullanılır
+        Returns:
+            int: Konum anahtarı
+        """
+        return self.snake.hash ^ self.food.hash
+
+    def snapshot(self, include_rng: bool = True) -> GameSnapshot:
+        """
+        Oyunun kompakt anlık görüntüsünü döndürür
+        Args:
+            include_rng (bool): RNG durumu da eklensin mi (geri yüklenen oyunun
+                aynı yemleri üretmesi için gerekir, ~2.5 KB ekler)
+        Returns:
+            GameSnapshot: Anlık görüntü
+        """
+        return GameSnapshot(
+            body=array('H', [pack_cell(cell) for cell in self.snake.body]).tobytes(),
+            direction=DIRECTION_INDEX[self.snake.direction],
+            food=pack_cell(self.food.position),
+            score=self.score,
+            game_over=self.game_over,
+            won=self.won,
+            collision_type=COLLISION_TYPES.index(self.collision_type),
+            collision_point=pack_cell(self.collision_point),
+            rng_state=self._get_rng_state() if include_rng else None
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        """
+        Oyunu verilen anlık görüntüye geri döndürür
+        Args:
+            snapshot (GameSnapshot): snapshot() ile alınmış görüntü
+        """
+        cells = array('H')
+        cells.frombytes(snapshot.body)
+
+        # Doluluk ve boş hücre indeksi gövdeden kurulur: O(uzunluk), tahta boyutundan bağımsız
+        snake = Snake.__new__(Snake)
+        snake.direction = DIRECTIONS[snapshot.direction]
+        snake.body = deque()
+        snake.occupied = {}
+        snake.free_cells = None
+        snake.hash = 0
+        for index in cells:
+            cell = unpack_cell(index)
+            snake.body.append(cell)
+            snake._occupy(cell)
+        snake.hash ^= snake._head_direction_length_key()
+        self.free_cells = snake.free_cells = FreeCells(occupied=snake.occupied)
+        self.snake = snake
+
+        if snapshot.rng_state is not None:
+            # RNG ilk yem üretiminde kurulur
+            self._rng = None
+            self._rng_state = snapshot.rng_state
+        self.food.set_position(unpack_cell(snapshot.food))
+
+        self.score = snapshot.score
+        self.game_over = snapshot.game_over
+        self.won = snapshot.won
+        self.collision_type = COLLISION_TYPES[snapshot.collision_type]
+        self.collision_point = unpack_cell(snapshot.collision_point)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot) -> 'GameState':
+        """
+        Anlık görüntüden yeni bir oyun oluşturur
+        """
+        game_state = cls()
+        game_state.restore(snapshot)
+        return game_state
+
+    def clone(self) -> 'GameState':
+        """
+        Oyunun bağımsız bir kopyasını döndürür
+        Gövde, doluluk haritası ve boş hücre indeksi O(uzunluk) sürede kopyalanır
+        Kopya aynı RNG durumuyla devam eder ve orijinalle aynı yemleri üretir; RNG durumu
+        (~2.5 KB) paylaşılır ve kopyanın RNG'si ancak yem üretirken kurulur
         """
-        return self.collision_type
\ No newline at end of file
+        clone = GameState.__new__(GameState)
+        # __init__ sistemden tohum okuyacağı için atlanır
+        clone._rng = None
+        clone._rng_state = self._get_rng_state()
+        clone.free_cells = self.free_cells.copy()
+        clone.snake = self.snake.copy(clone.free_cells)
+        clone.food = Food.__new__(Food)
+        clone.food.rng = None  # update() yem yendiğinde clone.rng'yi bağlar
+        clone.food.position = self.food.position
+        clone.food.hash = self.food.hash
+        clone.score = self.score
+        clone.game_over = self.game_over
+        clone.won = self.won
+        clone.collision_point = self.collision_point
+        clone.collision_type = self.collision_type
+        return clone
@@ -1,6 +1,9 @@
-from typing import List, Tuple  # Type hinting için
+from typing import Dict, List, Optional, Tuple  # Type hinting için
+from collections import deque  # O(1) baş/son ekleme-çıkarma için
 from enum import Enum  # Sabit değerler için
 from .constants import GRID_WIDTH, GRID_HEIGHT  # Oyun sabitleri
+from .free_cells import FreeCells  # Boş hücre indeksi
+from .zobrist import ZOBRIST  # Artımlı konum anahtarı için
 
 
 class Direction(Enum):
@@ -14,24 +17,43 @@ class Direction(Enum):
     DOWN = (0, 1)  # y+1: aşağı hareket
 
 
+# Yön indeksleri (mutlak aksiyon sırası): 0 UP, 1 DOWN, 2 LEFT, 3 RIGHT
+# Dönüşler if zincirleri yerine bu tablolardan okunur
+DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+DIRECTION_INDEX = {direction: i for i, direction in enumerate(DIRECTIONS)}
+OPPOSITE_INDEX = (1, 0, 3, 2)  # Her yönün tersi
+RIGHT_OF_INDEX = (3, 2, 0, 1)  # Her yönün sağındaki yön
+LEFT_OF_INDEX = (2, 3, 1, 0)  # Her yönün solundaki yön
+
+
 class Snake:
     """
     Yılan sınıfı: Oyundaki yılanın tüm özelliklerini ve davranışlarını içerir
     """
 
-    def __init__(self, initial_position: Tuple[int, int], initial_length: int = 3):
+    def __init__(self, initial_position: Tuple[int, int], initial_length: int = 3,
+                 free_cells: Optional[FreeCells] = None):
         """
         Yılan nesnesini başlatır
         Args:
             initial_position (Tuple[int, int]): Başlangıç pozisyonu (x, y)
             initial_length (int): Başlangıç uzunluğu (varsayılan: 3)
+            free_cells (Optional[FreeCells]): Hareketle birlikte güncellenecek boş hücre indeksi
         """
         # Yılanın başlangıç yönü
         self.direction = Direction.RIGHT
 
-        # Yılanın vücut parçalarını tutan liste
+        # Yılanın vücut parçalarını tutan deque
         # Her parça (x,y) koordinat çifti olarak saklanır
-        self.body = []
+        self.body = deque()
+
+        # Hücre -> o hücredeki parça sayısı
+        # grow() kuyruğu tekrarladığı için aynı hücrede iki parça olabilir
+        self.occupied: Dict[Tuple[int, int], int] = {}
+        self.free_cells = free_cells
+
+        # Zobrist anahtarı: dolu hücreler, kafa, yön ve uzunluk (hareketle O(1) güncellenir)
+        self.hash = 0
 
         # Başlangıç pozisyonunu al
         x, y = initial_position
@@ -40,6 +62,78 @@ class Snake:
         # İlk parça (kafa) initial_position'da, diğerleri sola doğru uzanır
         for i in range(initial_length):
             self.body.append((x - i, y))
+            self._occupy((x - i, y))
+        self.hash ^= self._head_direction_length_key()
+
+    def _head_direction_length_key(self) -> int:
+        """
+        Anahtarın kafa, yön ve uzunluk kısmını döndürür
+        """
+        return (ZOBRIST.head[ZOBRIST.cell(self.body[0])] ^
+                ZOBRIST.direction[self.direction.value] ^
+                ZOBRIST.length[len(self.body)])
+
+    def _occupy(self, cell: Tuple[int, int]):
+        """
+        Hücreyi dolu olarak işaretler
+        """
+        count = self.occupied.get(cell, 0)
+        if count == 0:
+            self.hash ^= ZOBRIST.body[ZOBRIST.cell(cell)]
+            if self.free_cells is not None:
+                self.free_cells.remove(cell)
+        self.occupied[cell] = count + 1
+
+    def _vacate(self, cell: Tuple[int, int]):
+        """
+        Hücredeki bir parçayı siler, parça kalmadıysa hücreyi boşaltır
+        """
+        count = self.occupied[cell] - 1
+        if count:
+            self.occupied[cell] = count
+        else:
+            del self.occupied[cell]
+            self.hash ^= ZOBRIST.body[ZOBRIST.cell(cell)]
+            if self.free_cells is not None:
+                self.free_cells.add(cell)
+
+    def occupies(self, cell: Tuple[int, int]) -> bool:
+        """
+        Hücrede yılan gövdesi olup olmadığını O(1) sürede kontrol eder
+        Args:
+            cell (Tuple[int, int]): Kontrol edilecek hücre (x, y)
+        Returns:
+            bool: Hücre doluysa True
+        """
+        return cell in self.occupied
+
+    def is_collision(self, cell: Tuple[int, int]) -> bool:
+        """
+        Kafanın verilen hücreye gitmesi durumunda çarpışma olup olmadığını kontrol eder
+        Kafa komşu bir hücreye gidebileceği için gövde kontrolü body[1:] ile aynıdır
+        Args:
+            cell (Tuple[int, int]): Hedef hücre (x, y)
+        Returns:
+            bool: Duvar veya gövde çarpışması varsa True
+        """
+        if (cell[0] < 0 or cell[0] >= GRID_WIDTH or
+                cell[1] < 0 or cell[1] >= GRID_HEIGHT):
+            return True
+        return cell in self.occupied
+
+    def copy(self, free_cells: Optional[FreeCells] = None) -> 'Snake':
+        """
+        Yılanın bağımsız bir kopyasını O(uzunluk) sürede döndürür
+        Args:
+            free_cells (Optional[FreeCells]): Kopyanın güncelleyeceği boş hücre indeksi
+        """
+        clone = Snake.__new__(Snake)
+        clone.direction = self.direction
+        clone.body = self.body.copy()
+        clone.occupied = self.occupied.copy()
+        clone.free_cells = free_cells
+        clone.hash = self.hash
+        return clone
 
     def move(self) -> bool:
         """
@@ -53,18 +147,16 @@ class Snake:
             self.body[0][1] + self.direction.value[1]
         )
 
-        # Duvara çarpma kontrolü
-        if (new_head[0] < 0 or new_head[0] >= GRID_WIDTH or
-                new_head[1] < 0 or new_head[1] >= GRID_HEIGHT):
+        # Duvara ve kendine çarpma kontrolü
+        if self.is_collision(new_head):
             return False
 
-        # Kendine çarpma kontrolü
-        if new_head in self.body[1:]:
-            return False
-
-        self.body.insert(0, new_head)
-        self.body.pop()
+        self.hash ^= ZOBRIST.head[ZOBRIST.cell(self.body[0])] ^ ZOBRIST.head[ZOBRIST.cell(new_head)]
+        self.body.appendleft(new_head)
+        self._occupy(new_head)
+        self._vacate(self.body.pop())
         return True
+
     def grow(self):
         """
         Yılanı bir birim büyütür
@@ -72,7 +164,9 @@ class Snake:
         """
         # Kuyruğun son pozisyonunu tekrarla
         # Bir sonraki move() çağrısında bu parça yeni pozisyona geçecek
+        self.hash ^= ZOBRIST.length[len(self.body)] ^ ZOBRIST.length[len(self.body) + 1]
         self.body.append(self.body[-1])
+        self._occupy(self.body[-1])
 
     def change_direction(self, new_direction: Direction):
         """
@@ -90,6 +184,7 @@ class Snake:
 
         # Eğer yeni yön, mevcut yönün zıttı değilse yönü değiştir
         if new_direction != opposite_directions.get(self.direction):
+            self.hash ^= ZOBRIST.direction[self.direction.value] ^ ZOBRIST.direction[new_direction.value]
             self.direction = new_direction
 
     def get_head(self) -> Tuple[int, int]:
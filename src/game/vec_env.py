@@ -0,0 +1,178 @@
+import numpy as np
+from typing import Callable, Optional, Tuple
+from .constants import GRID_WIDTH, GRID_HEIGHT, INITIAL_SNAKE_LENGTH
+from .snake import Direction, DIRECTIONS, DIRECTION_INDEX, OPPOSITE_INDEX
+
+# Aksiyon/yön indeksleri snake.DIRECTIONS sırasındadır: 0 UP, 1 DOWN, 2 LEFT, 3 RIGHT
+DIRECTION_DELTAS = np.array([direction.value for direction in DIRECTIONS], dtype=np.int64)
+OPPOSITE_DIRECTION = np.array(OPPOSITE_INDEX, dtype=np.int64)
+RIGHT = DIRECTION_INDEX[Direction.RIGHT]
+
+
+class VecSnakeEnv:
+    """
+    B adet Snake oyununu NumPy dizilerinde tutan vektörize ortam
+    Tüm oyunlar tek bir step() çağrısıyla ilerletilir, ölen oyunlar otomatik sıfırlanır
+    Kurallar GameState.update ile adım adım aynıdır: yem yiyen yılan (grow() kuyruğu
+    tekrarladığı için) bir sonraki adımda uzar
+    """
+
+    def __init__(self, num_envs: int, encoder: Callable[..., np.ndarray], width: int = GRID_WIDTH,
+                 height: int = GRID_HEIGHT, seed: Optional[int] = None):
+        """
+        Ortamı başlatır
+
+        Args:
+            num_envs (int): Paralel oyun sayısı (B)
+            encoder (Callable): (heads, directions, foods, grids) dizilerinden (B, feature_size)
+                gözlemleri hesaplar (ör. ai.features.encode_batch)
+            width (int): Grid genişliği
+            height (int): Grid yüksekliği
+            seed (Optional[int]): Rastgele sayı üreteci tohumu
+        """
+        self.num_envs = num_envs
+        self.encoder = encoder
+        self.width = width
+        self.height = height
+        self.num_cells = width * height
+        self.rng = np.random.default_rng(seed)
+
+        # Doluluk gridi: 1 olan hücrelerde yılan gövdesi var
+        self.grid = np.zeros((num_envs, height, width), dtype=np.uint8)
+        self._flat_grid = self.grid.reshape(num_envs, self.num_cells)
+
+        # Gövde halka tamponu: düz hücre indeksleri, kafa head_ptr'de
+        self.bodies = np.zeros((num_envs, self.num_cells), dtype=np.int64)
+        self.head_ptr = np.zeros(num_envs, dtype=np.int64)
+        self.lengths = np.zeros(num_envs, dtype=np.int64)  # Halka tamponundaki hücre sayısı
+        self.growing = np.zeros(num_envs, dtype=bool)  # Önceki adımda yem yedi, bu adımda uzayacak
+
+        self.heads = np.zeros((num_envs, 2), dtype=np.int64)  # (x, y)
+        self.directions = np.full(num_envs, RIGHT, dtype=np.int64)
+        self.food = np.zeros((num_envs, 2), dtype=np.int64)  # (x, y)
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+
+        # Son biten episode'un skoru (done olan oyunlar için geçerli)
+        self.episode_scores = np.zeros(num_envs, dtype=np.int64)
+
+        self._env_index = np.arange(num_envs)
+        self.reset()
+
+    def reset(self) -> np.ndarray:
+        """
+        Tüm oyunları sıfırlar
+        Returns:
+            np.ndarray: (B, feature_size) gözlem dizisi
+        """
+        self._reset_envs(self._env_index)
+        return self.observe()
+
+    def _reset_envs(self, envs: np.ndarray):
+        """
+        Verilen oyunları başlangıç durumuna getirir
+        Yılan grid'in ortasında, sağa bakar ve sola doğru uzanır
+        """
+        if len(envs) == 0:
+            return
+
+        x, y = self.width // 2, self.height // 2
+        length = INITIAL_SNAKE_LENGTH
+
+        self._flat_grid[envs] = 0
+        # Kuyruk halka tamponunun 0. indeksinde, kafa length-1'de
+        cells = y * self.width + x - np.arange(length - 1, -1, -1)
+        self.bodies[np.ix_(envs, np.arange(length))] = cells
+        self._flat_grid[np.ix_(envs, cells)] = 1
+
+        self.head_ptr[envs] = length - 1
+        self.lengths[envs] = length
+        self.growing[envs] = False
+        self.heads[envs] = (x, y)
+        self.directions[envs] = RIGHT
+        self.scores[envs] = 0
+        self._spawn_food(envs)
+
+    def _spawn_food(self, envs: np.ndarray):
+        """
+        Verilen oyunlarda boş hücrelerden rastgele birine yem koyar
+        """
+        if len(envs) == 0:
+            return
+
+        # Dolu hücrelere -1 anahtar ver, en büyük anahtarlı boş hücreyi seç
+        keys = self.rng.random((len(envs), self.num_cells))
+        keys[self._flat_grid[envs] != 0] = -1.0
+        cells = np.argmax(keys, axis=1)
+        self.food[envs, 0] = cells % self.width
+        self.food[envs, 1] = cells // self.width
+
+    def _is_blocked(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Verilen (B, 2) konumların duvar veya gövde olup olmadığını döndürür
+        """
+        x, y = positions[:, 0], positions[:, 1]
+        outside = (x < 0) | (x >= self.width) | (y < 0) | (y >= self.height)
+        cells = np.where(outside, 0, y * self.width + x)
+        return outside | (self._flat_grid[self._env_index, cells] != 0)
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Tüm oyunları bir adım ilerletir
+        Biten oyunlar aynı çağrı içinde sıfırlanır; dönen gözlem yeni oyunun ilk durumudur
+
+        Args:
+            actions: (B,) mutlak yön indeksleri (0: UP, 1: DOWN, 2: LEFT, 3: RIGHT)
+        Returns:
+            observations (B, feature_size), rewards (B,), dones (B,)
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+
+        # Zıt yöne dönüş yok sayılır (Snake.change_direction ile aynı)
+        self.directions = np.where(actions == OPPOSITE_DIRECTION[self.directions],
+                                   self.directions, actions)
+        new_heads = self.heads + DIRECTION_DELTAS[self.directions]
+        x, y = new_heads[:, 0], new_heads[:, 1]
+
+        # Çarpışma kontrolü (kuyruk hücresi de dahil, GameState.update ile aynı)
+        dead = self._is_blocked(new_heads)
+        alive = ~dead
+        ate = alive & (x == self.food[:, 0]) & (y == self.food[:, 1])
+        cells = np.where(dead, 0, y * self.width + x)
+
+        # Kuyruğu boşalt; önceki adımda yem yiyenlerin kuyruğu (GameState'te tekrarlanan
+        # kuyruk parçası) yerinde kalır ve yılan bu adımda uzar
+        movers = np.nonzero(alive & ~self.growing)[0]
+        tail_ptr = (self.head_ptr[movers] - self.lengths[movers] + 1) % self.num_cells
+        self._flat_grid[movers, self.bodies[movers, tail_ptr]] = 0
+
+        # Yeni kafayı halka tamponuna ve gride yaz
+        survivors = np.nonzero(alive)[0]
+        self.head_ptr[survivors] = (self.head_ptr[survivors] + 1) % self.num_cells
+        self.bodies[survivors, self.head_ptr[survivors]] = cells[survivors]
+        self._flat_grid[survivors, cells[survivors]] = 1
+        self.heads[survivors] = new_heads[survivors]
+
+        self.lengths[alive & self.growing] += 1
+        self.growing = ate
+        self.scores[ate] += 1
+
+        # Yem için boş hücre kalmadıysa oyun kazanılmıştır (GameState ile aynı adımda)
+        won = ate & (self.lengths == self.num_cells)
+        self._spawn_food(np.nonzero(ate & ~won)[0])
+
+        rewards = np.where(dead, -10.0, np.where(ate, 10.0, 0.0)).astype(np.float32)
+        dones = dead | won
+
+        finished = np.nonzero(dones)[0]
+        self.episode_scores[finished] = self.scores[finished]
+        self._reset_envs(finished)
+
+        return self.observe(), rewards, dones
+
+    def observe(self) -> np.ndarray:
+        """
+        Tüm oyunların gözlemlerini encoder ile hesaplar
+        Returns:
+            np.ndarray: (B, feature_size) float32 gözlem dizisi
+        """
+        return self.encoder(self.heads, self.directions, self.food, self.grid)
@@ -0,0 +1,59 @@
+import random
+from typing import List
+from .constants import GRID_WIDTH, GRID_HEIGHT
+
+
+class ZobristTable:
+    """
+    Oyun konumları için Zobrist anahtarları
+    Her (özellik, hücre) çiftine sabit tohumla üretilmiş 64 bitlik rastgele bir sayı atanır;
+    bir konumun anahtarı, o konumda bulunan özelliklerin sayılarının XOR'udur
+    XOR kendi tersi olduğu için Snake ve Food anahtarı her adımda O(1) günceller
+    """
+
+    def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT, seed: int = 0x5EED):
+        """
+        Args:
+            width (int): Grid genişliği
+            height (int): Grid yüksekliği
+            seed (int): Anahtarların süreçler arasında aynı olması için sabit tohum
+        """
+        rng = random.Random(seed)
+        cells = width * height
+        self.width = width
+
+        def keys(count: int) -> List[int]:
+            return [rng.getrandbits(64) for _ in range(count)]
+
+        self.body = keys(cells)  # Gövdenin kapladığı hücreler
+        self.head = keys(cells)  # Kafanın bulunduğu hücre
+        self.food = keys(cells)  # Yemin bulunduğu hücre
+        # Yılanın yönü (Direction.value -> anahtar)
+        self.direction = dict(zip([(0, -1), (0, 1), (-1, 0), (1, 0)], keys(4)))
+        # Gövde uzunluğu: grow() sonrası kuyruğu tekrarlanan yılanı ayırt eder
+        self.length = keys(cells + 2)
+
+    def cell(self, position) -> int:
+        """
+        (x, y) konumunu düz hücre indeksine çevirir
+        """
+        return position[1] * self.width + position[0]
+
+    def hash(self, game_state) -> int:
+        """
+        Bir GameState'in anahtarını baştan hesaplar: O(uzunluk)
+        Artımlı olarak tutulan GameState.key() ile aynı sonucu verir
+        """
+        snake = game_state.snake
+        key = 0
+        for position in snake.occupied:
+            key ^= self.body[self.cell(position)]
+        key ^= self.head[self.cell(snake.get_head())]
+        key ^= self.direction[snake.direction.value]
+        key ^= self.length[len(snake.body)]
+        key ^= self.food[self.cell(game_state.food.position)]
+        return key
+
+
+# Tüm modüllerin paylaştığı varsayılan tablo
+ZOBRIST = ZobristTable()
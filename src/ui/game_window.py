@@ -1,11 +1,13 @@
 import pygame
 from typing import Tuple
 from ..game.game_state import GameState
-from ..game.snake import Direction
+from ..game.snake import Direction, DIRECTION_INDEX
+from ..ai.features import encode_state
 from ..game.constants import (
     WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE,
-    BLACK, WHITE, RED, GREEN
+    BLACK, WHITE, GREEN
 )
+from .renderer import PygameRenderer, Frame
 
 
 class GameWindow:
@@ -14,9 +16,11 @@ class GameWindow:
     Pygame kullanarak oyunu ekrana çizer
     """
 
-    def __init__(self):
+    def __init__(self, record_path=None):
         """
         Pygame penceresini ve gerekli değişkenleri başlatır
+        Args:
+            record_path: Verilirse oynanan her adım bu episode kaydına eklenir
         """
         # Pygame'i başlat
         pygame.init()
@@ -37,6 +41,13 @@ class GameWindow:
         self.collision_frame = 0  # Çarpışma animasyonu için frame sayacı
         self.collision_point = None
         self.collision_type = None
+        self._build_static_layers()
+
+        # İnsan oyunları çevrimdışı eğitimde gösterim olarak kullanılabilir
+        self.recorder = None
+        if record_path is not None:
+            from ..ai.episode_log import EpisodeLogWriter
+            self.recorder = EpisodeLogWriter(record_path, source='human')
 
     def _create_button(self, text: str, center_pos: Tuple[int, int]) -> Tuple[pygame.Surface, pygame.Rect]:
         """
@@ -61,105 +72,29 @@ class GameWindow:
 
         return (text_surface, button_rect)
 
-    def _draw_grid(self):
+    def _build_static_layers(self):
         """
-        Oyun gridini yarı şeffaf çizer
+        Değişmeyen katmanları bir kez hazırlar: tahta çizicisi (arkaplan, grid, sprite önbelleği)
+        ve çarpışma yüzeyi
         """
-        # Yarı şeffaf grid rengi (RGB + Alpha)
-        grid_color = (255, 255, 255, 30)  # Beyaz renk, düşük alpha değeri
-
-        # Yarı şeffaf çizim için surface oluştur
-        grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-
-        # Dikey çizgiler
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(grid_surface, grid_color, (x, 0), (x, WINDOW_HEIGHT), 1)
+        self.renderer = PygameRenderer(self.screen, font=self.font)
 
-        # Yatay çizgiler
-        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(grid_surface, grid_color, (0, y), (WINDOW_WIDTH, y), 1)
-
-        # Yarı şeffaf grid'i ana ekrana blit et
-        self.screen.blit(grid_surface, (0, 0))
-
-    def _draw_snake(self, snake_body: list):
-        """
-        Yılanı gelişmiş grafiklerle çizer
-        """
-        for i, segment in enumerate(snake_body):
-            center = (
-                segment[0] * GRID_SIZE + GRID_SIZE // 2,
-                segment[1] * GRID_SIZE + GRID_SIZE // 2
-            )
+        # Çarpışma efekti her karede bu yüzeye yeniden çizilir
+        self.effect_surface = pygame.Surface((GRID_SIZE * 4, GRID_SIZE * 4), pygame.SRCALPHA)
 
-            # Yılan kafası
-            if i == 0:
-                # Ana daire (kafa)
-                pygame.draw.circle(self.screen, (50, 205, 50), center, GRID_SIZE // 2 - 2)
-
-                # Gözler
-                eye_color = (255, 255, 255)  # Beyaz
-                eye_radius = 3
-
-                # Göz pozisyonları (yönüne göre)
-                if self.game_state.snake.direction == Direction.RIGHT:
-                    eye_pos1 = (center[0] + 3, center[1] - 5)
-                    eye_pos2 = (center[0] + 3, center[1] + 5)
-                elif self.game_state.snake.direction == Direction.LEFT:
-                    eye_pos1 = (center[0] - 3, center[1] - 5)
-                    eye_pos2 = (center[0] - 3, center[1] + 5)
-                elif self.game_state.snake.direction == Direction.UP:
-                    eye_pos1 = (center[0] - 5, center[1] - 3)
-                    eye_pos2 = (center[0] + 5, center[1] - 3)
-                else:  # DOWN
-                    eye_pos1 = (center[0] - 5, center[1] + 3)
-                    eye_pos2 = (center[0] + 5, center[1] + 3)
-
-                # Gözleri çiz
-                pygame.draw.circle(self.screen, eye_color, eye_pos1, eye_radius)
-                pygame.draw.circle(self.screen, eye_color, eye_pos2, eye_radius)
-
-                # Göz bebekleri (siyah)
-                pupil_color = (0, 0, 0)
-                pupil_radius = 1.5
-                pygame.draw.circle(self.screen, pupil_color, eye_pos1, pupil_radius)
-                pygame.draw.circle(self.screen, pupil_color, eye_pos2, pupil_radius)
-
-            # Vücut parçaları
-            else:
-                # Gölge efekti
-                shadow_offset = 2
-                pygame.draw.circle(
-                    self.screen,
-                    (20, 20, 20),
-                    (center[0] + shadow_offset, center[1] + shadow_offset),
-                    GRID_SIZE // 2 - 4
-                )
-
-                # Vücut parçası (koyudan açığa geçiş)
-                color_ratio = 1 - (i / len(snake_body))  # 0 ile 1 arası değer
-                green_value = int(155 * color_ratio + 100)  # 100 ile 255 arası
-                body_color = (34, green_value, 34)
-                pygame.draw.circle(self.screen, body_color, center, GRID_SIZE // 2 - 4)
-
-    def _draw_food(self, position: Tuple[int, int]):
+    def _draw_full_frame(self):
         """
-        Yemi daire şeklinde çizer
+        Tüm kareyi çizer ve kirli alan takibini sıfırlar (pygame.display.flip ile gösterilir)
         """
-        center = (
-            position[0] * GRID_SIZE + GRID_SIZE // 2,
-            position[1] * GRID_SIZE + GRID_SIZE // 2
-        )
-        pygame.draw.circle(self.screen, RED, center, GRID_SIZE // 2 - 4)
+        self.renderer.draw_full(Frame.from_game_state(self.game_state))
 
-    def _draw_score(self, score: int):
+    def _draw_dirty(self) -> list:
         """
-        Skoru ekrana çizer
-        Args:
-            score (int): Güncel skor
+        Sadece önceki kareden farklı olan hücreleri (ve gerekirse skoru) yeniden çizer
+        Returns:
+            list: pygame.display.update'e verilecek değişen alanlar
         """
-        score_text = self.font.render(f'Score: {score}', True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        return self.renderer.draw_dirty(Frame.from_game_state(self.game_state))
 
     def _handle_input(self):
         """
@@ -197,8 +132,9 @@ class GameWindow:
             # Yanıp sönen efekt için alpha değeri
             alpha = 255 - (self.collision_frame * 25)
 
-            # Yarı saydam surface
-            effect_surface = pygame.Surface((GRID_SIZE * 4, GRID_SIZE * 4), pygame.SRCALPHA)
+            # Önceden ayrılmış yarı saydam yüzey temizlenip yeniden kullanılır
+            effect_surface = self.effect_surface
+            effect_surface.fill((0, 0, 0, 0))
 
             # Çarpışma tipine göre renk seç
             if self.collision_type == "wall":
@@ -216,6 +152,24 @@ class GameWindow:
 
             self.collision_frame += 1
 
+    def _record_step(self, state, prev_direction, prev_score, alive):
+        """
+        Son adımı episode kaydına ekler (ödüller Trainer ile aynıdır)
+        """
+        if not alive:
+            reward = 10 if self.game_state.won else -10
+        else:
+            reward = 10 if self.game_state.score > prev_score else 0
+        self.recorder.record_step(self.game_state, state, prev_direction, reward, not alive)
+
+    def _close(self, result):
+        """
+        Episode kaydını kapatır ve sonucu döndürür
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+        return result
+
     def run(self):
         """
         Ana oyun döngüsü
@@ -223,13 +177,22 @@ class GameWindow:
             str: "menu" (ana menüye dön) veya "quit" (çık)
         """
         running = True
-        BACKGROUND_COLOR = (10, 10, 10)
+        self._draw_full_frame()
+        pygame.display.flip()
 
         while running:
+            if self.recorder is not None:
+                state = encode_state(self.game_state)
+                prev_direction = DIRECTION_INDEX[self.game_state.snake.direction]
+                prev_score = self.game_state.score
+
             running = self._handle_input()
 
             # Oyun durumunu güncelle
-            if not self.game_state.update():
+            alive = self.game_state.update()
+            if self.recorder is not None:
+                self._record_step(state, prev_direction, prev_score, alive)
+            if not alive:
                 if self.game_state.is_game_over():
                     # Çarpışma noktasını ve tipini al
                     self.collision_point = self.game_state.get_collision_point()
@@ -237,13 +200,7 @@ class GameWindow:
 
                     # Çarpışma animasyonunu göster
                     while self.collision_frame < 10:
-                        self.screen.fill(BACKGROUND_COLOR)
-                        state = self.game_state.get_state()
-
-                        self._draw_grid()
-                        self._draw_snake(state['snake_body'])
-                        self._draw_food(state['food_position'])
-                        self._draw_score(state['score'])
+                        self._draw_full_frame()
                         self._draw_collision_effect()
 
                         pygame.display.flip()
@@ -256,32 +213,30 @@ class GameWindow:
                         self.game_state = GameState()
                         self.collision_frame = 0
                         self.collision_point = None
+                        self._draw_full_frame()
+                        pygame.display.flip()
                         continue
                     elif result == "menu":
-                        return "menu"
+                        return self._close("menu")
                     else:  # quit
-                        return "quit"
-
-            self.screen.fill(BACKGROUND_COLOR)
-            state = self.game_state.get_state()
+                        return self._close("quit")
 
-            self._draw_grid()
-            self._draw_snake(state['snake_body'])
-            self._draw_food(state['food_position'])
-            self._draw_score(state['score'])
-
-            pygame.display.flip()
+            # Sadece değişen hücreler çizilir ve ekrana aktarılır
+            rects = self._draw_dirty()
+            if rects:
+                pygame.display.update(rects)
             self.clock.tick(10)
 
-        return "quit"
+        return self._close("quit")
     def _show_game_over(self):
         """
         Oyun sonu ekranını gösterir ve buton tıklamasını bekler
         Returns:
             str: "retry" (tekrar dene), "menu" (ana menüye dön) veya "quit" (çık)
         """
-        # Game Over yazısı
-        text = self.font.render('Game Over!', True, WHITE)
+        # Game Over yazısı (tahta dolduysa kazanma mesajı)
+        title = 'Kazandın!' if self.game_state.won else 'Game Over!'
+        text = self.font.render(title, True, WHITE)
         score_text = self.font.render(
             f'Final Score: {self.game_state.get_score()}',
             True, WHITE
@@ -6,8 +6,13 @@ import matplotlib.pyplot as plt
 
 
 class Menu:
-    def __init__(self):
-        """Menü penceresini başlatır"""
+    def __init__(self, record_path=None):
+        """
+        Menü penceresini başlatır
+        Args:
+            record_path: Verilirse insan oyunları bu episode kaydına eklenir
+        """
+        self.record_path = record_path
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Snake Game - Menu")
@@ -86,7 +91,7 @@ class Menu:
                         if button_rect.collidepoint(mouse_pos):
                             if i == 0:  # İnsan Oyuncusu
                                 self._show_game_instructions()
-                                game = GameWindow()
+                                game = GameWindow(record_path=self.record_path)
                                 result = game.run()
 
                                 # Eğer menüye dönüş istendiyse
@@ -0,0 +1,304 @@
+from array import array
+from typing import NamedTuple, Optional, Tuple
+import numpy as np
+from ..game.snake import Direction, DIRECTIONS
+from ..game.game_state import unpack_cell
+from ..game.constants import GRID_WIDTH, GRID_HEIGHT, GRID_SIZE, WHITE, RED
+
+# Ortak görünüm: her iki arka uç da aynı renkleri kullanır
+BACKGROUND_COLOR = (10, 10, 10)
+GRID_COLOR = (255, 255, 255, 30)  # Yarı şeffaf grid (RGB + Alpha)
+HEAD_COLOR = (50, 205, 50)
+SHADOW_COLOR = (20, 20, 20)
+FOOD_COLOR = RED
+BODY_COLOR_LEVELS = 32  # Gövde renk geçişindeki seviye (önbellekteki gövde sprite'ı) sayısı
+
+
+def body_color(level: int) -> Tuple[int, int, int]:
+    """
+    Gövde renk seviyesinin rengini döndürür (kafaya yakın parçalar daha açık)
+    """
+    color_ratio = 1 - level / BODY_COLOR_LEVELS  # 0 ile 1 arası değer
+    return (34, int(155 * color_ratio + 100), 34)  # Yeşil: 100 ile 255 arası
+
+
+class Frame(NamedTuple):
+    """
+    Çizilecek tek bir kare: gövde hücreleri (kafa ilk), yön, yem ve skor
+    Oyun durumundan veya yayınlanmış bir GameSnapshot'tan oluşturulur
+    """
+    body: list
+    direction: Direction
+    food: Tuple[int, int]
+    score: Optional[int] = None
+
+    @classmethod
+    def from_game_state(cls, game_state, score=True) -> 'Frame':
+        return cls(list(game_state.snake.body), game_state.snake.direction,
+                   game_state.food.position, game_state.score if score else None)
+
+    @classmethod
+    def from_snapshot(cls, snapshot, score=True) -> 'Frame':
+        cells = array('H')
+        cells.frombytes(snapshot.body)
+        return cls([unpack_cell(index) for index in cells], DIRECTIONS[snapshot.direction],
+                   unpack_cell(snapshot.food), snapshot.score if score else None)
+
+
+def sprite_keys(frame: Frame) -> dict:
+    """
+    Karede her hücreye çizilecek sprite anahtarını döndürür
+    Gövde rengi BODY_COLOR_LEVELS seviyeye bölünür; yılan ilerlediğinde sadece seviye
+    sınırındaki parçaların rengi değişir, diğer hücreler yeniden çizilmez
+    """
+    keys = {}
+    length = len(frame.body)
+    for i, segment in enumerate(frame.body):
+        if i == 0:
+            keys[segment] = ('head', frame.direction)
+        else:
+            keys[segment] = ('body', i * BODY_COLOR_LEVELS // length)
+    keys[frame.food] = ('food',)
+    return keys
+
+
+class PygameRenderer:
+    """
+    Oyun tahtasını bir pygame yüzeyine çizer
+    Arkaplan ve grid bir kez hazırlanır, hücre sprite'ları önbelleğe alınır;
+    draw_dirty() sadece önceki kareden farklı hücreleri yeniden çizer
+    """
+
+    def __init__(self, surface, font=None, origin=(0, 0), cell_size=GRID_SIZE,
+                 width=GRID_WIDTH, height=GRID_HEIGHT):
+        """
+        Args:
+            surface: Çizim yapılacak yüzey (genelde ekran)
+            font: Verilirse karedeki skor sol üst köşeye yazılır
+            origin: Tahtanın yüzeydeki sol üst köşesi
+            cell_size: Hücre boyutu (piksel)
+            width, height: Tahta boyutu (hücre)
+        """
+        import pygame
+        self.pygame = pygame
+        self.surface = surface
+        self.font = font
+        self.origin = origin
+        self.cell_size = cell_size
+        self.rect = pygame.Rect(origin[0], origin[1], width * cell_size, height * cell_size)
+
+        self.background = pygame.Surface(self.rect.size).convert()
+        self.background.fill(BACKGROUND_COLOR)
+        grid_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for x in range(0, self.rect.width, cell_size):
+            pygame.draw.line(grid_surface, GRID_COLOR, (x, 0), (x, self.rect.height), 1)
+        for y in range(0, self.rect.height, cell_size):
+            pygame.draw.line(grid_surface, GRID_COLOR, (0, y), (self.rect.width, y), 1)
+        self.background.blit(grid_surface, (0, 0))
+
+        self.sprites = {}  # Sprite anahtarı -> hücre boyutunda yüzey
+        self.drawn = {}  # Ekranda çizili hücre -> sprite anahtarı
+        self.drawn_score = None
+        self.score_rect = pygame.Rect(origin[0] + 10, origin[1] + 10, 0, 0)
+
+    def sprite(self, key):
+        """
+        Hücre sprite'ını döndürür; ilk istendiğinde çizilip önbelleğe alınır
+        Anahtarlar: ('head', Direction), ('body', renk seviyesi), ('food',)
+        """
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            return sprite
+
+        pygame = self.pygame
+        size = self.cell_size
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (size // 2, size // 2)
+
+        # Yılan kafası
+        if key[0] == 'head':
+            pygame.draw.circle(sprite, HEAD_COLOR, center, size // 2 - 2)
+
+            # Göz pozisyonları (yönüne göre)
+            direction = key[1]
+            if direction == Direction.RIGHT:
+                eyes = ((center[0] + 3, center[1] - 5), (center[0] + 3, center[1] + 5))
+            elif direction == Direction.LEFT:
+                eyes = ((center[0] - 3, center[1] - 5), (center[0] - 3, center[1] + 5))
+            elif direction == Direction.UP:
+                eyes = ((center[0] - 5, center[1] - 3), (center[0] + 5, center[1] - 3))
+            else:  # DOWN
+                eyes = ((center[0] - 5, center[1] + 3), (center[0] + 5, center[1] + 3))
+
+            # Gözler ve göz bebekleri
+            for eye_pos in eyes:
+                pygame.draw.circle(sprite, WHITE, eye_pos, 3)
+                pygame.draw.circle(sprite, (0, 0, 0), eye_pos, 1.5)
+
+        # Vücut parçaları: gölge (hücre içinde kalır) ve renk geçişi
+        elif key[0] == 'body':
+            shadow_offset = 2
+            pygame.draw.circle(sprite, SHADOW_COLOR,
+                               (center[0] + shadow_offset, center[1] + shadow_offset), size // 2 - 4)
+            pygame.draw.circle(sprite, body_color(key[1]), center, size // 2 - 4)
+
+        # Yem
+        else:
+            pygame.draw.circle(sprite, FOOD_COLOR, center, size // 2 - 4)
+
+        sprite = sprite.convert_alpha()
+        self.sprites[key] = sprite
+        return sprite
+
+    def cell_rect(self, cell):
+        size = self.cell_size
+        return self.pygame.Rect(self.origin[0] + cell[0] * size, self.origin[1] + cell[1] * size, size, size)
+
+    def _draw_cell(self, cell, key):
+        """
+        Hücrenin arkaplanını geri yükler ve (varsa) sprite'ını çizer
+        """
+        rect = self.cell_rect(cell)
+        self.surface.blit(self.background, rect, rect.move(-self.origin[0], -self.origin[1]))
+        if key is not None:
+            self.surface.blit(self.sprite(key), rect)
+        return rect
+
+    def _draw_score(self, score):
+        text = self.font.render(f'Score: {score}', True, WHITE)
+        return self.surface.blit(text, (self.origin[0] + 10, self.origin[1] + 10))
+
+    def draw_full(self, frame: Frame):
+        """
+        Tüm tahtayı çizer ve kirli alan takibini sıfırlar
+        Returns:
+            pygame.Rect: Tahtanın alanı
+        """
+        self.surface.blit(self.background, self.origin)
+        keys = sprite_keys(frame)
+        for cell, key in keys.items():
+            self.surface.blit(self.sprite(key), self.cell_rect(cell))
+        self.drawn = keys
+        if self.font is not None and frame.score is not None:
+            self.score_rect = self._draw_score(frame.score)
+            self.drawn_score = frame.score
+        return self.rect
+
+    def draw_dirty(self, frame: Frame) -> list:
+        """
+        Sadece önceki kareden farklı olan hücreleri (ve gerekirse skoru) yeniden çizer
+        Returns:
+            list: pygame.display.update'e verilecek değişen alanlar
+        """
+        keys = sprite_keys(frame)
+        drawn = self.drawn
+        rects = []
+        for cell, key in keys.items():
+            if drawn.get(cell) != key:
+                rects.append(self._draw_cell(cell, key))
+        for cell in drawn:
+            if cell not in keys:
+                rects.append(self._draw_cell(cell, None))
+        self.drawn = keys
+
+        # Skor yazısı hücrelerin üzerindedir: skor değiştiyse ya da altı yeniden çizildiyse yenilenir
+        if self.font is not None and frame.score is not None and (
+                frame.score != self.drawn_score or self.score_rect.collidelist(rects) != -1):
+            old_rect = self.score_rect
+            self.surface.blit(self.background, old_rect, old_rect.move(-self.origin[0], -self.origin[1]))
+            for cell, key in keys.items():
+                rect = self.cell_rect(cell)
+                if rect.colliderect(old_rect):
+                    self.surface.blit(self.sprite(key), rect)
+            self.score_rect = self._draw_score(frame.score)
+            self.drawn_score = frame.score
+            rects.append(old_rect.union(self.score_rect))
+        return rects
+
+
+class NumpyRenderer:
+    """
+    Oyun tahtasını SDL olmadan önceden ayrılmış bir (H, W, 3) uint8 RGB dizisine çizer
+    Hücreler kare bloklar olarak boyanır: önce hücre başına bir renk seçilir, sonra iki
+    yayınlama (broadcast) atamasıyla önce bir piksel satırı genişletilir, sonra satırlar çoğaltılır
+    Video kaydı ve piksel gözlemli eğitim için kullanılır
+    """
+
+    def __init__(self, cell_size=8, grid=True, width=GRID_WIDTH, height=GRID_HEIGHT, indexed=False):
+        """
+        Args:
+            cell_size: Hücre boyutu (piksel); 1 ise her hücre tek piksel olur
+            grid: Hücreler arasına grid çizgisi çizilsin mi
+            width, height: Tahta boyutu (hücre)
+            indexed: True ise RGB yerine (H, W) palet indeksleri çizilir (renkler self.palette'te; GIF için)
+        """
+        self.cell_size = cell_size
+        self.grid = grid and cell_size > 2
+        self.width = width
+        self.height = height
+        self.indexed = indexed
+
+        # Renk paleti: 0 arkaplan, 1 kafa, 2 yem, 3.. gövde seviyeleri, son eleman grid çizgisi
+        alpha = GRID_COLOR[3] / 255
+        grid_color = tuple(round(c * alpha + b * (1 - alpha)) for c, b in zip(GRID_COLOR[:3], BACKGROUND_COLOR))
+        self.palette = np.array(
+            [BACKGROUND_COLOR, HEAD_COLOR, FOOD_COLOR] +
+            [body_color(level) for level in range(BODY_COLOR_LEVELS)] + [grid_color], dtype=np.uint8)
+        self.grid_index = len(self.palette) - 1
+        self.grid_color = self.grid_index if indexed else self.palette[self.grid_index]
+
+        self.cells = np.zeros(width * height, dtype=np.uint8)  # Hücre başına palet indeksi
+        channels = () if indexed else (3,)
+        self.frame = np.zeros((height * cell_size, width * cell_size) + channels, dtype=np.uint8)
+        # Hücre satırı başına tek piksel satırı; ardışık bellekte yayınlama tek adımlı atamadan hızlıdır
+        self._rows = np.zeros((height, width * cell_size) + channels, dtype=np.uint8)
+        self._row_blocks = self._rows.reshape((height, width, cell_size) + channels)
+        self._frame_blocks = self.frame.reshape((height, cell_size, width * cell_size) + channels)
+        self._cell_shape = (height, width, 1) + channels
+
+    def _levels(self, length):
+        """
+        Gövde parçalarının palet indeksleri (kafa dahil, kafa ayrıca boyanır)
+        """
+        return (3 + np.arange(length) * BODY_COLOR_LEVELS // max(length, 1)).astype(np.uint8)
+
+    def _rasterize(self, body_cells, food_cell):
+        """
+        Düz hücre indekslerinden kareyi çizer
+        """
+        cells = self.cells
+        cells.fill(0)
+        # Kuyruktan kafaya doğru yazılır; aynı hücrede iki parça varsa kafaya yakın olan kalır
+        cells[body_cells[::-1]] = self._levels(len(body_cells))[::-1]
+        cells[body_cells[0]] = 1
+        cells[food_cell] = 2
+
+        values = cells if self.indexed else self.palette[cells]
+        self._row_blocks[...] = values.reshape(self._cell_shape)
+        self._frame_blocks[...] = self._rows[:, None]
+        if self.grid:
+            self.frame[::self.cell_size] = self.grid_color
+            self.frame[:, ::self.cell_size] = self.grid_color
+        return self.frame
+
+    def render(self, frame: Frame) -> np.ndarray:
+        """
+        Kareyi çizer
+        Returns:
+            np.ndarray: (H, W, 3) uint8 dizi, indexed ise (H, W) palet indeksleri
+                (her çağrıda üzerine yazılır; saklanacaksa kopyalanmalı)
+        """
+        body = np.fromiter((y * self.width + x for x, y in frame.body), dtype=np.int64,
+                           count=len(frame.body))
+        x, y = frame.food
+        return self._rasterize(body, y * self.width + x)
+
+    def render_snapshot(self, snapshot) -> np.ndarray:
+        """
+        GameSnapshot'ı Python listesine açmadan doğrudan paketlenmiş hücrelerden çizer
+        """
+        body = np.frombuffer(snapshot.body, dtype='<u2').astype(np.int64)
+        return self._rasterize(body, snapshot.food)
+
+    def render_game_state(self, game_state) -> np.ndarray:
+        return self.render(Frame.from_game_state(game_state))
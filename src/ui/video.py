@@ -0,0 +1,211 @@
+import os
+import struct
+import zlib
+import numpy as np
+from .renderer import NumpyRenderer
+
+# GIF kodlayıcısı: 7 bitlik palet ile her LZW kodu tam 8 bit olur. Sözlük büyüyüp kod
+# genişliği 9 bite çıkmadan her 126 pikselde bir temizleme kodu yazılır; böylece bir karenin
+# LZW akışı sıkıştırma yapılmadan, tek NumPy işlemiyle piksel baytlarından kurulur.
+GIF_CODE_SIZE = 7
+GIF_PALETTE_SIZE = 1 << GIF_CODE_SIZE
+GIF_CLEAR = GIF_PALETTE_SIZE
+GIF_END = GIF_PALETTE_SIZE + 1
+GIF_CHUNK = GIF_PALETTE_SIZE - 2  # Temizleme kodları arasındaki piksel sayısı
+GIF_BLOCK = 255  # Alt blok başına en fazla veri baytı
+
+
+def _gif_image_data(pixels):
+    """
+    Palet indekslerini (< 128) GIF görüntü verisine (LZW alt blokları) çevirir
+    """
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8).ravel()
+    stream = np.append(_split(pixels, GIF_CHUNK, GIF_CLEAR), np.uint8(GIF_END))
+    data = _split(stream, GIF_BLOCK, None)
+    return bytes([GIF_CODE_SIZE]) + data.tobytes() + b'\x00'
+
+
+def _split(values, size, marker):
+    """
+    Diziyi size'lık parçalara böler ve her parçanın önüne marker'ı (None ise parça uzunluğunu) koyar
+    """
+    chunks = -(-len(values) // size)
+    padded = np.zeros(chunks * size, dtype=np.uint8)
+    padded[:len(values)] = values
+    out = np.empty((chunks, size + 1), dtype=np.uint8)
+    out[:, 0] = size if marker is None else marker
+    out[:, 1:] = padded.reshape(chunks, size)
+    last = len(values) - (chunks - 1) * size
+    if marker is None:
+        out[-1, 0] = last
+    flat = out.reshape(-1)
+    return flat[:len(flat) - (size - last)]
+
+
+class GifWriter:
+    """
+    Animasyonlu GIF'i kare kare diske yazar; kareler bellekte biriktirilmez
+    Her karede sadece önceki kareden değişen dikdörtgen yazılır
+    """
+
+    def __init__(self, path, width, height, palette, fps=10):
+        """
+        Args:
+            path: Yazılacak .gif dosyası
+            width, height: Görüntü boyutu (piksel)
+            palette: (N, 3) uint8 renkler, N <= 128
+            fps: Saniyedeki kare sayısı
+        """
+        if len(palette) > GIF_PALETTE_SIZE:
+            raise ValueError(f"GIF paleti en fazla {GIF_PALETTE_SIZE} renk içerebilir")
+        self.path = path
+        self.width = width
+        self.height = height
+        self.delay = max(1, round(100 / fps))  # Saniyenin yüzde biri cinsinden
+        self.previous = None
+        self.frames = 0
+
+        color_table = np.zeros((GIF_PALETTE_SIZE, 3), dtype=np.uint8)
+        color_table[:len(palette)] = palette
+        self.file = open(path, 'wb')
+        # Mantıksal ekran: global renk tablosu var, 8 bit renk, 2^(6+1) = 128 girişli tablo
+        self.file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF0 | (GIF_CODE_SIZE - 1), 0, 0))
+        self.file.write(color_table.tobytes())
+        # Sonsuz döngü (NETSCAPE2.0 uzantısı)
+        self.file.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00')
+
+    def add_frame(self, pixels):
+        """
+        Bir kare ekler
+        Args:
+            pixels: (height, width) uint8 palet indeksleri
+        """
+        if self.previous is None:
+            x0, y0, x1, y1 = 0, 0, self.width, self.height
+        else:
+            changed = pixels != self.previous
+            rows = np.flatnonzero(changed.any(axis=1))
+            if len(rows) == 0:
+                # Değişiklik yok: tek pikselle kareyi (ve süresini) koru
+                x0, y0, x1, y1 = 0, 0, 1, 1
+            else:
+                cols = np.flatnonzero(changed[rows[0]:rows[-1] + 1].any(axis=0))
+                x0, y0, x1, y1 = cols[0], rows[0], cols[-1] + 1, rows[-1] + 1
+        self.previous = pixels.copy()
+
+        # Grafik kontrol uzantısı (kare süresi, önceki kare yerinde kalır) + görüntü tanımlayıcı
+        self.file.write(struct.pack('<BBBBHBB', 0x21, 0xF9, 4, 0x04, self.delay, 0, 0))
+        self.file.write(struct.pack('<BHHHHB', 0x2C, x0, y0, x1 - x0, y1 - y0, 0))
+        self.file.write(_gif_image_data(pixels[y0:y1, x0:x1]))
+        self.frames += 1
+
+    def close(self):
+        """
+        Dosya sonunu yazar ve dosyayı kapatır
+        """
+        if not self.file.closed:
+            self.file.write(b'\x3B')
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_png(path, image):
+    """
+    (H, W, 3) uint8 RGB görüntüyü PNG olarak yazar (pygame/SDL gerektirmez)
+    """
+    height, width = image.shape[:2]
+    # Her satırın başına filtre tipi 0 (yok) eklenir
+    raw = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+
+class PngSequenceWriter:
+    """
+    Kareleri bir dizine frame_00000.png, frame_00001.png, ... olarak yazar
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.frames = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def add_frame(self, image):
+        """
+        Bir kare ekler
+        Args:
+            image: (H, W, 3) uint8 RGB görüntü
+        """
+        write_png(os.path.join(self.directory, f'frame_{self.frames:05d}.png'), image)
+        self.frames += 1
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EpisodeRecorder:
+    """
+    Ekran açmadan bir episode'un karelerini GIF'e veya PNG dizisine akıtır
+    Kareler NumpyRenderer ile çizilir; yol .gif ile bitiyorsa GIF, aksi halde PNG dizini yazılır
+    """
+
+    def __init__(self, path, fps=10, cell_size=8):
+        """
+        Args:
+            path: .gif dosyası veya PNG karelerinin yazılacağı dizin
+            fps: GIF'in saniyedeki kare sayısı
+            cell_size: Hücre boyutu (piksel)
+        """
+        self.path = path
+        if path.lower().endswith('.gif'):
+            self.renderer = NumpyRenderer(cell_size=cell_size, indexed=True)
+            height, width = self.renderer.frame.shape
+            self.writer = GifWriter(path, width, height, self.renderer.palette, fps=fps)
+        else:
+            self.renderer = NumpyRenderer(cell_size=cell_size)
+            self.writer = PngSequenceWriter(path)
+
+    @property
+    def frames(self):
+        return self.writer.frames
+
+    def capture(self, game_state):
+        """
+        Oyun durumunun karesini ekler
+        """
+        self.writer.add_frame(self.renderer.render_game_state(game_state))
+
+    def capture_snapshot(self, snapshot):
+        """
+        GameSnapshot'ın karesini ekler
+        """
+        self.writer.add_frame(self.renderer.render_snapshot(snapshot))
+
+    def close(self):
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,110 @@
+import os
+import random
+import numpy as np
+import pytest
+
+pytest.importorskip('tensorflow')
+
+from src.ai.checkpoint import latest_checkpoint
+from src.ai.memory import read_json, write_json
+from src.ai.trainer import Trainer
+
+
+def _trainer(directory, **kwargs):
+    kwargs.setdefault('episodes', 4)
+    return Trainer(checkpoint_dir=str(directory), memory_size=500, **kwargs)
+
+
+def _assert_same_training_state(a, b):
+    assert a.scores == b.scores and a.mean_scores == b.mean_scores
+    for key in ('epsilon', 'episode_count', 'gamma', 'batch_size'):
+        assert getattr(a.agent, key) == getattr(b.agent, key)
+    model_a, model_b = a.agent.model, b.agent.model
+    assert int(model_a.train_steps.numpy()) == int(model_b.train_steps.numpy()) > 0
+    for x, y in zip(model_a.model.get_weights(), model_b.model.get_weights()):
+        np.testing.assert_array_equal(x, y)
+    for x, y in zip(model_a.target_model.get_weights(), model_b.target_model.get_weights()):
+        np.testing.assert_array_equal(x, y)
+    memory_a, memory_b = a.agent.memory, b.agent.memory
+    assert (memory_a.size, memory_a.ptr, memory_a.count) == (memory_b.size, memory_b.ptr, memory_b.count)
+    indices = np.arange(memory_a.size)
+    for x, y in zip(memory_a._gather(indices), memory_b._gather(indices)):
+        np.testing.assert_array_equal(x, y)
+
+
+def test_save_and_resume_round_trip(tmp_path):
+    trainer = _trainer(tmp_path)
+    trainer.train_headless(log_every=0)
+    path = trainer.save_checkpoint()
+    assert latest_checkpoint(str(tmp_path)) == path
+    # Kayıttan sonraki rastgele sayılar geri yüklemeden sonra aynen tekrarlanmalı
+    expected = (random.random(), np.random.random(), trainer.agent.memory.rng.random())
+
+    resumed = _trainer(tmp_path, episodes=6)
+    assert resumed.load_checkpoint() == path
+    assert (random.random(), np.random.random(), resumed.agent.memory.rng.random()) == expected
+    _assert_same_training_state(trainer, resumed)
+
+    # Eğitim kalan episode'lardan devam eder
+    resumed.train_headless(log_every=0)
+    assert len(resumed.scores) == 6 and resumed.scores[:4] == trainer.scores
+    resumed.close()
+
+
+def test_crash_saves_checkpoint_without_touching_the_periodic_one(tmp_path):
+    trainer = _trainer(tmp_path, episodes=50, checkpoint_every=2)
+    replay = trainer.agent.replay
+
+    def failing_replay():
+        if len(trainer.scores) >= 2:
+            raise RuntimeError("eğitim hatası")
+        replay()
+
+    trainer.agent.replay = failing_replay
+    with pytest.raises(RuntimeError):
+        trainer.train_headless(log_every=0)
+
+    # Periyodik kayıt ve hata kaydı aynı episode sayısında: ikisi de ayrı dizinlerde kalır
+    assert sorted(entry for entry in os.listdir(tmp_path) if entry.startswith('ckpt-')) == \
+        ['ckpt-00000002', 'ckpt-00000002-1']
+    assert latest_checkpoint(str(tmp_path)) == str(tmp_path / 'ckpt-00000002-1')
+
+    for path in (tmp_path / 'ckpt-00000002', tmp_path / 'ckpt-00000002-1'):
+        resumed = _trainer(tmp_path, episodes=50)
+        resumed.load_checkpoint(str(path))
+        assert resumed.scores == trainer.scores[:2]
+
+
+def test_keeps_only_the_newest_checkpoints(tmp_path):
+    trainer = _trainer(tmp_path, episodes=6, checkpoint_every=1)
+    trainer.train_headless(log_every=0)
+    trainer.close()
+    assert sorted(entry for entry in os.listdir(tmp_path) if entry.startswith('ckpt-')) == \
+        ['ckpt-00000005', 'ckpt-00000006']
+
+
+def test_rejects_mismatched_settings(tmp_path):
+    trainer = _trainer(tmp_path, episodes=1)
+    trainer.train_headless(log_every=0)
+    trainer.save_checkpoint()
+    with pytest.raises(ValueError):
+        _trainer(tmp_path, rays=True).load_checkpoint()
+
+
+def test_rejects_malformed_checkpoint(tmp_path):
+    trainer = _trainer(tmp_path, episodes=1)
+    trainer.train_headless(log_every=0)
+    path = trainer.save_checkpoint()
+    state_path = os.path.join(path, 'trainer.json')
+    state = read_json(state_path)
+
+    del state['observation']
+    write_json(state_path, state)
+    with pytest.raises(ValueError, match='observation'):
+        _trainer(tmp_path).load_checkpoint()
+
+    state['observation'] = 'features'
+    state['version'] = 99
+    write_json(state_path, state)
+    with pytest.raises(ValueError, match='sürüm'):
+        _trainer(tmp_path).load_checkpoint()
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from src.ai.memory import MemmapReplayMemory, PrioritizedReplayMemory, ReplayMemory
+
+
+def _transitions(n, seed=0, state_size=5):
+    rng = np.random.default_rng(seed)
+    states = rng.random((n, state_size)).astype(np.float32)
+    next_states = rng.random((n, state_size)).astype(np.float32)
+    return (states, rng.integers(0, 3, n), rng.random(n).astype(np.float32), next_states,
+            rng.random(n) < 0.1)
+
+
+def _assert_same_memory(a, b):
+    assert (a.size, a.ptr, a.count) == (b.size, b.ptr, b.count)
+    indices = np.arange(a.size)
+    for x, y in zip(a._gather(indices), b._gather(indices)):
+        np.testing.assert_array_equal(x, y)
+
+
+@pytest.mark.parametrize('make', [
+    lambda tmp_path, name: ReplayMemory(50),
+    lambda tmp_path, name: ReplayMemory(50, dedupe_next_states=True),
+    lambda tmp_path, name: PrioritizedReplayMemory(50),
+    lambda tmp_path, name: MemmapReplayMemory(str(tmp_path / name), 50, flush_every=7),
+], ids=['ring', 'dedupe', 'prioritized', 'memmap'])
+def test_add_batch_matches_sequential_add(tmp_path, make):
+    one, batched = make(tmp_path, 'one'), make(tmp_path, 'batched')
+    # Halka tamponunun sonundan taşan ve kapasiteden büyük gruplar da denenir
+    for n, seed in ((8, 0), (30, 1), (27, 2), (120, 3), (1, 4)):
+        data = _transitions(n, seed)
+        for row in zip(*data):
+            one.add(*row)
+        batched.add_batch(*data)
+        _assert_same_memory(one, batched)
+    if isinstance(one, PrioritizedReplayMemory):
+        np.testing.assert_allclose(one.tree.tree, batched.tree.tree)
+
+
+def _episodes(n, seed=0, state_size=4):
+    """
+    Ardışık geçişler üretir: next_state bir sonraki geçişin state'idir, episode sonunda değildir
+    """
+    rng = np.random.default_rng(seed)
+    state = rng.random(state_size).astype(np.float32)
+    for _ in range(n):
+        next_state = rng.random(state_size).astype(np.float32)
+        done = rng.random() < 0.15
+        yield state, int(rng.integers(3)), float(rng.random()), next_state, done
+        state = rng.random(state_size).astype(np.float32) if done else next_state
+
+
+@pytest.mark.parametrize('capacity,n', [(10, 7), (10, 10), (10, 11), (16, 100), (7, 333)])
+def test_deduped_next_states_match_plain_ring_buffer(capacity, n):
+    plain = ReplayMemory(capacity)
+    deduped = ReplayMemory(capacity, dedupe_next_states=True)
+    for transition in _episodes(n, seed=n):
+        plain.add(*transition)
+        deduped.add(*transition)
+    _assert_same_memory(plain, deduped)
+    # Satır paylaşımı gerçekten yapılıyor: tekilleştirilmiş bellek bir satır fazla tutar
+    assert len(deduped.states) == capacity + 1
+    assert len(deduped.overflow) == deduped.has_overflow.sum()
+
+
+def test_deduped_overflow_for_non_consecutive_transitions():
+    # Her geçiş bağımsız (ör. farklı oyunlar): tüm next_state'ler ayrı kopyaya düşer
+    plain = ReplayMemory(8)
+    deduped = ReplayMemory(8, dedupe_next_states=True)
+    data = _transitions(20, seed=5)
+    for row in zip(*data):
+        plain.add(*row)
+        deduped.add(*row)
+    _assert_same_memory(plain, deduped)
+
+
+def test_sample_returns_stored_rows():
+    memory = ReplayMemory(32, seed=0)
+    data = _transitions(20, seed=6)
+    memory.add_batch(*data)
+    states, actions, rewards, next_states, dones = memory.sample(64)
+    assert len(states) == 20  # Bellekteki deneyimden fazlası istenirse boyut kırpılır
+    rows = [np.flatnonzero((data[0] == state).all(axis=1))[0] for state in states]
+    np.testing.assert_array_equal(actions, data[1][rows])
+    np.testing.assert_array_equal(next_states, data[3][rows])
+    np.testing.assert_array_equal(dones, data[4][rows])
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from src.ai.memory import PrioritizedReplayMemory, SumTree
+
+
+def _check_sums(tree):
+    # Her iç düğüm iki çocuğunun toplamıdır
+    for node in range(1, tree.leaf_offset):
+        assert tree.tree[node] == tree.tree[2 * node] + tree.tree[2 * node + 1]
+
+
+@pytest.mark.parametrize('capacity', [1, 5, 8, 100])
+def test_sums_after_updates(capacity):
+    rng = np.random.default_rng(capacity)
+    tree = SumTree(capacity)
+    priorities = np.zeros(capacity)
+    for _ in range(50):
+        # Tekrarlanan indeksler dahil rastgele gruplar; tam sayılar toplamları kesin yapar
+        indices = rng.integers(0, capacity, size=rng.integers(1, 8))
+        values = rng.integers(0, 100, size=len(indices)).astype(np.float64)
+        tree.update(indices, values)
+        for i, value in zip(indices, values):
+            priorities[i] = value  # Aynı indeks birden fazla verilirse sonuncusu geçerli
+        _check_sums(tree)
+        np.testing.assert_array_equal(tree.get(np.arange(capacity)), priorities)
+        assert tree.total() == priorities.sum()
+
+
+@pytest.mark.parametrize('capacity', [1, 6, 64, 1000])
+def test_find_matches_prefix_sums(capacity):
+    rng = np.random.default_rng(capacity)
+    tree = SumTree(capacity)
+    priorities = rng.integers(0, 10, size=capacity).astype(np.float64)
+    priorities[rng.integers(capacity)] = 3.0  # Toplam sıfır olmasın
+    tree.update(np.arange(capacity), priorities)
+
+    values = rng.random(500) * tree.total()
+    # Kümülatif toplamı değeri geçen (veya ona eşit olan) ilk yaprak
+    expected = np.searchsorted(np.cumsum(priorities), values, side='left')
+    np.testing.assert_array_equal(tree.find(values), expected)
+    # Sıfır öncelikli yapraklar hiç seçilmez
+    assert (priorities[tree.find(values)] > 0).all()
+
+
+def test_prioritized_sampling_follows_priorities():
+    memory = PrioritizedReplayMemory(16, alpha=1.0, beta=0.5, epsilon=0.0, seed=0)
+    for i in range(16):
+        memory.add(np.full(2, i, dtype=np.float32), 0, 0.0, np.zeros(2, dtype=np.float32), False)
+    errors = np.ones(16)
+    errors[3] = 15.0  # Toplam önceliğin yarısı
+    memory.update_priorities(np.arange(16), errors)
+
+    counts = np.zeros(16)
+    for _ in range(200):
+        *_, indices, weights = memory.sample(8)
+        assert (indices < memory.size).all()
+        assert weights.max() == 1.0
+        counts += np.bincount(indices, minlength=16)
+    # Katmanlı örnekleme: 8 eşit parçadan 4'ü 3. yaprağın [3, 18) aralığına düşer
+    assert 0.45 < counts[3] / counts.sum() < 0.55
+    # Sık seçilen deneyimin önem ağırlığı en küçüktür
+    *_, indices, weights = memory.sample(16)
+    assert weights[indices == 3].max() < weights[indices != 3].min()
+
+
+def test_new_transitions_get_max_priority():
+    memory = PrioritizedReplayMemory(8, alpha=0.5, seed=0)
+    memory.add(np.zeros(2, dtype=np.float32), 0, 0.0, np.zeros(2, dtype=np.float32), False)
+    memory.update_priorities([0], [9.0])
+    memory.add(np.ones(2, dtype=np.float32), 0, 0.0, np.zeros(2, dtype=np.float32), False)
+    assert memory.tree.get([1])[0] == pytest.approx((9.0 + memory.epsilon) ** 0.5)
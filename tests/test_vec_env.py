@@ -0,0 +1,61 @@
+import random
+from functools import partial
+import numpy as np
+from src.ai.features import encode_batch, encode_state
+from src.game.game_state import GameState
+from src.game.snake import DIRECTIONS, DIRECTION_INDEX
+from src.game.vec_env import VecSnakeEnv
+
+
+def _safe_action(game_state, rng):
+    """
+    Çarpışmayan yönlerden birini (varsa) rastgele seçer; yeme yönelen yön daha olasıdır
+    """
+    snake = game_state.snake
+    head = snake.get_head()
+    food = game_state.food.position
+    safe = [i for i, d in enumerate(DIRECTIONS)
+            if not snake.is_collision((head[0] + d.value[0], head[1] + d.value[1]))]
+    if not safe:
+        return DIRECTION_INDEX[snake.direction]
+    closer = [i for i in safe
+              if abs(head[0] + DIRECTIONS[i].value[0] - food[0]) + abs(head[1] + DIRECTIONS[i].value[1] - food[1])
+              < abs(head[0] - food[0]) + abs(head[1] - food[1])]
+    return rng.choice(closer if closer and rng.random() < 0.8 else safe)
+
+
+def _occupied(env):
+    ys, xs = np.nonzero(env.grid[0])
+    return set(zip(xs.tolist(), ys.tolist()))
+
+
+def test_matches_game_state_step_by_step():
+    rng = random.Random(0)
+    steps = eaten = 0
+    for episode in range(6):
+        env = VecSnakeEnv(1, partial(encode_batch, rays=True), seed=episode)
+        game_state = GameState(seed=rng.randrange(1 << 30))
+        game_state.food.set_position(tuple(env.food[0].tolist()))
+        for _ in range(300):
+            assert set(game_state.snake.occupied) == _occupied(env)
+            assert game_state.snake.get_head() == tuple(env.heads[0].tolist())
+            np.testing.assert_array_equal(encode_state(game_state, rays=True), env.observe()[0])
+
+            action = _safe_action(game_state, rng)
+            game_state.change_direction(DIRECTIONS[action])
+            prev_score = game_state.score
+            running = game_state.update()
+            _, rewards, dones = env.step([action])
+            steps += 1
+
+            assert bool(dones[0]) == (not running)
+            if not running:
+                assert env.episode_scores[0] == game_state.score
+                break
+            assert env.scores[0] == game_state.score
+            if game_state.score > prev_score:
+                eaten += 1
+                assert rewards[0] == 10.0
+                # İki ortam yemi kendi RNG'siyle koyar; aynı oyunu sürdürmek için eşitlenir
+                game_state.food.set_position(tuple(env.food[0].tolist()))
+    assert eaten > 10 and steps > 300
@@ -0,0 +1,139 @@
+import struct
+import zlib
+import numpy as np
+import pytest
+from src.game.game_state import GameState
+from src.game.snake import DIRECTIONS
+from src.ui.renderer import NumpyRenderer
+from src.ui.video import EpisodeRecorder, GifWriter, write_png
+
+
+def _lzw_decode(data, code_size):
+    """
+    Genel GIF LZW çözücüsü (değişken kod genişliği, 12 bite kadar)
+    """
+    clear, end = 1 << code_size, (1 << code_size) + 1
+    width, table, previous = code_size + 1, None, None
+    bits = count = pos = 0
+    out = []
+    while True:
+        while count < width:
+            bits |= data[pos] << count
+            pos += 1
+            count += 8
+        code = bits & ((1 << width) - 1)
+        bits >>= width
+        count -= width
+        if code == clear:
+            table = [[i] for i in range(clear)] + [None, None]
+            width, previous = code_size + 1, None
+            continue
+        if code == end:
+            return out
+        if previous is None:
+            entry = table[code]
+        else:
+            entry = table[code] if code < len(table) else previous + [previous[0]]
+            table.append(previous + [entry[0]])
+            if len(table) == 1 << width and width < 12:
+                width += 1
+        out += entry
+        previous = entry
+
+
+def _decode_gif(data):
+    """
+    GIF dosyasını çözer; her karenin ardından tuvalin palet indekslerini döndürür
+    """
+    assert data[:6] == b'GIF89a'
+    width, height, packed = struct.unpack_from('<HHB', data, 6)
+    colors = 2 << (packed & 7)
+    palette = np.frombuffer(data, np.uint8, 3 * colors, 13).reshape(colors, 3)
+    pos = 13 + 3 * colors
+    canvas = np.zeros((height, width), dtype=np.uint8)
+    frames = []
+    while data[pos] != 0x3B:
+        if data[pos] == 0x21:  # Uzantı: alt blokları atla
+            pos += 2
+            while data[pos]:
+                pos += data[pos] + 1
+            pos += 1
+            continue
+        assert data[pos] == 0x2C
+        x, y, w, h = struct.unpack_from('<HHHH', data, pos + 1)
+        code_size = data[pos + 10]
+        pos += 11
+        stream = bytearray()
+        while data[pos]:
+            stream += data[pos + 1:pos + 1 + data[pos]]
+            pos += data[pos] + 1
+        pos += 1
+        pixels = _lzw_decode(stream, code_size)
+        assert len(pixels) == w * h
+        canvas[y:y + h, x:x + w] = np.array(pixels, dtype=np.uint8).reshape(h, w)
+        frames.append(canvas.copy())
+    return palette, frames
+
+
+@pytest.mark.parametrize('width,height', [(1, 1), (7, 3), (126, 1), (127, 2), (40, 33)])
+def test_gif_frames_round_trip(tmp_path, width, height):
+    rng = np.random.default_rng(width * height)
+    palette = rng.integers(0, 256, size=(128, 3), dtype=np.uint8)
+    frames = [rng.integers(0, 128, size=(height, width), dtype=np.uint8)]
+    for _ in range(5):
+        frame = frames[-1].copy()
+        # Küçük bir dikdörtgen değişir (sadece o bölge yazılır) veya hiçbir şey değişmez
+        y, x = rng.integers(height), rng.integers(width)
+        frame[y:y + 2, x:x + 3] = rng.integers(0, 128)
+        frames.append(frame)
+    frames.append(frames[-1].copy())
+    frames.append(np.full((height, width), 127, dtype=np.uint8))
+
+    path = tmp_path / 'out.gif'
+    with GifWriter(str(path), width, height, palette) as writer:
+        for frame in frames:
+            writer.add_frame(frame)
+
+    decoded_palette, decoded = _decode_gif(path.read_bytes())
+    np.testing.assert_array_equal(decoded_palette, palette)
+    assert len(decoded) == len(frames)
+    for expected, actual in zip(frames, decoded):
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_gif_palette_limit(tmp_path):
+    with pytest.raises(ValueError):
+        GifWriter(str(tmp_path / 'out.gif'), 4, 4, np.zeros((129, 3), dtype=np.uint8))
+
+
+def test_png_round_trip(tmp_path):
+    image = np.random.default_rng(0).integers(0, 256, size=(5, 7, 3), dtype=np.uint8)
+    path = tmp_path / 'frame.png'
+    write_png(str(path), image)
+    data = path.read_bytes()
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    width, height = struct.unpack_from('>II', data, 16)
+    assert (width, height) == (7, 5)
+    idat = data.index(b'IDAT')
+    length = struct.unpack_from('>I', data, idat - 4)[0]
+    raw = np.frombuffer(zlib.decompress(data[idat + 4:idat + 4 + length]), dtype=np.uint8)
+    rows = raw.reshape(5, 7 * 3 + 1)
+    assert (rows[:, 0] == 0).all()
+    np.testing.assert_array_equal(rows[:, 1:].reshape(5, 7, 3), image)
+
+
+def test_recorded_gif_matches_rgb_renderer(tmp_path):
+    game_state = GameState(seed=1)
+    renderer = NumpyRenderer(cell_size=4)
+    expected = []
+    with EpisodeRecorder(str(tmp_path / 'episode.gif'), cell_size=4) as recorder:
+        for direction in (DIRECTIONS[3], DIRECTIONS[0], DIRECTIONS[2], DIRECTIONS[2]):
+            recorder.capture(game_state)
+            expected.append(renderer.render_game_state(game_state).copy())
+            game_state.change_direction(direction)
+            game_state.update()
+    assert recorder.frames == len(expected)
+
+    palette, frames = _decode_gif((tmp_path / 'episode.gif').read_bytes())
+    for rgb, indices in zip(expected, frames):
+        np.testing.assert_array_equal(palette[indices], rgb)
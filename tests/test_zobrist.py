@@ -0,0 +1,68 @@
+import random
+from src.game.game_state import GameState
+from src.game.snake import DIRECTIONS
+from src.game.zobrist import ZOBRIST
+
+
+def _play(seed, steps=400):
+    """
+    Rastgele yönlerle oynanan oyunun her adımındaki durumları üretir
+    """
+    rng = random.Random(seed)
+    game_state = GameState(seed=seed)
+    for _ in range(steps):
+        head = game_state.snake.get_head()
+        food = game_state.food.position
+        # Yeme yaklaşan hamleler daha olası: yılan uzar ve grow() yolları da denenir
+        if rng.random() < 0.7:
+            dx, dy = food[0] - head[0], food[1] - head[1]
+            direction = DIRECTIONS[(2 if dx < 0 else 3) if dx and (not dy or rng.random() < 0.5)
+                                   else (0 if dy < 0 else 1)]
+        else:
+            direction = rng.choice(DIRECTIONS)
+        game_state.change_direction(direction)
+        yield game_state
+        if not game_state.update():
+            return
+        yield game_state
+
+
+def test_incremental_key_matches_full_recompute():
+    eaten = 0
+    for seed in range(30):
+        for game_state in _play(seed):
+            assert game_state.key() == ZOBRIST.hash(game_state)
+        eaten += game_state.score
+    assert eaten > 30  # Büyüme yolları gerçekten denendi
+
+
+def test_clone_and_restore_keep_key():
+    for game_state in _play(3, steps=60):
+        clone = game_state.clone()
+        assert clone.key() == game_state.key() == ZOBRIST.hash(clone)
+        restored = GameState.from_snapshot(game_state.snapshot())
+        assert restored.key() == game_state.key() == ZOBRIST.hash(restored)
+
+
+def _moves(game_state, names):
+    for name in names:
+        game_state.change_direction({'U': DIRECTIONS[0], 'D': DIRECTIONS[1],
+                                     'L': DIRECTIONS[2], 'R': DIRECTIONS[3]}[name])
+        assert game_state.update()
+
+
+def test_transpositions_share_a_key():
+    # Farklı yollardan aynı gövdeye, yöne ve yeme varan iki oyun aynı anahtarı taşır
+    a, b = GameState(seed=0), GameState(seed=0)
+    a.food.set_position((0, 0))
+    b.food.set_position((0, 0))
+    _moves(a, 'URR')
+    _moves(b, 'UULDRRR')
+    assert list(a.snake.body) == list(b.snake.body) and a.score == b.score == 0
+    assert a.key() == b.key()
+
+    # Yön ve yem anahtara dahildir
+    b.change_direction(DIRECTIONS[0])
+    assert b.key() != a.key() and b.key() == ZOBRIST.hash(b)
+    a.food.set_position((1, 0))
+    assert a.key() != ZOBRIST.hash(b) and a.key() == ZOBRIST.hash(a)
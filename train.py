@@ -0,0 +1,97 @@
+import argparse
+
+
+def parse_args():
+    """
+    Komut satırı argümanlarını okur
+    """
+    parser = argparse.ArgumentParser(description="Snake AI'ı ekran açmadan eğitir")
+    parser.add_argument("--episodes", type=int, default=1000,
+                        help="Eğitilecek episode sayısı")
+    parser.add_argument("--log-every", type=int, default=100,
+                        help="Kaç episode'da bir özet yazılacağı")
+    parser.add_argument("--num-envs", type=int, default=1,
+                        help="1'den büyükse oyunlar VecSnakeEnv ile toplu oynatılır")
+    parser.add_argument("--actors", type=int, default=0,
+                        help="0'dan büyükse oyunlar bu kadar aktör sürecinde oynatılır")
+    parser.add_argument("--rays", action="store_true",
+                        help="Durum vektörüne duvar/engel uzaklığı ışınlarını ekler")
+    parser.add_argument("--observation", choices=["features", "grid"], default="features",
+                        help="features: özellik vektörü + MLP, grid: (H, W, 3) grid gözlemi + CNN")
+    parser.add_argument("--action-mode", choices=["absolute", "relative"], default="absolute",
+                        help="absolute: 4 mutlak yön, relative: düz/sağ/sol (3 çıkışlı ağ)")
+    parser.add_argument("--memory-size", type=int, default=10000,
+                        help="Deneyim belleğinin kapasitesi")
+    parser.add_argument("--memory-dir", default=None,
+                        help="Verilirse deneyim belleği bu dizinde disk üzerinde tutulur")
+    parser.add_argument("--checkpoint-dir", default=None,
+                        help="Kontrol noktalarının yazılacağı dizin")
+    parser.add_argument("--checkpoint-every", type=int, default=100,
+                        help="Kaç episode'da bir kontrol noktası yazılacağı (--checkpoint-dir ile)")
+    parser.add_argument("--no-checkpoint-memory", action="store_true",
+                        help="Kontrol noktalarına ReplayMemory içeriğini yazmaz")
+    parser.add_argument("--resume", action="store_true",
+                        help="--checkpoint-dir'deki en son kontrol noktasından devam eder")
+    parser.add_argument("--record", default=None,
+                        help="Oynanan her geçişin ekleneceği episode kaydı")
+    parser.add_argument("--offline", nargs="+", default=None,
+                        help="Ortam çalıştırmadan bu episode kayıtlarından eğitir")
+    parser.add_argument("--epochs", type=int, default=1,
+                        help="--offline ile kayıtların üzerinden kaç kez geçileceği")
+    parser.add_argument("--video-dir", default=None,
+                        help="Kaydedilen episode videolarının yazılacağı dizin")
+    parser.add_argument("--video-every", type=int, default=0,
+                        help="Kaç episode'da bir oyunun videoya kaydedileceği (--video-dir ile)")
+    parser.add_argument("--video-format", choices=["gif", "png"], default="gif",
+                        help="gif: animasyonlu GIF, png: episode başına PNG kare dizini")
+    parser.add_argument("--prefill", type=int, default=0,
+                        help="Eğitimden önce belleğe eklenecek betik ajan geçişi sayısı")
+    parser.add_argument("--prefill-agent", choices=["bfs", "hamiltonian"], default="bfs",
+                        help="Gösterimleri üreten betik ajan")
+    return parser.parse_args()
+
+
+def main():
+    """
+    Pencere açmadan (headless) eğitimi başlatan fonksiyon
+    """
+    args = parse_args()
+
+    # Aktör süreçleri bu modülü yeniden yükler; TensorFlow sadece ana süreçte yüklensin
+    from src.ai.trainer import Trainer
+
+    if args.resume and args.checkpoint_dir is None:
+        raise SystemExit("--resume için --checkpoint-dir gerekli")
+
+    trainer = Trainer(episodes=args.episodes, rays=args.rays, action_mode=args.action_mode,
+                      checkpoint_dir=args.checkpoint_dir, checkpoint_every=args.checkpoint_every,
+                      checkpoint_memory=not args.no_checkpoint_memory,
+                      memory_size=args.memory_size, memory_dir=args.memory_dir,
+                      record_path=args.record, observation=args.observation,
+                      video_dir=args.video_dir, video_every=args.video_every,
+                      video_format=args.video_format)
+    if args.resume:
+        print(f"Devam ediliyor: {trainer.load_checkpoint()} ({len(trainer.scores)} episode)")
+    elif args.prefill > 0:
+        scores, wins = trainer.prefill(args.prefill, agent=args.prefill_agent)
+        mean_score = sum(scores) / len(scores) if scores else 0.0
+        print(f"Belleğe {args.prefill} gösterim eklendi ({len(scores)} episode, "
+              f"ortalama skor {mean_score:.1f}, {wins} kazanılan)")
+    try:
+        if args.offline:
+            trainer.train_offline(args.offline, epochs=args.epochs, log_every=args.log_every)
+            if args.checkpoint_dir is not None:
+                print(f"Kontrol noktası yazıldı: {trainer.save_checkpoint()}")
+        elif args.actors > 0:
+            trainer.train_parallel(num_actors=args.actors, log_every=args.log_every)
+        elif args.num_envs > 1:
+            trainer.train_vectorized(num_envs=args.num_envs, log_every=args.log_every)
+        else:
+            trainer.train_headless(log_every=args.log_every)
+    finally:
+        trainer.close()
+    print("Eğitim tamamlandı!")
+
+
+if __name__ == "__main__":
+    main()